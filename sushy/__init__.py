@@ -23,6 +23,7 @@ from sushy.resources.fabric.constants import *  # noqa
 from sushy.resources.manager.constants import *  # noqa
 from sushy.resources.system.constants import *  # noqa
 from sushy.resources.system.storage.constants import *  # noqa
+from sushy.resources.telemetryservice.constants import *  # noqa
 from sushy.resources.updateservice.constants import *  # noqa
 
 __all__ = ('Sushy',)
@@ -13,12 +13,26 @@
 # Sushy Redfish Authentication Modes
 
 import abc
+from http import client as http_client
 import logging
+import threading
+import time
+import weakref
 
 from sushy import exceptions
+from sushy import session_store
 
 LOG = logging.getLogger(__name__)
 
+SESSION_EXPIRY_MARGIN = 0.1
+"""Fraction of the session timeout a session is refreshed ahead of expiry"""
+
+KEEPALIVE_IDLE_FRACTION = 0.5
+"""Fraction of the session timeout of idling after which keepalives go"""
+
+DEFAULT_KEEPALIVE_INTERVAL = 60
+"""Keepalive check interval in seconds when the session timeout is unknown"""
+
 
 class AuthBase(object, metaclass=abc.ABCMeta):
 
@@ -33,6 +47,9 @@ class AuthBase(object, metaclass=abc.ABCMeta):
         self._password = password
         self._root_resource = None
         self._connector = None
+        self._deferred = False
+        self._deferring = False
+        self._deferred_lock = threading.RLock()
 
     def set_context(self, root_resource, connector):
         """Set the context of the authentication object.
@@ -66,6 +83,40 @@ class AuthBase(object, metaclass=abc.ABCMeta):
     def can_refresh_session(self):
         """Method to assert if session based refresh can be done."""
 
+    def defer_authentication(self):
+        """Authenticate on the first request instead of right away.
+
+        Concurrent first requests wait for one authentication. A failing
+        authentication is tried again on the next request.
+
+        :raises: RuntimeError
+        """
+        if self._root_resource is None or self._connector is None:
+            raise RuntimeError('_root_resource / _connector is missing. '
+                               'Forgot to call set_context()?')
+        self._deferred = True
+
+    def check_session(self):
+        """Called by the connector before each request.
+
+        Gives the authentication mechanism a chance to act on its session
+        ahead of the request, e.g. to run a deferred authentication.
+        """
+        if self._deferred:
+            self._authenticate_deferred()
+
+    def _authenticate_deferred(self):
+        with self._deferred_lock:
+            # NOTE: re-entered by the requests of the authentication
+            if not self._deferred or self._deferring:
+                return
+            self._deferring = True
+            try:
+                self.authenticate()
+                self._deferred = False
+            finally:
+                self._deferring = False
+
     def close(self):
         """Shutdown Redfish authentication object
 
@@ -112,17 +163,36 @@ class SessionAuth(AuthBase):
        This is a class used to encapsulate a redfish session.
     """
 
-    def __init__(self, username=None, password=None):
+    def __init__(self, username=None, password=None, session_store=None,
+                 keepalive=False):
         """A class representing a Session Authentication object.
 
         :param username: User account with admin/server-profile access
              privilege.
         :param password: User account password.
+        :param session_store: Optional `SessionStoreBase` instance. The
+             session stored for the BMC and user is then reused instead of
+             creating a new one, the session being validated by its first
+             use. New sessions are stored, and not deleted on `close`.
+        :param keepalive: Whether to keep the session alive while idle, by
+             getting the session resource from a background thread.
         """
         self._session_key = None
         """Our Sessions Key"""
         self._session_resource_id = None
         """Our Sessions Unique Resource ID or URL"""
+        self._session_store = session_store
+        """Our store of the sessions shared between instances"""
+        self._session_generation = 0
+        """Number of times our session got refreshed"""
+        self._refresh_lock = threading.RLock()
+        self._refreshing = False
+        self._session_timeout = None
+        """Idle time in seconds after which the BMC expires our session"""
+        self._last_used = None
+        """Monotonic time our session was last used at"""
+        self._keepalive = keepalive
+        self._keepalive_stop = None
 
         super(SessionAuth, self).__init__(username,
                                           password)
@@ -141,6 +211,15 @@ class SessionAuth(AuthBase):
         """
         return self._session_resource_id
 
+    @property
+    def session_generation(self):
+        """Number of times the session got refreshed.
+
+        Pass it to `refresh_session` to refresh the session only if no one
+        else did since.
+        """
+        return self._session_generation
+
     def _do_authenticate(self):
         """Establish a redfish session.
 
@@ -149,40 +228,175 @@ class SessionAuth(AuthBase):
         :raises: AccessError
         :raises: HTTPError
         """
+        if self._load_stored_session():
+            return
+
         session_service = self._root_resource.get_session_service()
         session_auth_token, session_uri = (
             session_service.create_session(self._username,
                                            self._password))
-        self._session_key = session_auth_token
-        self._session_resource_id = session_uri
-        self._connector.set_http_session_auth(session_auth_token)
+        self._use_session(session_auth_token, session_uri,
+                          session_service.session_timeout)
+
+        if self._session_store is not None:
+            self._session_store.set(self._session_store_key(),
+                                    session_auth_token, session_uri,
+                                    timeout=self._session_timeout)
+
+    def _use_session(self, token, uri, timeout):
+        """Authenticate the requests with a session.
+
+        :param token: The X-Auth-Token of the session.
+        :param uri: The URI of the session resource.
+        :param timeout: The session timeout of the BMC, or None.
+        """
+        self._session_key = token
+        self._session_resource_id = uri
+        self._connector.set_http_session_auth(token)
+
+        if isinstance(timeout, (int, float)) and timeout > 0:
+            self._session_timeout = timeout
+        self._last_used = time.monotonic()
+        if self._keepalive and self._keepalive_stop is None:
+            self._start_keepalive()
+
+    def _session_store_key(self):
+        return session_store.make_key(self._connector._url, self._username)
+
+    def _load_stored_session(self):
+        """Reuse the stored session, if any.
+
+        The session is not validated here, an expired session fails the
+        next request which then refreshes it.
+
+        :returns: True if a stored session is reused, False otherwise.
+        """
+        if self._session_store is None:
+            return False
+
+        entry = self._session_store.get(self._session_store_key())
+        if not entry:
+            return False
+
+        LOG.debug('Reusing the stored session %(session)s',
+                  {'session': entry['uri']})
+        self._use_session(entry['token'], entry['uri'],
+                          entry.get('timeout'))
+        return True
 
     def can_refresh_session(self):
         """Method to assert if session based refresh can be done."""
         return (self._session_key is not None and
                 self._session_resource_id is not None)
 
-    def refresh_session(self):
+    def check_session(self):
+        """Refresh the session if it is about to expire.
+
+        The BMC expires sessions left idle for the session timeout of its
+        SessionService. A session idle for nearly that long is refreshed
+        ahead of the request, sparing a failing request and its retry.
+        """
+        super(SessionAuth, self).check_session()
+        now = time.monotonic()
+        timeout = self._session_timeout
+        last_used = self._last_used
+        self._last_used = now
+        if (timeout is None or last_used is None or
+                now - last_used < timeout * (1 - SESSION_EXPIRY_MARGIN) or
+                not self.can_refresh_session()):
+            return
+
+        LOG.debug('Session idle for %(idle).1f seconds out of %(timeout)s, '
+                  'refreshing it', {'idle': now - last_used,
+                                    'timeout': timeout})
+        self.refresh_session(self._session_generation)
+
+    def _start_keepalive(self):
+        self._keepalive_stop = threading.Event()
+        # NOTE: the thread must not keep us, and our root resource, alive
+        thread = threading.Thread(target=_keepalive_loop,
+                                  args=(weakref.ref(self),
+                                        self._keepalive_stop),
+                                  name='sushy-session-keepalive')
+        thread.daemon = True
+        thread.start()
+
+    def _stop_keepalive(self):
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
+
+    def _send_keepalive(self):
+        """Get the session resource if the session idles for long.
+
+        :returns: The number of seconds to wait before the next check.
+        """
+        timeout = self._session_timeout
+        if timeout is None:
+            return DEFAULT_KEEPALIVE_INTERVAL
+
+        idle = time.monotonic() - (self._last_used or 0)
+        if (idle >= timeout * KEEPALIVE_IDLE_FRACTION and
+                self.can_refresh_session()):
+            try:
+                self._connector.get(self._session_resource_id)
+            except exceptions.SushyError as exc:
+                LOG.debug('Session keepalive failed: %(exception)s',
+                          {'exception': exc})
+        return max(1, timeout * KEEPALIVE_IDLE_FRACTION / 2)
+
+    def refresh_session(self, generation=None):
         """Method to refresh a session to a Redfish controller.
 
         This method is called to create a new session after
         a session that has already been established
-        has timed-out or expired.
+        has timed-out or expired. Concurrent refreshes are serialized, and
+        the current session is kept until a new one is established.
 
+        :param generation: The `session_generation` the caller saw failing.
+            If the session got refreshed since, e.g. by another thread
+            hitting the same expiry, it is not refreshed again.
         :raises: MissingXAuthToken
         :raises: ConnectionError
         :raises: AccessError
         :raises: HTTPError
         """
-        self.reset_session_attrs()
-        self._do_authenticate()
+        with self._refresh_lock:
+            # NOTE: re-entered by a request of the refresh failing itself
+            if self._refreshing:
+                return
+            if (generation is not None and
+                    generation != self._session_generation):
+                LOG.debug('Session already refreshed, not refreshing it '
+                          'again')
+                return
+
+            if self._session_store is not None:
+                # NOTE: keep the session if another instance refreshed it
+                self._session_store.delete(self._session_store_key(),
+                                           token=self._session_key)
+            self._refreshing = True
+            try:
+                self._do_authenticate()
+            except Exception:
+                self.reset_session_attrs()
+                raise
+            finally:
+                self._refreshing = False
+            self._session_generation += 1
 
     def close(self):
         """Close the Redfish Session.
 
         Attempts to close an established RedfishSession by
-        deleting it from the remote Redfish controller.
+        deleting it from the remote Redfish controller. Sessions kept in
+        a session store are left open for reuse.
         """
+        self._stop_keepalive()
+        if self._session_store is not None:
+            self.reset_session_attrs()
+            return
+
         if self._session_resource_id is not None:
             try:
                 self._connector.delete(self._session_resource_id)
@@ -201,11 +415,42 @@ class SessionAuth(AuthBase):
         self._session_resource_id = None
 
 
+_SESSIONS_UNSUPPORTED_CODES = frozenset([http_client.NOT_FOUND,
+                                         http_client.METHOD_NOT_ALLOWED,
+                                         http_client.NOT_IMPLEMENTED])
+
+
+def _sessions_unsupported(error):
+    """Whether an error establishing a session tells sessions never work"""
+    if isinstance(error, exceptions.MissingAttributeError):
+        # NOTE: no SessionService, or no Sessions in it
+        return True
+    return (isinstance(error, exceptions.HTTPError) and
+            error.status_code in _SESSIONS_UNSUPPORTED_CODES)
+
+
 class SessionOrBasicAuth(SessionAuth):
 
-    def __init__(self, username=None, password=None):
-        super(SessionOrBasicAuth, self).__init__(username, password)
+    def __init__(self, username=None, password=None, session_store=None,
+                 keepalive=False, auth_method_memo=None):
+        """A class representing a Session or Basic Authentication object.
+
+        :param username: User account with admin/server-profile access
+             privilege.
+        :param password: User account password.
+        :param session_store: Optional `SessionStoreBase` instance, see
+             `SessionAuth`.
+        :param keepalive: Whether to keep the session alive while idle.
+        :param auth_method_memo: Optional `AuthMethodMemo` instance. The
+             BMCs not supporting sessions are then remembered, and go
+             straight to basic authentication until the memo expires.
+             Other failures, e.g. a refused password or a server error,
+             are not remembered.
+        """
+        super(SessionOrBasicAuth, self).__init__(username, password,
+                                                 session_store, keepalive)
         self.basic_auth = BasicAuth(username=username, password=password)
+        self._auth_method_memo = auth_method_memo
 
     def _do_authenticate(self):
         """Establish a RedfishSession.
@@ -213,6 +458,14 @@ class SessionOrBasicAuth(SessionAuth):
         We will attempt to establish a redfish session. If we are unable
         to establish one, fallback to basic authentication.
         """
+        memo = self._auth_method_memo
+        if (memo is not None and memo.get(self._connector._url) ==
+                session_store.AUTH_METHOD_BASIC):
+            LOG.debug('Sessions are known not to work with %(url)s, using '
+                      'basic authentication', {'url': self._connector._url})
+            self._do_basic_authenticate()
+            return
+
         try:
             # Attempt session based authentication
             super(SessionOrBasicAuth, self)._do_authenticate()
@@ -223,11 +476,21 @@ class SessionOrBasicAuth(SessionAuth):
                       {'exception': e})
 
             # Fall back to basic authentication
-            self.reset_session_attrs()
-            self.basic_auth.set_context(self._root_resource, self._connector)
-            self.basic_auth.authenticate()
+            self._do_basic_authenticate()
+            if memo is not None and _sessions_unsupported(e):
+                memo.set(self._connector._url,
+                         session_store.AUTH_METHOD_BASIC)
+        else:
+            if memo is not None:
+                memo.set(self._connector._url,
+                         session_store.AUTH_METHOD_SESSION)
+
+    def _do_basic_authenticate(self):
+        self.reset_session_attrs()
+        self.basic_auth.set_context(self._root_resource, self._connector)
+        self.basic_auth.authenticate()
 
-    def refresh_session(self):
+    def refresh_session(self, generation=None):
         """Method to refresh a session to a Redfish controller.
 
         This method is called to create a new RedfishSession
@@ -235,6 +498,19 @@ class SessionOrBasicAuth(SessionAuth):
         the previous session has timed-out or expired.
         If we did not previously have an established session,
         we simply return our BasicAuthentication requests.Session.
+
+        :param generation: The `session_generation` the caller saw failing.
         """
         if self.can_refresh_session():
-            super(SessionOrBasicAuth, self).refresh_session()
+            super(SessionOrBasicAuth, self).refresh_session(generation)
+
+
+def _keepalive_loop(auth_ref, stop):
+    """Keep the session of an authentication object alive until stopped."""
+    delay = 0
+    while not stop.wait(delay):
+        auth = auth_ref()
+        if auth is None:
+            break
+        delay = auth._send_keepalive()
+        del auth
@@ -20,11 +20,22 @@ import requests
 import time
 
 from sushy import exceptions
+from sushy import tracing
 from sushy.resources.task_monitor import TaskMonitor
 
 LOG = logging.getLogger(__name__)
 
 
+def _response_size(response, stream=False):
+    """Size of a response body, without consuming streamed bodies."""
+    length = response.headers.get('Content-Length')
+    if length is not None and length.isdigit():
+        return int(length)
+    if stream:
+        return None
+    return len(response.content or b'')
+
+
 class Connector(object):
 
     def __init__(self, url, username=None, password=None, verify=True):
@@ -32,6 +43,10 @@ class Connector(object):
         self._verify = verify
         self._session = requests.Session()
         self._session.verify = self._verify
+        self._auth = None
+        self._recorder = None
+        self._metrics = None
+        self._write_through = False
 
         # NOTE(etingof): field studies reveal that some BMCs choke at
         # long-running persistent HTTP connections (or TCP connections).
@@ -50,6 +65,41 @@ class Connector(object):
         """Sets the authentication mechanism for our connector."""
         self._auth = auth
 
+    def set_recorder(self, recorder):
+        """Sets the recorder of the requests of our connector.
+
+        :param recorder: An object with a ``record(method, url, headers,
+            data, response, elapsed, stream=False)`` method, called for
+            every HTTP request made, or None to stop recording. The body
+            of the response must not be read when ``stream`` is True.
+        """
+        self._recorder = recorder
+
+    def set_metrics(self, metrics):
+        """Sets the metrics collector of our connector.
+
+        :param metrics: A `sushy.metrics.MetricsBase` instance, or None
+            to stop collecting metrics.
+        """
+        self._metrics = metrics
+
+    @property
+    def write_through(self):
+        """Whether resources merge the data they PATCH into their own"""
+        return self._write_through
+
+    def set_write_through(self, enabled):
+        """Sets whether resources update themselves after PATCH requests.
+
+        By default, resources are marked as stale after a PATCH request,
+        unless the BMC returns their updated representation. With
+        write-through, the data written is merged into theirs instead,
+        sparing the next GET request.
+
+        :param enabled: Whether to enable write-through.
+        """
+        self._write_through = enabled
+
     def set_http_basic_auth(self, username, password):
         """Sets the http basic authentication information."""
         self._session.auth = (username, password)
@@ -63,6 +113,51 @@ class Connector(object):
         """Close this connector and the associated HTTP session."""
         self._session.close()
 
+    def _send(self, method, url, data=None, headers=None,
+              **extra_session_req_kwargs):
+        """Send a single HTTP request over the session.
+
+        :returns: The response object from the requests library.
+        :raises: requests.ConnectionError
+        """
+        return self._session.request(method, url, json=data, headers=headers,
+                                     **extra_session_req_kwargs)
+
+    def _request(self, method, url, data=None, headers=None,
+                 **extra_session_req_kwargs):
+        """Make a single HTTP request, feeding the recorder if any.
+
+        The metrics collector, if any, is fed as well, and the request is
+        traced when a tracer is set.
+
+        :returns: The response object from the requests library.
+        :raises: requests.ConnectionError
+        """
+        with tracing.start_span('HTTP %s' % method,
+                                {'http.method': method,
+                                 'http.url': url}) as span:
+            started = time.monotonic()
+            try:
+                response = self._send(method, url, data=data,
+                                      headers=headers,
+                                      **extra_session_req_kwargs)
+            except requests.ConnectionError:
+                if self._metrics is not None:
+                    self._metrics.request(method, url, None,
+                                          time.monotonic() - started, None)
+                raise
+            elapsed = time.monotonic() - started
+            if span is not None:
+                span.set_attribute('http.status_code', response.status_code)
+        stream = bool(extra_session_req_kwargs.get('stream'))
+        if self._recorder is not None:
+            self._recorder.record(method, url, headers, data, response,
+                                  elapsed, stream=stream)
+        if self._metrics is not None:
+            self._metrics.request(method, url, response.status_code, elapsed,
+                                  _response_size(response, stream))
+        return response
+
     def _op(self, method, path='', data=None, headers=None, blocking=False,
             timeout=60, **extra_session_req_kwargs):
         """Generic RESTful request handler.
@@ -94,10 +189,16 @@ class Connector(object):
                   {'method': method, 'url': url, 'headers': headers,
                    'data': data, 'blocking': blocking, 'timeout': timeout,
                    'session': extra_session_req_kwargs})
+        auth = self._auth
+        if auth is not None:
+            auth.check_session()
+        # NOTE: the session this request is made with, so that concurrent
+        # requests failing on the same expired session refresh it once
+        generation = getattr(auth, 'session_generation', None)
         try:
-            response = self._session.request(method, url, json=data,
-                                             headers=headers,
-                                             **extra_session_req_kwargs)
+            response = self._request(method, url, data=data,
+                                     headers=headers,
+                                     **extra_session_req_kwargs)
         except requests.ConnectionError as e:
             raise exceptions.ConnectionError(url=url, error=e)
         # If we received an AccessError, and we
@@ -107,13 +208,18 @@ class Connector(object):
         try:
             exceptions.raise_for_response(method, url, response)
         except exceptions.AccessError:
-            if self._auth.can_refresh_session():
-                self._auth.refresh_session()
+            if auth is not None and auth.can_refresh_session():
+                if generation is None:
+                    auth.refresh_session()
+                else:
+                    auth.refresh_session(generation)
+                if self._metrics is not None:
+                    self._metrics.retry(method, url, 'auth_refresh')
                 LOG.debug("Authentication refreshed successfully, "
                           "retrying the call.")
-                response = self._session.request(method, url, json=data,
-                                                 headers=headers,
-                                                 **extra_session_req_kwargs)
+                response = self._request(method, url, data=data,
+                                         headers=headers,
+                                         **extra_session_req_kwargs)
             else:
                 raise
 
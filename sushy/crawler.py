@@ -0,0 +1,199 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+from concurrent import futures
+import logging
+
+from sushy import exceptions
+
+LOG = logging.getLogger(__name__)
+
+EXPAND_QUERY = '$expand=.($levels=1)'
+"""Query expanding the subordinate resources of a resource in place"""
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of concurrent requests"""
+
+DEFAULT_EXCLUDE_PATHS = ('/redfish/v1/JsonSchemas',
+                         '/redfish/v1/Registries')
+"""Path prefixes not worth crawling for a hardware inventory"""
+
+CrawlRecord = collections.namedtuple(
+    'CrawlRecord', ['path', 'depth', 'resource_type', 'json'])
+"""A crawled resource
+
+`resource_type` is the bare type name of the resource (e.g.
+'ComputerSystem'), `depth` its distance in links from the start resource.
+"""
+
+
+def _normalize(path):
+    return path.rstrip('/') or '/'
+
+
+def _resource_type(doc):
+    odata_type = doc.get('@odata.type')
+    if not odata_type:
+        return None
+    return odata_type.rsplit('.', 1)[-1]
+
+
+class Crawler(object):
+    """Breadth-first crawler of the Redfish resource tree
+
+    Starting from a resource, `@odata.id` links are followed breadth-first
+    with a bounded pool of worker threads, each path being fetched once.
+    Resources are yielded as soon as they arrive, so a full inventory is
+    gathered in a few round-trip times rather than the sum of all the
+    request latencies. Usage:
+
+    .. code-block:: python
+
+      crawler = Crawler(root, types=['ComputerSystem', 'Processor'])
+      for record in crawler:
+          print(record.path, record.json.get('Model'))
+    """
+
+    def __init__(self, resource, max_workers=DEFAULT_MAX_WORKERS,
+                 max_depth=None, types=None, expand=False,
+                 exclude_paths=DEFAULT_EXCLUDE_PATHS):
+        """A class representing a crawl of the Redfish tree
+
+        :param resource: The resource to start from, typically the root
+            `Sushy` object.
+        :param max_workers: The maximum number of concurrent requests.
+        :param max_depth: The maximum distance in links from `resource`
+            to crawl, None for no limit.
+        :param types: An iterable of bare resource type names (e.g.
+            'ComputerSystem') to yield, None to yield all resources. All
+            the resources are still traversed.
+        :param expand: Whether to ask the service to expand subordinate
+            resources in place with the `$expand` query, saving the
+            requests for those it does expand.
+        :param exclude_paths: An iterable of path prefixes not to crawl.
+        """
+        if max_workers < 1:
+            raise ValueError('"max_workers" must be a positive integer')
+
+        self._conn = resource._conn
+        self._start_path = resource.path
+        self._max_workers = max_workers
+        self._max_depth = max_depth
+        self._types = frozenset(types) if types is not None else None
+        self._expand = expand
+        self._exclude_paths = tuple(_normalize(p)
+                                    for p in exclude_paths or ())
+
+        self.errors = {}
+        """Dict of path to the error raised fetching it"""
+
+    def _fetch(self, path):
+        if self._expand:
+            path += ('&' if '?' in path else '?') + EXPAND_QUERY
+        return self._conn.get(path=path).json()
+
+    def _is_excluded(self, path):
+        return any(path == p or path.startswith(p + '/')
+                   for p in self._exclude_paths)
+
+    def _iter_references(self, value, top=False):
+        """Find the links and inline resources of a document
+
+        Yields (path, doc) tuples, `doc` being None for plain links.
+        """
+        if isinstance(value, dict):
+            path = value.get('@odata.id')
+            if not top and isinstance(path, str) and '#' not in path:
+                if self._expand and '@odata.type' in value:
+                    yield path, value
+                    return
+                yield path, None
+
+            for key, item in value.items():
+                if not key.startswith('@odata.'):
+                    for ref in self._iter_references(item):
+                        yield ref
+
+        elif isinstance(value, list):
+            for item in value:
+                for ref in self._iter_references(item):
+                    yield ref
+
+    def _process(self, path, depth, doc, seen, schedule):
+        if self._types is None or _resource_type(doc) in self._types:
+            yield CrawlRecord(path, depth, _resource_type(doc), doc)
+
+        if self._max_depth is not None and depth >= self._max_depth:
+            return
+
+        for ref_path, ref_doc in self._iter_references(doc, top=True):
+            ref_path = _normalize(ref_path)
+            if ref_path in seen or self._is_excluded(ref_path):
+                continue
+
+            seen.add(ref_path)
+            if ref_doc is not None:
+                for record in self._process(ref_path, depth + 1, ref_doc,
+                                            seen, schedule):
+                    yield record
+            else:
+                schedule(ref_path, depth + 1)
+
+    def __iter__(self):
+        return self.crawl()
+
+    def crawl(self):
+        """Crawl the Redfish tree
+
+        Errors fetching single resources are logged and recorded in
+        `errors`, without stopping the crawl.
+
+        :returns: A generator of `CrawlRecord` objects
+        """
+        self.errors = {}
+        start_path = _normalize(self._start_path)
+        seen = {start_path}
+        pending = {}
+
+        with futures.ThreadPoolExecutor(
+                max_workers=self._max_workers) as executor:
+
+            def schedule(path, depth, fetch_path=None):
+                future = executor.submit(self._fetch, fetch_path or path)
+                pending[future] = path, depth
+
+            schedule(start_path, 0, fetch_path=self._start_path)
+
+            try:
+                while pending:
+                    done, _ = futures.wait(
+                        pending, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        path, depth = pending.pop(future)
+                        try:
+                            doc = future.result()
+                        except (exceptions.SushyError, ValueError) as e:
+                            LOG.warning('Failed to crawl %(path)s: %(error)s',
+                                        {'path': path, 'error': e})
+                            self.errors[path] = e
+                            continue
+
+                        for record in self._process(path, depth, doc, seen,
+                                                    schedule):
+                            yield record
+            finally:
+                for future in pending:
+                    future.cancel()
+
+        LOG.debug('Visited %(count)d paths crawling from %(path)s',
+                  {'count': len(seen), 'path': start_path})
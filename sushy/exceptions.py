@@ -72,6 +72,11 @@ class OEMExtensionNotFoundError(SushyError):
     message = 'No %(resource)s OEM extension found by name "%(name)s".'
 
 
+class PowerStateTimeoutError(SushyError):
+    message = ('Timed out after %(timeout)s seconds waiting for %(path)s '
+               'to reach the power state %(states)s, last seen %(state)s')
+
+
 class HTTPError(SushyError):
     """Basic exception for HTTP errors"""
 
@@ -133,6 +138,11 @@ class ResourceNotFoundError(HTTPError):
     message = 'Resource %(url)s not found'
 
 
+class PreconditionFailedError(HTTPError):
+    message = ('Resource %(url)s was changed since read, %(method)s request '
+               'refused')
+
+
 class ServerSideError(HTTPError):
     pass
 
@@ -157,6 +167,8 @@ def raise_for_response(method, url, response):
     elif response.status_code in (http_client.UNAUTHORIZED,
                                   http_client.FORBIDDEN):
         raise AccessError(method, url, response)
+    elif response.status_code == http_client.PRECONDITION_FAILED:
+        raise PreconditionFailedError(method, url, response)
     elif response.status_code >= http_client.INTERNAL_SERVER_ERROR:
         raise ServerSideError(method, url, response)
     else:
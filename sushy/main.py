@@ -15,13 +15,16 @@
 import logging
 import pkg_resources
 import requests
+import threading
 
 from sushy import auth as sushy_auth
 from sushy import connector as sushy_connector
+from sushy import crawler
 from sushy import exceptions
 from sushy.resources import base
 from sushy.resources.chassis import chassis
 from sushy.resources.compositionservice import compositionservice
+from sushy.resources.eventservice import eventservice
 from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
 from sushy.resources.registry import message_registry
@@ -29,6 +32,7 @@ from sushy.resources.registry import message_registry_file
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
+from sushy.resources.telemetryservice import telemetryservice
 from sushy.resources.updateservice import updateservice
 from sushy import utils
 
@@ -36,6 +40,10 @@ LOG = logging.getLogger(__name__)
 
 STANDARD_REGISTRY_PATH = 'standard_registries/'
 
+# NOTE: (base URL, root prefix) -> root service document, for fast starts
+_ROOT_CACHE = {}
+_ROOT_CACHE_LOCK = threading.Lock()
+
 
 class ProtocolFeaturesSupportedField(base.CompositeField):
 
@@ -98,11 +106,18 @@ class Sushy(base.ResourceBase):
     _update_service_path = base.Field(['UpdateService', '@odata.id'])
     """UpdateService path"""
 
+    _event_service_path = base.Field(['EventService', '@odata.id'])
+    """EventService path"""
+
+    _telemetry_service_path = base.Field(['TelemetryService', '@odata.id'])
+    """TelemetryService path"""
+
     def __init__(self, base_url, username=None, password=None,
                  root_prefix='/redfish/v1/', verify=True,
                  auth=None, connector=None,
                  public_connector=None,
-                 language='en'):
+                 language='en', fast_start=False, root_json=None,
+                 write_through=False):
         """A class representing a RootService
 
         :param base_url: The base URL to the Redfish controller. It
@@ -125,6 +140,17 @@ class Sushy(base.ResourceBase):
             on the Internet, e.g., for Message Registries. Defaults to None.
         :param language: RFC 5646 language code for Message Registries.
             Defaults to 'en'.
+        :param fast_start: Whether to skip the round trips of the start:
+            the root service document is then reused from previous
+            instances of the process for the same URL, and authentication
+            is deferred to the first request. Defaults to False.
+        :param root_json: The root service document, in form of Python
+            types, to use instead of getting it, e.g. the `json` of a
+            previous instance. Defaults to None.
+        :param write_through: Whether resources merge the data they
+            PATCH into their own instead of getting themselves again,
+            when the BMC does not return their updated representation.
+            Defaults to False.
         """
         self._root_prefix = root_prefix
         if (auth is not None and (password is not None or
@@ -136,15 +162,29 @@ class Sushy(base.ResourceBase):
             auth = sushy_auth.SessionOrBasicAuth(username=username,
                                                  password=password)
 
+        root_key = (base_url.rstrip('/'), self._root_prefix)
+        if root_json is None and fast_start:
+            with _ROOT_CACHE_LOCK:
+                root_json = _ROOT_CACHE.get(root_key)
+
         super(Sushy, self).__init__(
             connector or sushy_connector.Connector(base_url, verify=verify),
-            path=self._root_prefix)
+            path=self._root_prefix,
+            reader=(base.JsonPreloadedReader(root_json)
+                    if root_json is not None else None))
+        if write_through:
+            self._conn.set_write_through(True)
         self._public_connector = public_connector or requests
         self._language = language
         self._base_url = base_url
         self._auth = auth
         self._auth.set_context(self, self._conn)
-        self._auth.authenticate()
+        if fast_start:
+            with _ROOT_CACHE_LOCK:
+                _ROOT_CACHE[root_key] = self.json
+            self._auth.defer_authentication()
+        else:
+            self._auth.authenticate()
 
     def __del__(self):
         if self._auth:
@@ -344,6 +384,47 @@ class Sushy(base.ResourceBase):
             redfish_version=self.redfish_version,
             registries=self.registries)
 
+    def get_event_service(self):
+        """Get the EventService object
+
+        :raises: MissingAttributeError, if the EventService attribute
+            is not found
+        :returns: The EventService object
+        """
+        if not self._event_service_path:
+            raise exceptions.MissingAttributeError(
+                attribute='EventService/@odata.id', resource=self._path)
+
+        return eventservice.EventService(
+            self._conn, self._event_service_path,
+            redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    def get_telemetry_service(self):
+        """Get the TelemetryService object
+
+        :raises: MissingAttributeError, if the TelemetryService attribute
+            is not found
+        :returns: The TelemetryService object
+        """
+        if not self._telemetry_service_path:
+            raise exceptions.MissingAttributeError(
+                attribute='TelemetryService/@odata.id', resource=self._path)
+
+        return telemetryservice.TelemetryService(
+            self._conn, self._telemetry_service_path,
+            redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    def crawl(self, **kwargs):
+        """Crawl the Redfish tree breadth-first from the service root
+
+        :param kwargs: Arguments for :py:class:`sushy.crawler.Crawler`,
+            e.g. `max_workers`, `max_depth`, `types` or `expand`.
+        :returns: A generator of `CrawlRecord` objects
+        """
+        return crawler.Crawler(self, **kwargs).crawl()
+
     def _get_registry_collection(self):
         """Get MessageRegistryFileCollection object
 
@@ -0,0 +1,210 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import bisect
+import collections
+import threading
+from urllib import parse as urlparse
+
+ID_PLACEHOLDER = '{id}'
+"""Replacement of the resource identifiers of templated paths"""
+
+COLLECTION_SEGMENTS = frozenset([
+    'Chassis', 'Drives', 'Endpoints', 'EthernetInterfaces', 'Fabrics',
+    'FirmwareInventory', 'Managers', 'Memory', 'MetricReportDefinitions',
+    'MetricReports', 'NetworkAdapters', 'PCIeDevices', 'Processors',
+    'Registries', 'ResourceBlocks', 'ResourceZones', 'Sensors', 'Sessions',
+    'SimpleStorage', 'SoftwareInventory', 'Storage', 'Subscriptions',
+    'Systems', 'Tasks', 'VirtualMedia', 'Volumes',
+])
+"""Path segments of collections, the next segment being a member ID"""
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0, 30.0)
+"""Default upper bounds in seconds of the request latency histogram"""
+
+ERROR_STATUS = 'error'
+"""Status label of the requests failing without response"""
+
+
+def template_path(path):
+    """Collapse the resource identifiers of a path
+
+    The segments following a collection segment, and the ones carrying
+    digits, are replaced with `ID_PLACEHOLDER`, so that requests to all
+    the members of a collection share one metric. The query is dropped.
+
+    :param path: The path, or absolute URL, to template.
+    :returns: The templated path
+    """
+    path = urlparse.urlparse(path).path
+    segments = path.split('/')
+    for i, segment in enumerate(segments):
+        if not segment or segment == 'v1':
+            continue
+        if ((i > 0 and segments[i - 1] in COLLECTION_SEGMENTS) or
+                any(c.isdigit() for c in segment)):
+            segments[i] = ID_PLACEHOLDER
+    return '/'.join(segments)
+
+
+class MetricsBase(object):
+    """Interface of the metrics collectors of a `Connector`
+
+    All the methods do nothing, so collectors only override the ones they
+    are interested in. A connector without collector (the default) skips
+    all metrics work altogether.
+    """
+
+    def request(self, method, url, status, elapsed, response_bytes):
+        """Called for every HTTP request made
+
+        :param method: The HTTP method of the request.
+        :param url: The absolute URL of the request.
+        :param status: The status code of the response, or None if the
+            request failed without response.
+        :param elapsed: The time in seconds the request took.
+        :param response_bytes: The size of the response body, or None if
+            unknown (e.g. streamed responses).
+        """
+
+    def retry(self, method, url, reason):
+        """Called when a request is retried
+
+        :param method: The HTTP method of the request.
+        :param url: The absolute URL of the request.
+        :param reason: Why the request is retried, e.g. 'auth_refresh'.
+        """
+
+
+def _labels(method, url):
+    parsed = urlparse.urlparse(url)
+    return parsed.netloc, method, template_path(parsed.path)
+
+
+def _escape(value):
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _format_labels(names, values):
+    return '{%s}' % ','.join('%s="%s"' % (n, _escape(v))
+                             for n, v in zip(names, values))
+
+
+class PrometheusMetrics(MetricsBase):
+    """Metrics collector rendering the Prometheus text exposition format
+
+    Metrics are labeled by BMC (host and port), method and templated
+    path. Usage:
+
+    .. code-block:: python
+
+      metrics = PrometheusMetrics()
+      conn = connector.Connector(url)
+      conn.set_metrics(metrics)
+      ...
+      print(metrics.render())
+    """
+
+    _LABELS = ('bmc', 'method', 'path')
+
+    def __init__(self, namespace='sushy', buckets=DEFAULT_BUCKETS):
+        """A class representing a Prometheus metrics collector
+
+        :param namespace: The prefix of the metric names.
+        :param buckets: The upper bounds in seconds of the request latency
+            histogram buckets.
+        """
+        self._namespace = namespace
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests = collections.Counter()
+        self._bytes = collections.Counter()
+        self._retries = collections.Counter()
+        self._durations = {}
+
+    def request(self, method, url, status, elapsed, response_bytes):
+        labels = _labels(method, url)
+        status = ERROR_STATUS if status is None else str(status)
+        with self._lock:
+            self._requests[labels + (status,)] += 1
+            if response_bytes:
+                self._bytes[labels] += response_bytes
+            histogram = self._durations.get(labels)
+            if histogram is None:
+                histogram = self._durations[labels] = [
+                    [0] * len(self._buckets), 0.0, 0]
+            index = bisect.bisect_left(self._buckets, elapsed)
+            if index < len(self._buckets):
+                histogram[0][index] += 1
+            histogram[1] += elapsed
+            histogram[2] += 1
+
+    def retry(self, method, url, reason):
+        with self._lock:
+            self._retries[_labels(method, url) + (reason,)] += 1
+
+    def render(self):
+        """Render the metrics in the Prometheus text exposition format
+
+        :returns: The metrics as a string
+        """
+        name = self._namespace + '_'
+        lines = []
+        with self._lock:
+            lines.append('# HELP %srequests_total Number of HTTP requests'
+                         % name)
+            lines.append('# TYPE %srequests_total counter' % name)
+            for labels, value in sorted(self._requests.items()):
+                lines.append('%srequests_total%s %d' % (
+                    name, _format_labels(self._LABELS + ('status',), labels),
+                    value))
+
+            lines.append('# HELP %srequest_duration_seconds HTTP request '
+                         'latency' % name)
+            lines.append('# TYPE %srequest_duration_seconds histogram'
+                         % name)
+            for labels, (counts, total, count) in sorted(
+                    self._durations.items()):
+                cumulative = 0
+                for bound, bucket in zip(self._buckets, counts):
+                    cumulative += bucket
+                    lines.append('%srequest_duration_seconds_bucket%s %d' % (
+                        name, _format_labels(self._LABELS + ('le',),
+                                             labels + (repr(bound),)),
+                        cumulative))
+                lines.append('%srequest_duration_seconds_bucket%s %d' % (
+                    name, _format_labels(self._LABELS + ('le',),
+                                         labels + ('+Inf',)), count))
+                formatted = _format_labels(self._LABELS, labels)
+                lines.append('%srequest_duration_seconds_sum%s %r'
+                             % (name, formatted, total))
+                lines.append('%srequest_duration_seconds_count%s %d'
+                             % (name, formatted, count))
+
+            lines.append('# HELP %sresponse_bytes_total Size of the HTTP '
+                         'response bodies' % name)
+            lines.append('# TYPE %sresponse_bytes_total counter' % name)
+            for labels, value in sorted(self._bytes.items()):
+                lines.append('%sresponse_bytes_total%s %d' % (
+                    name, _format_labels(self._LABELS, labels), value))
+
+            lines.append('# HELP %sretries_total Number of retried HTTP '
+                         'requests' % name)
+            lines.append('# TYPE %sretries_total counter' % name)
+            for labels, value in sorted(self._retries.items()):
+                lines.append('%sretries_total%s %d' % (
+                    name, _format_labels(self._LABELS + ('reason',), labels),
+                    value))
+
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,239 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Pool of authenticated channels shared between Sushy instances
+
+Sushy instances got from the same pool for the same BMC and credentials
+share one connector and one authentication object, hence one Redfish
+session. The session is closed once the last of them is closed (or
+garbage collected). Usage:
+
+.. code-block:: python
+
+  root = pool.connect('https://bmc', username='foo', password='bar')
+  # shares the session of the first instance
+  other = pool.connect('https://bmc', username='foo', password='bar')
+"""
+
+import hashlib
+import logging
+import threading
+
+from sushy import auth as sushy_auth
+from sushy import connector as sushy_connector
+from sushy import main
+
+LOG = logging.getLogger(__name__)
+
+
+def _make_key(base_url, username, password, verify):
+    digest = hashlib.sha256((password or '').encode('utf-8')).hexdigest()
+    return base_url.rstrip('/'), username, digest, verify
+
+
+class _ChannelRootAuth(sushy_auth.AuthBase):
+    """Authentication of the root of a channel, left to the shared one"""
+
+    def set_context(self, root_resource, connector):
+        # NOTE: the connector keeps the shared authentication object
+        self._root_resource = root_resource
+        self._connector = connector
+
+    def _do_authenticate(self):
+        pass
+
+    def can_refresh_session(self):
+        return False
+
+
+class _PoolEntry(object):
+
+    def __init__(self, key, connector, auth):
+        self.key = key
+        self.connector = connector
+        self.auth = auth
+        self.root = None
+        self.refcount = 0
+        self.authenticated = False
+        self.lock = threading.Lock()
+
+    def attach(self, root_resource):
+        with self.lock:
+            if self.root is None:
+                # NOTE: the shared authentication object gets a root of
+                # the channel, holding none of the leases, so that the
+                # Sushy instances can be garbage collected
+                self.root = main.Sushy(
+                    root_resource._base_url,
+                    root_prefix=root_resource._root_prefix,
+                    auth=_ChannelRootAuth(), connector=self.connector,
+                    public_connector=root_resource._public_connector,
+                    language=root_resource._language,
+                    root_json=root_resource.json)
+                self.auth.set_context(self.root, self.connector)
+
+    def authenticate(self, deferred=False):
+        with self.lock:
+            if not self.authenticated:
+                if deferred:
+                    self.auth.defer_authentication()
+                else:
+                    self.auth.authenticate()
+                self.authenticated = True
+
+
+class PooledAuth(sushy_auth.AuthBase):
+    """Authentication lease on a channel of a `SessionPool`
+
+    Each Sushy instance of the pool gets its own lease, all the leases of
+    a channel delegating to its authentication object. Closing a lease
+    releases it from the pool.
+    """
+
+    def __init__(self, pool, entry):
+        super(PooledAuth, self).__init__()
+        self._pool = pool
+        self._entry = entry
+        self._released = False
+
+    def set_context(self, root_resource, connector):
+        """Set the context of the authentication object.
+
+        The connector keeps the shared authentication object, whose
+        context is a root of the channel built after the first one.
+
+        :param root_resource: Root sushy object
+        :param connector: Connector for http connections
+        """
+        self._root_resource = root_resource
+        self._connector = connector
+        self._entry.attach(root_resource)
+
+    def _do_authenticate(self):
+        """Authenticate the channel, unless already done."""
+        self._entry.authenticate()
+
+    def defer_authentication(self):
+        """Have the channel authenticate on its first request, if needed."""
+        self._entry.authenticate(deferred=True)
+
+    def can_refresh_session(self):
+        """Method to assert if session based refresh can be done."""
+        return self._entry.auth.can_refresh_session()
+
+    def close(self):
+        """Release the lease, closing the channel if it is the last one."""
+        if not self._released:
+            self._released = True
+            self._pool._release(self._entry)
+
+
+class SessionPool(object):
+    """Pool of connectors and authentication objects per BMC and user"""
+
+    def __init__(self, auth_type=sushy_auth.SessionOrBasicAuth,
+                 **auth_kwargs):
+        """A class representing a pool of authenticated channels
+
+        :param auth_type: The `AuthBase` subclass to create the channels
+            with, taking the username and password as first arguments.
+        :param auth_kwargs: Additional arguments of `auth_type`, e.g. a
+            session store.
+        """
+        self._auth_type = auth_type
+        self._auth_kwargs = auth_kwargs
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, base_url, username=None, password=None, verify=True):
+        """Lease the channel to a BMC, creating it if needed
+
+        :param base_url: The base URL to the Redfish controller.
+        :param username: User account with admin/server-profile access
+            privilege
+        :param password: User account password
+        :param verify: The TLS verification of the connector, see `Sushy`.
+        :returns: A tuple of the connector and a `PooledAuth` lease, to
+            pass to `Sushy`
+        """
+        key = _make_key(base_url, username, password, verify)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                LOG.debug('Opening a pooled channel to %(url)s for '
+                          '%(user)s', {'url': base_url, 'user': username})
+                entry = _PoolEntry(
+                    key, sushy_connector.Connector(base_url, verify=verify),
+                    self._auth_type(username, password, **self._auth_kwargs))
+                self._entries[key] = entry
+            entry.refcount += 1
+        return entry.connector, PooledAuth(self, entry)
+
+    def connect(self, base_url, username=None, password=None, verify=True,
+                **kwargs):
+        """Get a Sushy instance sharing the channel to a BMC
+
+        :param base_url: The base URL to the Redfish controller.
+        :param username: User account with admin/server-profile access
+            privilege
+        :param password: User account password
+        :param verify: The TLS verification of the connector, see `Sushy`.
+        :param kwargs: Additional arguments of `Sushy`.
+        :returns: A `Sushy` instance
+        """
+        connector, auth = self.acquire(base_url, username, password, verify)
+        try:
+            return main.Sushy(base_url, auth=auth, connector=connector,
+                              **kwargs)
+        except Exception:
+            auth.close()
+            raise
+
+    def _release(self, entry):
+        with self._lock:
+            entry.refcount -= 1
+            if entry.refcount > 0:
+                return
+            if self._entries.get(entry.key) is entry:
+                del self._entries[entry.key]
+
+        LOG.debug('Closing the pooled channel to %s', entry.key[0])
+        try:
+            entry.auth.close()
+        finally:
+            entry.connector.close()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+_default_pool = None
+_default_pool_lock = threading.Lock()
+
+
+def get_default_pool():
+    """Get the process-wide session pool"""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is None:
+            _default_pool = SessionPool()
+        return _default_pool
+
+
+def connect(base_url, username=None, password=None, verify=True, **kwargs):
+    """Get a Sushy instance sharing the channel of the process-wide pool
+
+    See `SessionPool.connect`.
+    """
+    return get_default_pool().connect(base_url, username, password, verify,
+                                      **kwargs)
@@ -0,0 +1,420 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from urllib import parse as urlparse
+import zipfile
+
+import pbr.version
+import requests
+from requests import structures
+
+from sushy import connector as sushy_connector
+from sushy import exceptions
+
+LOG = logging.getLogger(__name__)
+
+ARCHIVE_VERSION = 1
+"""Version of the recording archive format"""
+
+INDEX_NAME = 'recording.json'
+"""Name of the recording index within the archive"""
+
+REDACTED = '<redacted>'
+"""Replacement of the sensitive values of the recordings"""
+
+SENSITIVE_HEADERS = frozenset(['authorization', 'x-auth-token', 'cookie',
+                               'set-cookie'])
+"""Lowercase names of the headers whose values are redacted"""
+
+SENSITIVE_PROPERTIES = frozenset(['password'])
+"""Lowercase names of the JSON properties whose values are redacted"""
+
+HAR_VERSION = '1.2'
+"""Version of the HTTP Archive format written"""
+
+HAR_EXTENSION = '.har'
+"""Extension of the HTTP Archive files"""
+
+
+def redact_headers(headers):
+    """Copy headers, redacting the values of the sensitive ones
+
+    :param headers: A dict of headers, or None.
+    :returns: A new dict
+    """
+    return {k: REDACTED if k.lower() in SENSITIVE_HEADERS else v
+            for k, v in (headers or {}).items()}
+
+
+def redact_data(data):
+    """Copy JSON data, redacting the values of the sensitive properties
+
+    :param data: JSON data in form of Python types.
+    :returns: A copy of the data
+    """
+    if isinstance(data, dict):
+        return {k: REDACTED if k.lower() in SENSITIVE_PROPERTIES
+                else redact_data(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [redact_data(item) for item in data]
+    return data
+
+
+def _relative_url(url):
+    parsed = urlparse.urlparse(url)
+    if parsed.query:
+        return parsed.path + '?' + parsed.query
+    return parsed.path
+
+
+class ArchiveRecorder(object):
+    """Recorder of request/response pairs into a zip archive
+
+    Each HTTP request made by a connector is recorded with the status,
+    headers, body and elapsed time of its response. Sensitive headers and
+    passwords are redacted. The recordings are kept in memory and written
+    out on :py:meth:`save`. Usage:
+
+    .. code-block:: python
+
+      conn = connector.Connector(url, verify=False)
+      with recorder.ArchiveRecorder('bmc.zip') as rec:
+          conn.set_recorder(rec)
+          root = sushy.Sushy(url, username='foo', password='bar',
+                             connector=conn)
+          root.get_system().power_state
+
+      # later on, offline
+      root = sushy.Sushy(url, username='foo', password='bar',
+                         connector=recorder.ReplayConnector('bmc.zip'))
+    """
+
+    def __init__(self, filename):
+        """A class representing a recording archive being written
+
+        :param filename: The path of the archive to write.
+        """
+        self._filename = filename
+        self._entries = []
+        self._bodies = []
+        self._base_url = None
+        self._lock = threading.Lock()
+
+    def record(self, method, url, headers, data, response, elapsed,
+               stream=False):
+        """Record a request/response pair
+
+        :param method: The HTTP method of the request.
+        :param url: The absolute URL of the request.
+        :param headers: The headers of the request.
+        :param data: The JSON data of the request, or None.
+        :param response: The response object from the requests library.
+        :param elapsed: The time in seconds the request took.
+        :param stream: Whether the response body is streamed, in which
+            case it is not recorded.
+        """
+        entry = {
+            'method': method,
+            'url': _relative_url(url),
+            'request_headers': redact_headers(headers),
+            'request_data': redact_data(data),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': redact_headers(response.headers),
+            'elapsed': elapsed,
+        }
+        with self._lock:
+            if self._base_url is None:
+                parsed = urlparse.urlparse(url)
+                self._base_url = '%s://%s' % (parsed.scheme, parsed.netloc)
+            entry['body'] = 'bodies/%d' % len(self._bodies)
+            if stream:
+                # NOTE: reading the body would consume the stream, e.g. SSE
+                entry['stream'] = True
+                self._bodies.append(b'')
+            else:
+                self._bodies.append(response.content or b'')
+            self._entries.append(entry)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def save(self):
+        """Write the recordings out to the archive"""
+        with self._lock:
+            index = {'version': ARCHIVE_VERSION,
+                     'base_url': self._base_url,
+                     'entries': list(self._entries)}
+            bodies = list(self._bodies)
+
+        with zipfile.ZipFile(self._filename, 'w',
+                             compression=zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(INDEX_NAME, json.dumps(index))
+            for entry, body in zip(index['entries'], bodies):
+                archive.writestr(entry['body'], body)
+
+        LOG.debug('Saved %(count)d recorded requests to %(file)s',
+                  {'count': len(bodies), 'file': self._filename})
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.save()
+
+
+def _har_headers(headers):
+    return [{'name': k, 'value': v}
+            for k, v in redact_headers(headers).items()]
+
+
+def _har_content(response, include_bodies, stream=False):
+    if stream:
+        # NOTE: reading the body would consume the stream, e.g. SSE
+        return {
+            'size': 0,
+            'mimeType': response.headers.get('Content-Type', ''),
+            'comment': 'Streamed body, not recorded',
+        }
+    body = response.content or b''
+    content = {
+        'size': len(body),
+        'mimeType': response.headers.get('Content-Type', ''),
+    }
+    if include_bodies and body:
+        try:
+            content['text'] = json.dumps(redact_data(json.loads(body)))
+        except ValueError:
+            content['text'] = body.decode('utf-8', 'replace')
+    return content
+
+
+def _har_filename(bmc):
+    return bmc.replace(':', '_') + HAR_EXTENSION
+
+
+class HarRecorder(object):
+    """Recorder of the requests into HTTP Archive (HAR) files
+
+    One HAR file is written per BMC (host and port) on :py:meth:`save`,
+    loadable into the usual waterfall viewers. Sensitive headers and
+    passwords are redacted, in requests and responses alike.
+
+    The requests library does not expose the DNS, connect and TLS phases,
+    so these are reported as not applicable (-1). The ``wait`` phase spans
+    from sending the request to receiving the response headers, and the
+    ``receive`` phase the download of the body. Usage:
+
+    .. code-block:: python
+
+      conn = connector.Connector(url, verify=False)
+      with recorder.HarRecorder('/tmp/har') as rec:
+          conn.set_recorder(rec)
+          root = sushy.Sushy(url, username='foo', password='bar',
+                             connector=conn)
+          root.get_system().power_state
+    """
+
+    def __init__(self, directory, include_bodies=True):
+        """A class representing HTTP Archive files being written
+
+        :param directory: The directory to write the HAR files into.
+        :param include_bodies: Whether to include the response bodies.
+        """
+        self._directory = directory
+        self._include_bodies = include_bodies
+        self._entries = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+    def record(self, method, url, headers, data, response, elapsed,
+               stream=False):
+        """Record a request/response pair
+
+        :param method: The HTTP method of the request.
+        :param url: The absolute URL of the request.
+        :param headers: The headers of the request.
+        :param data: The JSON data of the request, or None.
+        :param response: The response object from the requests library.
+        :param elapsed: The time in seconds the request took.
+        :param stream: Whether the response body is streamed, in which
+            case it is not recorded.
+        """
+        started = (datetime.datetime.now(datetime.timezone.utc) -
+                   datetime.timedelta(seconds=elapsed))
+        total = elapsed * 1000
+        wait = min(response.elapsed.total_seconds() * 1000, total)
+        parsed = urlparse.urlparse(url)
+
+        request = {
+            'method': method,
+            'url': url,
+            'httpVersion': 'HTTP/1.1',
+            'cookies': [],
+            'headers': _har_headers(headers),
+            'queryString': [{'name': k, 'value': v} for k, v in
+                            urlparse.parse_qsl(parsed.query,
+                                               keep_blank_values=True)],
+            'headersSize': -1,
+            'bodySize': 0,
+        }
+        if data is not None:
+            text = json.dumps(redact_data(data))
+            request['postData'] = {'mimeType': 'application/json',
+                                   'text': text}
+            request['bodySize'] = len(text.encode('utf-8'))
+
+        content = _har_content(response, self._include_bodies, stream)
+        entry = {
+            'startedDateTime': started.isoformat(),
+            'time': total,
+            'request': request,
+            'response': {
+                'status': response.status_code,
+                'statusText': response.reason or '',
+                'httpVersion': 'HTTP/1.1',
+                'cookies': [],
+                'headers': _har_headers(response.headers),
+                'content': content,
+                'redirectURL': response.headers.get('Location', ''),
+                'headersSize': -1,
+                'bodySize': -1 if stream else content['size'],
+            },
+            'cache': {},
+            'timings': {
+                'blocked': -1,
+                'dns': -1,
+                'connect': -1,
+                'ssl': -1,
+                'send': 0,
+                'wait': wait,
+                'receive': total - wait,
+            },
+        }
+        with self._lock:
+            self._entries[parsed.netloc].append(entry)
+
+    @property
+    def bmcs(self):
+        """The list of BMCs (host and port) requests were recorded for"""
+        with self._lock:
+            return sorted(self._entries)
+
+    def to_har(self, bmc):
+        """Return the recordings of a BMC as a HAR document
+
+        :param bmc: The host and port of the BMC.
+        :returns: A JSON serializable dict
+        """
+        with self._lock:
+            entries = sorted(self._entries.get(bmc, []),
+                             key=lambda e: e['startedDateTime'])
+        return {
+            'log': {
+                'version': HAR_VERSION,
+                'creator': {
+                    'name': 'sushy',
+                    'version': pbr.version.VersionInfo(
+                        'sushy').version_string(),
+                },
+                'entries': entries,
+            }
+        }
+
+    def save(self):
+        """Write out one HAR file per BMC
+
+        :returns: The list of the paths of the files written
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        filenames = []
+        for bmc in self.bmcs:
+            filename = os.path.join(self._directory, _har_filename(bmc))
+            with open(filename, 'w') as f:
+                json.dump(self.to_har(bmc), f, indent=2)
+            filenames.append(filename)
+
+        LOG.debug('Saved HTTP archives of %(count)d BMCs to %(dir)s',
+                  {'count': len(filenames), 'dir': self._directory})
+        return filenames
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.save()
+
+
+class ReplayConnector(sushy_connector.Connector):
+    """Connector serving the recordings of an archive
+
+    Requests are matched on method and path (including the query), and
+    the recorded responses served back in order, the last one being
+    repeated once exhausted. No network access is made.
+    """
+
+    def __init__(self, filename, url=None, latency_scale=0.0):
+        """A class representing a connector replaying recordings
+
+        :param filename: The path of an archive written by
+            `ArchiveRecorder`.
+        :param url: The base URL to serve, defaults to the recorded one.
+        :param latency_scale: Factor applied to the recorded elapsed time
+            to delay each response, 0 for no delay, 1.0 to reproduce the
+            original latencies.
+        """
+        with zipfile.ZipFile(filename) as archive:
+            index = json.loads(archive.read(INDEX_NAME).decode('utf-8'))
+            if index.get('version') != ARCHIVE_VERSION:
+                raise exceptions.ArchiveParsingError(
+                    path=filename,
+                    error='unsupported recording version %s'
+                          % index.get('version'))
+
+            self._recordings = collections.defaultdict(list)
+            for entry in index['entries']:
+                entry['content'] = archive.read(entry['body'])
+                self._recordings[entry['method'], entry['url']].append(entry)
+
+        super(ReplayConnector, self).__init__(url or index['base_url'])
+        self._latency_scale = latency_scale
+        self._positions = collections.Counter()
+        self._lock = threading.Lock()
+
+    def _send(self, method, url, data=None, headers=None,
+              **extra_session_req_kwargs):
+        key = (method, _relative_url(url))
+        with self._lock:
+            entries = self._recordings.get(key)
+            if not entries:
+                raise requests.ConnectionError(
+                    'No recording for %s %s' % key)
+            entry = entries[min(self._positions[key], len(entries) - 1)]
+            self._positions[key] += 1
+
+        if self._latency_scale:
+            time.sleep(entry['elapsed'] * self._latency_scale)
+
+        response = requests.Response()
+        response.status_code = entry['status']
+        response.reason = entry['reason']
+        response.headers = structures.CaseInsensitiveDict(entry['headers'])
+        response._content = entry['content']
+        response.url = url
+        response.encoding = 'utf-8'
+        return response
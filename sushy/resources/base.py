@@ -16,20 +16,42 @@
 import abc
 import collections
 
+import contextlib
 import copy
 import io
 import json
 import logging
 import pkg_resources
+import threading
+import weakref
 import zipfile
 
 from sushy import exceptions
 from sushy.resources import oem
+from sushy import tracing
 from sushy import utils
 
 
 LOG = logging.getLogger(__name__)
 
+# NOTE: connector -> {(resource class, canonical path): resource}, neither
+# the connectors nor the resources being kept alive by the map
+_IDENTITY_MAPS = weakref.WeakKeyDictionary()
+_IDENTITY_MAPS_LOCK = threading.Lock()
+
+PREFER_REPRESENTATION_HEADERS = {'Prefer': 'return=representation'}
+"""Headers asking the BMC to return the resource written to"""
+
+
+def _merge_json(doc, data):
+    """Merge written data into a copy of a JSON document"""
+    merged = dict(doc)
+    for key, value in data.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            value = _merge_json(merged[key], value)
+        merged[key] = copy.deepcopy(value)
+    return merged
+
 
 class Field(object):
     """Definition for fields fetched from JSON."""
@@ -317,6 +339,9 @@ class MappedListField(Field):
 
 class AbstractJsonReader(object, metaclass=abc.ABCMeta):
 
+    etag = None
+    """The ETag of the last document read, if known"""
+
     def set_connection(self, connector, path):
         """Sets mandatory connection parameters
 
@@ -337,9 +362,29 @@ class JsonDataReader(AbstractJsonReader):
     def get_json(self):
         """Gets JSON file from URI directly"""
         data = self._conn.get(path=self._path)
+        self.etag = data.headers.get('ETag')
         return data.json() if data.content else {}
 
 
+class JsonPreloadedReader(JsonDataReader):
+    """Serves a JSON document at hand first, then gets it from the URI"""
+
+    def __init__(self, json_doc):
+        """Initializes the reader
+
+        :param json_doc: The JSON document to serve on the first read, in
+            form of Python types
+        """
+        self._json_doc = json_doc
+
+    def get_json(self):
+        """Gets the preloaded JSON document, or the one from the URI"""
+        json_doc, self._json_doc = self._json_doc, None
+        if json_doc is not None:
+            return json_doc
+        return super(JsonPreloadedReader, self).get_json()
+
+
 class JsonPublicFileReader(AbstractJsonReader):
     """Loads the data from the Internet"""
 
@@ -428,6 +473,9 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
         # Starting off with True and eventually gets set to False when
         # attribute values are fetched.
         self._is_stale = True
+        self._etag = None
+        # NOTE: batches are per thread, the instance may be shared
+        self._batch_state = threading.local()
 
         if reader is None:
             reader = JsonDataReader()
@@ -469,13 +517,18 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
         if not self._is_stale and not force:
             return
 
-        self._json = self._reader.get_json()
+        attributes = {'sushy.resource': self.__class__.__name__,
+                      'sushy.path': self._path}
+        with tracing.start_span('sushy.refresh', attributes):
+            self._json = self._reader.get_json()
+            self._etag = self._reader.etag
 
-        LOG.debug('Received representation of %(type)s %(path)s: %(json)s',
-                  {'type': self.__class__.__name__,
-                   'path': self._path, 'json': self._json})
-        self._parse_attributes(self._json)
-        self._do_refresh(force)
+            LOG.debug('Received representation of %(type)s %(path)s: '
+                      '%(json)s', {'type': self.__class__.__name__,
+                                   'path': self._path, 'json': self._json})
+            with tracing.start_span('sushy.parse', attributes):
+                self._parse_attributes(self._json)
+            self._do_refresh(force)
 
         # Mark it fresh
         self._is_stale = False
@@ -518,6 +571,121 @@ class ResourceBase(object, metaclass=abc.ABCMeta):
         if force_refresh:
             self.refresh()
 
+    def _get_representation(self, response):
+        """The representation of the resource in a write response, if any"""
+        try:
+            doc = response.json() if response.content else None
+        except (AttributeError, ValueError):
+            return None
+        if not isinstance(doc, dict):
+            return None
+        # NOTE: action and error responses are not the resource itself
+        odata_id = doc.get('@odata.id')
+        if not odata_id or odata_id.rstrip('/') != self._path.rstrip('/'):
+            return None
+        return doc
+
+    def _update_after_write(self, response, data=None):
+        """Bring the resource up to date after a successful write to it
+
+        The representation returned by the BMC, if any, is applied in
+        place of a refresh. Otherwise, if the connector is set up for
+        write-through, the written data is merged into the current one.
+        Otherwise, the resource is marked as stale.
+
+        :param response: The response to the write request.
+        :param data: The data written with a PATCH, None for the other
+            kinds of writes.
+        """
+        doc = self._get_representation(response)
+        if doc is not None:
+            etag = response.headers.get('ETag')
+        elif (data is not None and self._conn.write_through and
+                not self._is_stale and self._json is not None):
+            # NOTE: the BMC changed the ETag, to something unknown
+            doc = _merge_json(self._json, data)
+            doc.pop('@odata.etag', None)
+            etag = None
+        else:
+            self.invalidate()
+            return
+
+        LOG.debug('Updating %(type)s %(path)s in place after a write',
+                  {'type': self.__class__.__name__, 'path': self._path})
+        self._json = doc
+        self._etag = etag
+        self._parse_attributes(doc)
+        self._do_refresh(force=False)
+        self._is_stale = False
+
+    def _patch(self, data, if_match=False):
+        """Update the resource with a PATCH request
+
+        The BMC is asked for the updated representation, sparing the
+        next refresh, see `_update_after_write`. Within a `batch`, the
+        data is only added to the PATCH request of the batch.
+
+        :param data: The properties to update, in form of Python types.
+        :param if_match: Whether to only have the update done if the
+            resource has not changed since read, when its ETag is known.
+        :raises: PreconditionFailedError, if the resource changed.
+        """
+        batch = getattr(self._batch_state, 'data', None)
+        if batch is not None:
+            self._batch_state.data = _merge_json(batch, data)
+            return
+
+        headers = dict(PREFER_REPRESENTATION_HEADERS)
+        etag = self.etag
+        if if_match and etag:
+            headers['If-Match'] = etag
+        elif if_match:
+            LOG.debug('The ETag of %(type)s %(path)s is unknown, updating '
+                      'it unconditionally', {'type': self.__class__.__name__,
+                                             'path': self._path})
+        response = self._conn.patch(self._path, data=data, headers=headers)
+        self._update_after_write(response, data)
+
+    @contextlib.contextmanager
+    def batch(self, if_match=True):
+        """Coalesce the updates of the setters into one PATCH request
+
+        The request is sent when the block ends, unless it raises. Nested
+        batches join the outermost one. A batch only coalesces the updates
+        made by its own thread, those of other threads are sent right away
+        or join the batches of these threads. Usage:
+
+        .. code-block:: python
+
+          with system.batch():
+              system.set_system_boot_options(sushy.BOOT_SOURCE_TARGET_PXE)
+              system.set_indicator_led(sushy.INDICATOR_LED_LIT)
+
+        :param if_match: Whether to send the request with an ``If-Match``
+            header on the ETag of the resource, if known, so that it fails
+            rather than overwrites a concurrent change.
+        :raises: PreconditionFailedError, if the resource changed since
+            read and `if_match` is set.
+        """
+        state = self._batch_state
+        if getattr(state, 'data', None) is not None:
+            yield self
+            return
+
+        state.data = {}
+        try:
+            yield self
+        finally:
+            data, state.data = state.data, None
+        if data:
+            self._patch(data, if_match=if_match)
+
+    @property
+    def etag(self):
+        """The ETag of the resource as last read, if known"""
+        etag = self._json.get('@odata.etag') if self._json else None
+        return etag or self._etag
+
     @property
     def json(self):
         return self._json
@@ -607,3 +775,50 @@ class ResourceCollectionBase(ResourceBase, metaclass=abc.ABCMeta):
         :returns: A list of ``_resource_type`` objects
         """
         return [self.get_member(id_) for id_ in self.members_identities]
+
+
+def _canonical_path(path):
+    path, sep, fragment = path.partition('#')
+    return (path.rstrip('/') or '/') + sep + fragment
+
+
+def get_shared_resource(resource_type, connector, path,
+                        redfish_version=None, registries=None):
+    """Get the instance of a resource shared by all its holders
+
+    Resource instances are kept in an identity map per connector, keyed
+    by resource class and canonical path, fragment included, and only
+    weakly referenced.
+    As long as some holder keeps an instance alive, navigating to the
+    same path returns that very instance rather than fetching and
+    parsing the resource anew, so one refresh serves all the holders.
+    A shared instance marked as stale is refreshed before being returned.
+
+    :param resource_type: The `ResourceBase` subclass to instantiate.
+    :param connector: A Connector instance
+    :param path: The path to the resource
+    :param redfish_version: The version of Redfish, used on instantiation.
+    :param registries: Dict of Redfish Message Registry objects, used on
+        instantiation.
+    :returns: The `resource_type` instance
+    """
+    key = (resource_type, _canonical_path(path))
+
+    with _IDENTITY_MAPS_LOCK:
+        try:
+            identity_map = _IDENTITY_MAPS[connector]
+        except KeyError:
+            identity_map = _IDENTITY_MAPS[connector] = (
+                weakref.WeakValueDictionary())
+        resource = identity_map.get(key)
+
+    if resource is not None:
+        resource.refresh(force=False)
+        return resource
+
+    resource = resource_type(connector, path, redfish_version=redfish_version,
+                             registries=registries)
+
+    with _IDENTITY_MAPS_LOCK:
+        # NOTE: another thread may have won the race meanwhile
+        return identity_map.setdefault(key, resource)
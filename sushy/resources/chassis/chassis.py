@@ -17,7 +17,10 @@ from sushy import exceptions
 from sushy.resources import base
 from sushy.resources.chassis import mappings as cha_maps
 from sushy.resources.chassis.power import power
+from sushy.resources.chassis import powersubsystem
+from sushy.resources.chassis import sensor
 from sushy.resources.chassis.thermal import thermal
+from sushy.resources.chassis import thermalsubsystem
 from sushy.resources import common
 from sushy.resources.manager import manager
 from sushy.resources import mappings as res_maps
@@ -219,8 +222,7 @@ class Chassis(base.ResourceBase):
             'IndicatorLED': res_maps.INDICATOR_LED_VALUE_MAP_REV[state]
         }
 
-        self._conn.patch(self.path, data=data)
-        self.invalidate()
+        self._patch(data)
 
     @property
     @utils.cache_it
@@ -236,8 +238,8 @@ class Chassis(base.ResourceBase):
         paths = utils.get_sub_resource_path_by(
             self, ["Links", "ManagedBy"], is_collection=True)
 
-        return [manager.Manager(self._conn, path,
-                                self.redfish_version, self.registries)
+        return [base.get_shared_resource(manager.Manager, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
     @property
@@ -255,8 +257,8 @@ class Chassis(base.ResourceBase):
             self, ["Links", "ComputerSystems"], is_collection=True)
 
         from sushy.resources.system import system
-        return [system.System(self._conn, path,
-                              self.redfish_version, self.registries)
+        return [base.get_shared_resource(system.System, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
     @property
@@ -287,6 +289,57 @@ class Chassis(base.ResourceBase):
             utils.get_sub_resource_path_by(self, 'Thermal'),
             self.redfish_version, self.registries)
 
+    @property
+    @utils.cache_it
+    def sensors(self):
+        """Property to reference `SensorCollection` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'Sensors/@odata.id' field
+            is missing.
+        """
+        return sensor.SensorCollection(
+            self._conn,
+            utils.get_sub_resource_path_by(self, 'Sensors'),
+            self.redfish_version, self.registries)
+
+    @property
+    @utils.cache_it
+    def power_subsystem(self):
+        """Property to reference `PowerSubsystem` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'PowerSubsystem/@odata.id' field
+            is missing.
+        """
+        return powersubsystem.PowerSubsystem(
+            self._conn,
+            utils.get_sub_resource_path_by(self, 'PowerSubsystem'),
+            self.redfish_version, self.registries)
+
+    @property
+    @utils.cache_it
+    def thermal_subsystem(self):
+        """Property to reference `ThermalSubsystem` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'ThermalSubsystem/@odata.id' field
+            is missing.
+        """
+        return thermalsubsystem.ThermalSubsystem(
+            self._conn,
+            utils.get_sub_resource_path_by(self, 'ThermalSubsystem'),
+            self.redfish_version, self.registries)
+
 
 class ChassisCollection(base.ResourceCollectionBase):
 
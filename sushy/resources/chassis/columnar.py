@@ -0,0 +1,223 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import array
+import logging
+
+from sushy import exceptions
+from sushy.resources import mappings as res_maps
+
+LOG = logging.getLogger(__name__)
+
+NAN = float('nan')
+
+THRESHOLD_COLUMNS = (
+    'lower_threshold_fatal',
+    'lower_threshold_critical',
+    'lower_threshold_non_critical',
+    'upper_threshold_non_critical',
+    'upper_threshold_critical',
+    'upper_threshold_fatal',
+)
+"""Numeric threshold columns, in the order of severity"""
+
+NUMERIC_COLUMNS = ('reading',) + THRESHOLD_COLUMNS
+"""Columns held as `array.array('d')`, missing values being NaN"""
+
+TEXT_COLUMNS = ('chassis', 'kind', 'sensor', 'name', 'units',
+                'health', 'state')
+"""Columns held as lists of strings (or None)"""
+
+_THRESHOLD_PROPERTIES = (
+    ('lower_threshold_fatal', 'LowerThresholdFatal'),
+    ('lower_threshold_critical', 'LowerThresholdCritical'),
+    ('lower_threshold_non_critical', 'LowerThresholdNonCritical'),
+    ('upper_threshold_non_critical', 'UpperThresholdNonCritical'),
+    ('upper_threshold_critical', 'UpperThresholdCritical'),
+    ('upper_threshold_fatal', 'UpperThresholdFatal'),
+)
+
+# Sensor list property, sensor kind, reading property, reading units
+_SENSOR_LISTS = (
+    ('Temperatures', 'temperature', 'ReadingCelsius', 'Cel'),
+    ('Fans', 'fan', 'Reading', None),
+    ('PowerSupplies', 'power_supply', 'LastPowerOutputWatts', 'W'),
+    ('Voltages', 'voltage', 'ReadingVolts', 'V'),
+)
+
+
+def _get_numpy():
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    return numpy
+
+
+def _to_float(value):
+    if value is None:
+        return NAN
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return NAN
+
+
+class SensorTable(object):
+    """Columnar view of the sensor readings of Thermal/Power resources
+
+    Each row is one sensor (temperature sensor, fan, power supply or
+    voltage sensor);
+    each column is held in a single container, so fleet-wide checks
+    and aggregates are one pass over a column instead of attribute
+    accesses on per-sensor objects. When NumPy is installed, the
+    columns can be turned into NumPy arrays with :py:meth:`~to_numpy`.
+    """
+
+    def __init__(self):
+        self.columns = {name: array.array('d') for name in NUMERIC_COLUMNS}
+        """Dict of column name to column"""
+
+        self.columns.update((name, []) for name in TEXT_COLUMNS)
+
+    def __len__(self):
+        return len(self.columns['sensor'])
+
+    def __getitem__(self, column):
+        return self.columns[column]
+
+    def _append(self, chassis, kind, units, sensor, reading_prop):
+        columns = self.columns
+        columns['chassis'].append(chassis)
+        columns['kind'].append(kind)
+        columns['sensor'].append(sensor.get('MemberId'))
+        columns['name'].append(sensor.get('Name'))
+        columns['units'].append(units or sensor.get('ReadingUnits'))
+        status = sensor.get('Status') or {}
+        columns['health'].append(
+            res_maps.HEALTH_VALUE_MAP.get(status.get('Health')))
+        columns['state'].append(
+            res_maps.STATE_VALUE_MAP.get(status.get('State')))
+        columns['reading'].append(_to_float(sensor.get(reading_prop)))
+        for column, prop in _THRESHOLD_PROPERTIES:
+            columns[column].append(_to_float(sensor.get(prop)))
+
+    def add_resource(self, resource, chassis=None):
+        """Append the sensors of a Thermal or Power resource
+
+        The values are taken from the raw JSON document of the resource,
+        bypassing the per-sensor field objects.
+
+        :param resource: A `Thermal` or `Power` object.
+        :param chassis: The chassis identifier to record for the rows,
+            defaults to the parent path of the resource.
+        """
+        if chassis is None:
+            chassis = resource.path.rstrip('/').rsplit('/', 1)[0]
+
+        doc = resource.json or {}
+        for list_prop, kind, reading_prop, units in _SENSOR_LISTS:
+            for sensor in doc.get(list_prop) or ():
+                self._append(chassis, kind, units, sensor, reading_prop)
+
+    def to_numpy(self):
+        """Convert the columns into NumPy arrays
+
+        Numeric columns become `float64` arrays (NaN for missing values),
+        text columns become `object` arrays.
+
+        :raises: ExtensionError, if NumPy is not installed
+        :returns: A dict of column name to NumPy array
+        """
+        numpy = _get_numpy()
+        if numpy is None:
+            raise exceptions.ExtensionError(
+                error='NumPy is required for the columnar NumPy export, '
+                      'install sushy with the "numpy" extra')
+
+        result = {name: numpy.frombuffer(self.columns[name],
+                                         dtype=numpy.float64).copy()
+                  for name in NUMERIC_COLUMNS}
+        result.update((name, numpy.array(self.columns[name], dtype=object))
+                      for name in TEXT_COLUMNS)
+        return result
+
+    def find_breaches(self, threshold='upper_threshold_critical'):
+        """Find the rows whose reading is beyond a threshold
+
+        Upper thresholds are breached by readings greater than or equal
+        to them, lower thresholds by readings less than or equal to
+        them. Rows missing either value never breach. Runs vectorized
+        when NumPy is installed.
+
+        :param threshold: The name of a threshold column.
+        :raises: InvalidParameterValueError, on unknown threshold column
+        :returns: A list of row indexes
+        """
+        if threshold not in THRESHOLD_COLUMNS:
+            raise exceptions.InvalidParameterValueError(
+                parameter='threshold', value=threshold,
+                valid_values=list(THRESHOLD_COLUMNS))
+
+        upper = threshold.startswith('upper')
+        readings = self.columns['reading']
+        limits = self.columns[threshold]
+
+        numpy = _get_numpy()
+        if numpy is not None:
+            readings = numpy.frombuffer(readings, dtype=numpy.float64)
+            limits = numpy.frombuffer(limits, dtype=numpy.float64)
+            with numpy.errstate(invalid='ignore'):
+                mask = readings >= limits if upper else readings <= limits
+            return numpy.flatnonzero(mask).tolist()
+
+        # NOTE: comparisons against NaN are always false
+        if upper:
+            return [i for i, (r, t) in enumerate(zip(readings, limits))
+                    if r >= t]
+        return [i for i, (r, t) in enumerate(zip(readings, limits))
+                if r <= t]
+
+    def rows(self, indexes):
+        """Get rows as dicts of column name to value
+
+        :param indexes: An iterable of row indexes.
+        :returns: A list of dicts
+        """
+        return [{name: column[i] for name, column in self.columns.items()}
+                for i in indexes]
+
+
+def export_sensor_readings(resources):
+    """Export the sensors of many Thermal/Power resources as columns
+
+    .. code-block:: python
+
+      resources = []
+      for chassis in root.get_chassis_collection().get_members():
+          resources.extend([chassis.thermal, chassis.power])
+
+      table = export_sensor_readings(resources)
+      too_hot = table.rows(table.find_breaches('upper_threshold_critical'))
+
+    :param resources: A `Thermal`/`Power` object or an iterable of them.
+    :returns: A `SensorTable` object
+    """
+    if hasattr(resources, 'json'):
+        resources = [resources]
+
+    table = SensorTable()
+    for resource in resources:
+        table.add_resource(resource)
+
+    LOG.debug('Exported %(rows)d sensor readings', {'rows': len(table)})
+    return table
@@ -0,0 +1,46 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/PowerSubsystem.v1_1_0.json
+
+from sushy.resources import base
+from sushy.resources import common
+from sushy import utils
+
+
+class AllocationField(base.CompositeField):
+
+    allocated_watts = base.Field('AllocatedWatts', adapter=utils.int_or_none)
+    """The total amount of power allocated to the subsystem"""
+
+    requested_watts = base.Field('RequestedWatts', adapter=utils.int_or_none)
+    """The total amount of power requested by the subsystem"""
+
+
+class PowerSubsystem(base.ResourceBase):
+    """This class represents a PowerSubsystem resource."""
+
+    identity = base.Field('Id', required=True)
+    """Identifier of the resource"""
+
+    name = base.Field('Name', required=True)
+    """The name of the resource"""
+
+    allocation = AllocationField('Allocation')
+    """Power allocation of the subsystem"""
+
+    capacity_watts = base.Field('CapacityWatts', adapter=utils.int_or_none)
+    """The total amount of power that can be allocated to the subsystem"""
+
+    status = common.StatusField('Status')
+    """Status of the resource"""
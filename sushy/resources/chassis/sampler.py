@@ -0,0 +1,298 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import array
+import bisect
+import collections
+import logging
+import math
+import threading
+import time
+
+from sushy import exceptions
+
+LOG = logging.getLogger(__name__)
+
+
+SensorKey = collections.namedtuple(
+    'SensorKey', ['chassis', 'resource', 'sensor', 'reading'])
+"""Identifies a ring buffer: chassis path, resource attribute name
+(e.g. 'thermal'), sensor identity and reading attribute name"""
+
+WindowStats = collections.namedtuple(
+    'WindowStats', ['count', 'min', 'max', 'mean'])
+"""Aggregates over the samples of a window"""
+
+DEFAULT_READINGS = (
+    ('power', 'power_supplies', 'last_power_output_watts'),
+    ('power', 'power_supplies', 'line_input_voltage'),
+    ('thermal', 'temperatures', 'reading_celsius'),
+    ('thermal', 'fans', 'reading'),
+)
+"""Readings sampled by default, as tuples of chassis attribute, sensor
+list attribute and reading attribute"""
+
+
+class RingBuffer(object):
+    """Fixed-size ring buffer of timestamped numeric samples
+
+    Samples are stored in preallocated `array.array` objects, so the
+    memory used does not grow with the number of samples appended and
+    the aggregates are computed by C-level iteration over the arrays.
+    """
+
+    def __init__(self, capacity):
+        """Create a ring buffer
+
+        :param capacity: The maximum number of samples held.
+        """
+        if capacity < 1:
+            raise ValueError('Ring buffer capacity must be positive')
+
+        self._capacity = capacity
+        self._values = array.array('d', bytes(8 * capacity))
+        self._timestamps = array.array('d', bytes(8 * capacity))
+        self._start = 0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def capacity(self):
+        return self._capacity
+
+    def __len__(self):
+        return self._count
+
+    def append(self, value, timestamp=None):
+        """Append a sample, overwriting the oldest one if full
+
+        :param value: The numeric sample value. None values (missing
+            readings) are ignored.
+        :param timestamp: The time of the sample in seconds, defaults to
+            the current time. Timestamps must not decrease.
+        """
+        if value is None:
+            return
+        if timestamp is None:
+            timestamp = time.time()
+
+        with self._lock:
+            end = (self._start + self._count) % self._capacity
+            self._values[end] = value
+            self._timestamps[end] = timestamp
+            if self._count < self._capacity:
+                self._count += 1
+            else:
+                self._start = (self._start + 1) % self._capacity
+
+    def _ordered(self, buf):
+        end = self._start + self._count
+        if end <= self._capacity:
+            return buf[self._start:end]
+        return buf[self._start:] + buf[:end - self._capacity]
+
+    def window(self, seconds=None, samples=None, now=None):
+        """Get the samples of a window, oldest first
+
+        :param seconds: Only include samples taken within the last
+            `seconds` seconds (relative to `now`).
+        :param samples: Only include the last `samples` samples.
+        :param now: The reference time for `seconds`, defaults to the
+            current time.
+        :returns: A tuple of two `array.array` objects holding the
+            timestamps and the values.
+        """
+        with self._lock:
+            timestamps = self._ordered(self._timestamps)
+            values = self._ordered(self._values)
+
+        first = 0
+        if seconds is not None:
+            if now is None:
+                now = time.time()
+            first = bisect.bisect_left(timestamps, now - seconds)
+        if samples is not None:
+            first = max(first, len(values) - samples)
+
+        return timestamps[first:], values[first:]
+
+    def stats(self, seconds=None, samples=None, now=None):
+        """Compute count, min, max and mean over a window
+
+        Takes the same arguments as :py:meth:`~window`.
+
+        :returns: A `WindowStats` tuple, with None aggregates if the
+            window holds no samples.
+        """
+        _timestamps, values = self.window(seconds, samples, now)
+        if not values:
+            return WindowStats(0, None, None, None)
+        return WindowStats(len(values), min(values), max(values),
+                           math.fsum(values) / len(values))
+
+    @property
+    def last(self):
+        """The most recent (timestamp, value) sample or None"""
+        with self._lock:
+            if not self._count:
+                return None
+            end = (self._start + self._count - 1) % self._capacity
+            return self._timestamps[end], self._values[end]
+
+
+class TelemetrySampler(object):
+    """Periodic sampler of chassis Power and Thermal readings
+
+    On every sample the `Power` and `Thermal` resources of the chassis
+    are refreshed and their readings appended to per-sensor ring
+    buffers. Usage:
+
+    .. code-block:: python
+
+      sampler = TelemetrySampler(root.get_chassis_collection().get_members(),
+                                 interval=30, capacity=2880)
+      sampler.start()
+      ...
+      for key, stats in sampler.stats(seconds=3600).items():
+          print(key.chassis, key.sensor, stats.max)
+      sampler.stop()
+    """
+
+    def __init__(self, chassis, interval=60, capacity=1440,
+                 readings=DEFAULT_READINGS):
+        """Create a sampler
+
+        :param chassis: A `Chassis` object or a list of them.
+        :param interval: Seconds between samples when running in the
+            background.
+        :param capacity: Number of samples kept per sensor reading.
+        :param readings: The readings to sample, as tuples of chassis
+            attribute, sensor list attribute and reading attribute.
+            Defaults to `DEFAULT_READINGS`.
+        """
+        if not isinstance(chassis, (list, tuple)):
+            chassis = [chassis]
+
+        self._chassis = list(chassis)
+        self._interval = interval
+        self._capacity = capacity
+        self._readings = collections.defaultdict(list)
+        for resource_attr, list_attr, reading_attr in readings:
+            self._readings[resource_attr].append((list_attr, reading_attr))
+
+        self._buffers = {}
+        self._buffers_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._last_error = None
+
+    @property
+    def last_error(self):
+        """The unexpected error of the last background sampling cycle
+
+        None when the last cycle completed. Such errors are logged and do
+        not stop the background sampling.
+        """
+        return self._last_error
+
+    @property
+    def buffers(self):
+        """A dict of `SensorKey` to `RingBuffer` objects"""
+        with self._buffers_lock:
+            return dict(self._buffers)
+
+    def _get_buffer(self, key):
+        with self._buffers_lock:
+            buf = self._buffers.get(key)
+            if buf is None:
+                buf = self._buffers[key] = RingBuffer(self._capacity)
+            return buf
+
+    def _sample_resource(self, chassis, resource_attr, timestamp):
+        try:
+            resource = getattr(chassis, resource_attr)
+            resource.refresh()
+        except exceptions.MissingAttributeError:
+            LOG.debug('Chassis %(chassis)s has no %(attr)s resource',
+                      {'chassis': chassis.path, 'attr': resource_attr})
+            return
+
+        for list_attr, reading_attr in self._readings[resource_attr]:
+            for sensor in getattr(resource, list_attr, None) or ():
+                value = getattr(sensor, reading_attr, None)
+                if value is None:
+                    continue
+                key = SensorKey(chassis.path, resource_attr,
+                                '%s/%s' % (list_attr, sensor.identity),
+                                reading_attr)
+                self._get_buffer(key).append(value, timestamp)
+
+    def sample(self):
+        """Take one sample of all the chassis
+
+        Errors of individual chassis are logged and do not prevent
+        the others from being sampled.
+        """
+        for chassis in self._chassis:
+            timestamp = time.time()
+            for resource_attr in self._readings:
+                try:
+                    self._sample_resource(chassis, resource_attr, timestamp)
+                except exceptions.SushyError as e:
+                    LOG.warning('Failed to sample %(attr)s of chassis '
+                                '%(chassis)s: %(error)s',
+                                {'attr': resource_attr,
+                                 'chassis': chassis.path, 'error': e})
+
+    def stats(self, seconds=None, samples=None, now=None):
+        """Compute window aggregates for every sensor reading
+
+        Takes the same arguments as :py:meth:`RingBuffer.window`.
+
+        :returns: A dict of `SensorKey` to `WindowStats`
+        """
+        return {key: buf.stats(seconds, samples, now)
+                for key, buf in self.buffers.items()}
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            started = time.time()
+            try:
+                self.sample()
+            except Exception as e:
+                LOG.exception('Unexpected error while sampling the chassis '
+                              'telemetry')
+                self._last_error = e
+            else:
+                self._last_error = None
+            elapsed = time.time() - started
+            self._stop_event.wait(max(0, self._interval - elapsed))
+
+    def start(self):
+        """Start sampling in a background thread"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name='sushy-telemetry-sampler')
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        """Stop the background sampling
+
+        :param timeout: Seconds to wait for the sampling thread to end.
+        """
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
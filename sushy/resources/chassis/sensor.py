@@ -0,0 +1,243 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/Sensor.v1_2_0.json
+
+import logging
+
+from sushy import exceptions
+from sushy.resources import base
+from sushy.resources import common
+from sushy.resources import mappings as res_maps
+
+LOG = logging.getLogger(__name__)
+
+EXPAND_QUERY = '$expand=.($levels=1)'
+"""Query expanding the members of a collection in place"""
+
+EXCERPT_QUERY = 'excerpt'
+"""Query asking for the excerpt properties of a resource only"""
+
+READING_PROPERTIES = ('Id', 'Reading', 'ReadingUnits', 'Status')
+"""Properties requested with `$select` when excerpts are unsupported"""
+
+
+class ThresholdField(base.CompositeField):
+
+    reading = base.Field('Reading')
+    """The threshold value"""
+
+
+class ThresholdsField(base.CompositeField):
+
+    lower_caution = ThresholdField('LowerCaution')
+    """Below normal range"""
+
+    lower_critical = ThresholdField('LowerCritical')
+    """Below normal range but not yet fatal"""
+
+    lower_fatal = ThresholdField('LowerFatal')
+    """Below normal range and is fatal"""
+
+    upper_caution = ThresholdField('UpperCaution')
+    """Above normal range"""
+
+    upper_critical = ThresholdField('UpperCritical')
+    """Above normal range but not yet fatal"""
+
+    upper_fatal = ThresholdField('UpperFatal')
+    """Above normal range and is fatal"""
+
+
+class Sensor(base.ResourceBase):
+    """This class represents a Sensor resource."""
+
+    identity = base.Field('Id', required=True)
+    """Identifier of the sensor"""
+
+    name = base.Field('Name')
+    """The name of the sensor"""
+
+    physical_context = base.Field('PhysicalContext')
+    """Area or device associated with this sensor"""
+
+    reading = base.Field('Reading')
+    """The sensor reading"""
+
+    reading_type = base.Field('ReadingType')
+    """The type of the sensor reading (e.g. 'Temperature', 'Power')"""
+
+    reading_units = base.Field('ReadingUnits')
+    """The units of the reading and thresholds"""
+
+    reading_range_max = base.Field('ReadingRangeMax')
+    """Maximum possible value of the reading"""
+
+    reading_range_min = base.Field('ReadingRangeMin')
+    """Minimum possible value of the reading"""
+
+    status = common.StatusField('Status')
+    """Status of the sensor"""
+
+    thresholds = ThresholdsField('Thresholds')
+    """The thresholds of the sensor"""
+
+
+class SensorReading(object):
+    """Lightweight record of a sensor reading
+
+    Built straight from the (excerpt) JSON of a sensor, without
+    creating a `Sensor` resource object.
+    """
+
+    def __init__(self, doc):
+        self.path = doc.get('@odata.id')
+        """The path of the sensor"""
+
+        self.identity = doc.get('Id')
+        """Identifier of the sensor"""
+
+        self.reading = doc.get('Reading')
+        """The sensor reading"""
+
+        self.reading_units = doc.get('ReadingUnits')
+        """The units of the reading"""
+
+        status = doc.get('Status') or {}
+        self.health = res_maps.HEALTH_VALUE_MAP.get(status.get('Health'))
+        """The health of the sensor"""
+
+        self.state = res_maps.STATE_VALUE_MAP.get(status.get('State'))
+        """The state of the sensor"""
+
+
+def _expand_supported(expand_query):
+    if isinstance(expand_query, dict):
+        # NOTE: an object of the supported options in current schemas,
+        # EXPAND_QUERY expands the subordinate resources one level down
+        return bool(expand_query.get('NoLinks') or
+                    expand_query.get('Levels'))
+    return bool(expand_query)
+
+
+def get_query_options(protocol_features):
+    """Work out the sensor reading query options supported by a BMC
+
+    :param protocol_features: The `protocol_features_supported` field of
+        the root `Sushy` object, or None.
+    :returns: A dict of `expand`, `excerpt` and `select` booleans, fit
+        to be passed to :py:meth:`SensorCollection.get_readings`.
+    """
+    if protocol_features is None:
+        return {'expand': False, 'excerpt': False, 'select': False}
+
+    return {'expand': _expand_supported(protocol_features.expand_query),
+            'excerpt': bool(protocol_features.excerpt_query),
+            'select': bool(protocol_features.select_query)}
+
+
+class SensorCollection(base.ResourceCollectionBase):
+
+    @property
+    def _resource_type(self):
+        return Sensor
+
+    def __init__(self, connector, path, redfish_version=None,
+                 registries=None):
+        """A class representing a SensorCollection
+
+        :param connector: A Connector instance
+        :param path: The canonical path to the Sensor collection resource
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of the given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(SensorCollection, self).__init__(
+            connector, path, redfish_version, registries)
+
+    @staticmethod
+    def _build_query(expand, excerpt, select):
+        params = []
+        if expand:
+            params.append(EXPAND_QUERY)
+        if excerpt:
+            params.append(EXCERPT_QUERY)
+        elif select:
+            params.append('$select=' + ','.join(READING_PROPERTIES))
+        return '&'.join(params)
+
+    @staticmethod
+    def _with_query(path, query):
+        if not query:
+            return path
+        return path + ('&' if '?' in path else '?') + query
+
+    def get_readings(self, protocol_features=None, expand=None,
+                     excerpt=None, select=None):
+        """Poll the readings of all the sensors of the collection
+
+        When the BMC supports it, the collection is fetched with its
+        members expanded in place, so all the readings arrive in one
+        response, and only the excerpt (or selected) properties of each
+        sensor are transferred. Otherwise each sensor is fetched
+        individually, still restricted to its excerpt properties when
+        possible. Usage:
+
+        .. code-block:: python
+
+          sensors = root.get_chassis().sensors
+          readings = sensors.get_readings(root.protocol_features_supported)
+
+        :param protocol_features: The `protocol_features_supported` field
+            of the root `Sushy` object, used to work out the query
+            options not given explicitly.
+        :param expand: Whether to use the `$expand` query.
+        :param excerpt: Whether to use the `excerpt` query.
+        :param select: Whether to use the `$select` query when `excerpt`
+            is not used.
+        :returns: A list of `SensorReading` objects
+        """
+        options = get_query_options(protocol_features)
+        for name, value in (('expand', expand), ('excerpt', excerpt),
+                            ('select', select)):
+            if value is not None:
+                options[name] = value
+
+        if options['expand']:
+            query = self._build_query(**options)
+            try:
+                doc = self._conn.get(
+                    path=self._with_query(self._path, query)).json()
+            except exceptions.BadRequestError as exc:
+                LOG.debug('Sensor collection %(path)s cannot be expanded, '
+                          'fetching the sensors one by one: %(error)s',
+                          {'path': self._path, 'error': exc})
+            else:
+                members = doc.get('Members') or []
+                # NOTE: sensors may lack a reading, e.g. when absent
+                if all(isinstance(m, dict) and set(m) - {'@odata.id'}
+                       for m in members):
+                    return [SensorReading(m) for m in members]
+
+                LOG.debug('Sensor collection %s was not expanded by the '
+                          'BMC, fetching the sensors one by one', self._path)
+
+        query = self._build_query(False, options['excerpt'],
+                                  options['select'])
+        readings = []
+        for path in self.members_identities:
+            doc = self._conn.get(path=self._with_query(path, query)).json()
+            doc.setdefault('@odata.id', path)
+            readings.append(SensorReading(doc))
+        return readings
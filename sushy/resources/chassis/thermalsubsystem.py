@@ -0,0 +1,30 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/ThermalSubsystem.v1_0_0.json
+
+from sushy.resources import base
+from sushy.resources import common
+
+
+class ThermalSubsystem(base.ResourceBase):
+    """This class represents a ThermalSubsystem resource."""
+
+    identity = base.Field('Id', required=True)
+    """Identifier of the resource"""
+
+    name = base.Field('Name', required=True)
+    """The name of the resource"""
+
+    status = common.StatusField('Status')
+    """Status of the resource"""
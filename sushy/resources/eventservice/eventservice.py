@@ -0,0 +1,103 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/EventService.v1_3_0.json
+
+import logging
+
+from sushy import exceptions
+from sushy.resources import base
+from sushy.resources import common
+from sushy.resources.eventservice import sse
+
+LOG = logging.getLogger(__name__)
+
+
+class EventService(base.ResourceBase):
+
+    identity = base.Field('Id', required=True)
+    """The event service identity"""
+
+    name = base.Field('Name', required=True)
+    """The event service name"""
+
+    description = base.Field('Description')
+    """The event service description"""
+
+    service_enabled = base.Field('ServiceEnabled')
+    """Indicates whether this service is enabled"""
+
+    delivery_retry_attempts = base.Field('DeliveryRetryAttempts')
+    """Number of times an event delivery is retried before giving up"""
+
+    delivery_retry_interval = base.Field('DeliveryRetryIntervalSeconds')
+    """Number of seconds between event delivery retry attempts"""
+
+    event_types_for_subscription = base.Field('EventTypesForSubscription',
+                                              adapter=list)
+    """The event types the service can send"""
+
+    registry_prefixes = base.Field('RegistryPrefixes', adapter=list)
+    """The message registry prefixes the service can send events for"""
+
+    resource_types = base.Field('ResourceTypes', adapter=list)
+    """The resource types the service can send events for"""
+
+    server_sent_event_uri = base.Field('ServerSentEventUri')
+    """The URI of the Server-Sent Event stream of this service"""
+
+    status = common.StatusField('Status')
+    """The status of the event service"""
+
+    def __init__(self, connector, identity, redfish_version=None,
+                 registries=None):
+        """A class representing an EventService
+
+        :param connector: A Connector instance
+        :param identity: The identity of the EventService resource
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(EventService, self).__init__(
+            connector, identity, redfish_version, registries)
+
+    def get_event_stream(self, message_ids=None, resource_types=None,
+                         server_side_filter=False):
+        """Get a reader for the Server-Sent Event stream of this service
+
+        The stream is not opened until it is iterated over or
+        :py:meth:`~sushy.resources.eventservice.sse.EventStream.open`
+        is called.
+
+        :param message_ids: Optional collection of message IDs to
+            yield events for. See
+            :py:class:`~sushy.resources.eventservice.sse.EventStream`
+            for the accepted forms.
+        :param resource_types: Optional collection of resource types
+            (e.g. 'ComputerSystem', 'Power') to yield events for.
+        :param server_side_filter: Whether to also ask the BMC to filter
+            the stream by means of the `$filter` query parameter.
+        :raises: MissingAttributeError, if the service does not expose
+            the `ServerSentEventUri` property.
+        :returns: An `EventStream` object
+        """
+        if not self.server_sent_event_uri:
+            raise exceptions.MissingAttributeError(
+                attribute='ServerSentEventUri', resource=self._path)
+
+        return sse.EventStream(self._conn, self.server_sent_event_uri,
+                               message_ids=message_ids,
+                               resource_types=resource_types,
+                               server_side_filter=server_side_filter)
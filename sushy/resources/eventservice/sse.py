@@ -0,0 +1,418 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+# This is described in Redfish specification section "Server-Sent Events"
+# www.dmtf.org/sites/default/files/standards/documents/DSP0266_1.8.0.pdf
+# and in the HTML Living Standard section "Server-sent events".
+
+import json
+import logging
+import threading
+import time
+from urllib import parse as urlparse
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_RETRY_DELAY = 3
+"""Seconds to wait before reconnecting, unless the BMC tells otherwise"""
+
+
+class ServerSentEvent(object):
+    """A single message dispatched from a Server-Sent Event stream"""
+
+    def __init__(self, data, event=None, last_event_id=None):
+        self.data = data
+        """The data buffer of the message"""
+
+        self.event = event
+        """The event type of the message, if set"""
+
+        self.last_event_id = last_event_id
+        """The last event ID seen on the stream when the message came in"""
+
+
+class ServerSentEventParser(object):
+    """Incremental parser of the `text/event-stream` format
+
+    Lines are fed one by one (without line terminators) and the
+    messages are dispatched as soon as they are complete, so the
+    stream never has to be buffered as a whole.
+    """
+
+    def __init__(self):
+        self.last_event_id = None
+        """The value of the last `id` field seen on the stream"""
+
+        self.retry = None
+        """Reconnection time in seconds, if requested by the server"""
+
+        self._data = []
+        self._event = None
+
+    def feed(self, line):
+        """Feed a line of the stream into the parser
+
+        :param line: A line of the stream as `str`, without terminator
+        :returns: A `ServerSentEvent` if the line completed a message,
+            None otherwise
+        """
+        if not line:
+            return self._dispatch()
+
+        if line.startswith(':'):
+            # Comment, often used by BMCs as a keep-alive
+            return
+
+        field, sep, value = line.partition(':')
+        if sep and value.startswith(' '):
+            value = value[1:]
+
+        if field == 'data':
+            self._data.append(value)
+        elif field == 'event':
+            self._event = value
+        elif field == 'id':
+            if '\0' not in value:
+                self.last_event_id = value
+        elif field == 'retry':
+            if value.isdigit():
+                self.retry = int(value) / 1000.0
+        else:
+            LOG.debug('Ignoring unknown Server-Sent Event field %s', field)
+
+    def _dispatch(self):
+        if not self._data:
+            self._event = None
+            return
+
+        message = ServerSentEvent('\n'.join(self._data), event=self._event,
+                                  last_event_id=self.last_event_id)
+        self._data = []
+        self._event = None
+        return message
+
+
+class EventRecord(object):
+    """A Redfish event record received over the event stream"""
+
+    def __init__(self, record, stream_id=None):
+        """A class representing a Redfish event record
+
+        :param record: The event record in form of Python types, as
+            found in the `Events` array of an Event resource.
+        :param stream_id: The Server-Sent Event ID the record came with.
+        """
+        self.event_type = record.get('EventType')
+        """The type of the event"""
+
+        self.event_id = record.get('EventId')
+        """The unique instance identifier of the event"""
+
+        self.event_timestamp = record.get('EventTimestamp')
+        """The time the event occurred, as sent by the BMC"""
+
+        self.severity = record.get('Severity')
+        """The severity of the event"""
+
+        self.message = record.get('Message')
+        """The human-readable event message"""
+
+        self.message_id = record.get('MessageId')
+        """The registry message ID of the event"""
+
+        self.message_args = record.get('MessageArgs', [])
+        """The arguments to substitute into the registry message"""
+
+        self.context = record.get('Context')
+        """The client-supplied context of the subscription"""
+
+        origin = record.get('OriginOfCondition') or {}
+        if isinstance(origin, str):
+            origin = {'@odata.id': origin}
+
+        self.origin_of_condition = origin.get('@odata.id')
+        """The path of the resource that originated the event"""
+
+        self.resource_type = _get_resource_type(origin.get('@odata.type'))
+        """The resource type of the originating resource, when known"""
+
+        self.stream_id = stream_id
+        """The Server-Sent Event ID the record was received with"""
+
+        self.json = record
+        """The raw event record"""
+
+    @property
+    def registry_prefix(self):
+        """The message registry prefix of the `message_id`"""
+        if self.message_id:
+            return self.message_id.split('.', 1)[0]
+
+    @property
+    def message_key(self):
+        """The message key (last part) of the `message_id`"""
+        if self.message_id:
+            return self.message_id.rsplit('.', 1)[-1]
+
+
+def _get_resource_type(odata_type):
+    """Extract the resource type out of an `@odata.type` value
+
+    For example, '#Power.v1_5_0.Power' becomes 'Power'.
+    """
+    if not odata_type:
+        return None
+    return odata_type.lstrip('#').split('.', 1)[0]
+
+
+class _MessageIdFilter(object):
+    """Matches message IDs against a set of wanted ones
+
+    The wanted message IDs may be given as a full ID (e.g.
+    'ResourceEvent.1.0.ResourceChanged'), as an ID without the registry
+    version (e.g. 'ResourceEvent.ResourceChanged') or as a registry
+    prefix only (e.g. 'ResourceEvent').
+    """
+
+    def __init__(self, message_ids):
+        self._full = set()
+        self._unversioned = set()
+        self._prefixes = set()
+        for message_id in message_ids:
+            parts = message_id.split('.')
+            if len(parts) == 1:
+                self._prefixes.add(message_id)
+            elif len(parts) == 2:
+                self._unversioned.add(message_id)
+            else:
+                self._full.add(message_id)
+
+    def filter_terms(self):
+        """The terms of a `$filter` query selecting the wanted messages
+
+        :returns: A list of terms to join with ``or``, or None if the
+            wanted messages cannot be expressed as such, i.e. IDs without
+            registry version are wanted
+        """
+        if self._unversioned:
+            return None
+        return (["MessageId eq '%s'" % v for v in sorted(self._full)] +
+                ["RegistryPrefix eq '%s'" % v
+                 for v in sorted(self._prefixes)])
+
+    def __call__(self, message_id):
+        if not message_id:
+            return False
+        if message_id in self._full:
+            return True
+        parts = message_id.split('.')
+        if parts[0] in self._prefixes:
+            return True
+        return '%s.%s' % (parts[0], parts[-1]) in self._unversioned
+
+
+class EventStream(object):
+    """Reader of the Redfish Server-Sent Event stream
+
+    Holds a single long-lived HTTP connection to the BMC, parses the
+    stream incrementally and yields `EventRecord` objects as they
+    arrive. Usage:
+
+    .. code-block:: python
+
+      event_service = root.get_event_service()
+      with event_service.get_event_stream(
+              message_ids=['ResourceEvent.ResourceChanged'],
+              resource_types=['ComputerSystem']) as stream:
+          for record in stream:
+              print(record.origin_of_condition, record.message)
+
+    The client-side resource type filter can only act on records whose
+    `OriginOfCondition` carries an `@odata.type`; other records are let
+    through unless `server_side_filter` is used.
+    """
+
+    def __init__(self, connector, path, message_ids=None,
+                 resource_types=None, server_side_filter=False,
+                 reconnect=True):
+        """A class representing a Server-Sent Event stream
+
+        :param connector: A Connector instance
+        :param path: The `ServerSentEventUri` of the event service
+        :param message_ids: Optional collection of message IDs to yield
+            records for.
+        :param resource_types: Optional collection of resource types to
+            yield records for.
+        :param server_side_filter: Whether to pass the filters to the BMC
+            by means of the `$filter` query parameter. Message IDs without
+            registry version cannot be passed, the message IDs are then
+            only filtered on the client side.
+        :param reconnect: Whether to transparently reconnect (resuming
+            from the last event ID) when the BMC ends the stream.
+        """
+        self._conn = connector
+        self._path = path
+        self._message_ids = set(message_ids or ())
+        self._resource_types = set(resource_types or ())
+        self._message_id_filter = (
+            _MessageIdFilter(self._message_ids) if self._message_ids
+            else None)
+        self._server_side_filter = server_side_filter
+        self._reconnect = reconnect
+        self._parser = ServerSentEventParser()
+        self._response = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def _filter_clauses(self):
+        clauses = []
+        if self._message_id_filter is not None:
+            terms = self._message_id_filter.filter_terms()
+            if terms:
+                clauses.append('(%s)' % ' or '.join(terms))
+        if self._resource_types:
+            clauses.append('(%s)' % ' or '.join(
+                "ResourceType eq '%s'" % v
+                for v in sorted(self._resource_types)))
+        return clauses
+
+    @property
+    def path(self):
+        """The path of the stream, including any `$filter` query
+
+        Only the full message IDs and the registry prefixes are passed to
+        the BMC, the records are filtered on the client side as well.
+        """
+        clauses = self._filter_clauses() if self._server_side_filter else []
+        if not clauses:
+            return self._path
+
+        query = urlparse.urlencode({'$filter': ' and '.join(clauses)},
+                                   quote_via=urlparse.quote)
+        separator = '&' if '?' in self._path else '?'
+        return self._path + separator + query
+
+    @property
+    def last_event_id(self):
+        """The ID of the last Server-Sent Event received"""
+        return self._parser.last_event_id
+
+    def open(self):
+        """Open the connection to the stream, if not opened yet
+
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        with self._lock:
+            if self._response is not None:
+                return
+            self._closed = False
+            headers = {'Accept': 'text/event-stream'}
+            if self._parser.last_event_id is not None:
+                headers['Last-Event-ID'] = self._parser.last_event_id
+            LOG.debug('Opening the event stream %s', self.path)
+            self._response = self._conn.get(self.path, headers=headers,
+                                            stream=True)
+
+    def close(self):
+        """Close the connection to the stream
+
+        Can be called from another thread to stop an ongoing iteration.
+        """
+        with self._lock:
+            self._closed = True
+            response, self._response = self._response, None
+        if response is not None:
+            response.close()
+
+    def _read_messages(self):
+        response = self._response
+        if response is None:
+            return
+        try:
+            for line in response.iter_lines(decode_unicode=True):
+                if isinstance(line, bytes):
+                    line = line.decode('utf-8')
+                message = self._parser.feed(line)
+                if message is not None:
+                    yield message
+            # An ended stream dispatches any pending message
+            message = self._parser.feed('')
+            if message is not None:
+                yield message
+        except Exception as e:
+            if self._closed:
+                return
+            LOG.warning('Event stream %(path)s interrupted: %(error)s',
+                        {'path': self._path, 'error': e})
+        finally:
+            with self._lock:
+                if self._response is response:
+                    self._response = None
+            response.close()
+
+    def _get_records(self, message):
+        try:
+            doc = json.loads(message.data)
+        except ValueError as e:
+            LOG.warning('Ignoring malformed event data on %(path)s: '
+                        '%(error)s', {'path': self._path, 'error': e})
+            return []
+
+        if not isinstance(doc, dict) or 'Events' not in doc:
+            LOG.debug('Ignoring non-event payload on %s', self._path)
+            return []
+
+        return [EventRecord(r, stream_id=message.last_event_id)
+                for r in doc['Events'] or ()]
+
+    def _is_wanted(self, record):
+        if (self._message_id_filter is not None and
+                not self._message_id_filter(record.message_id)):
+            return False
+        if (self._resource_types and record.resource_type is not None and
+                record.resource_type not in self._resource_types):
+            return False
+        return True
+
+    def __iter__(self):
+        """Yield the wanted event records as they arrive
+
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        while not self._closed:
+            self.open()
+            for message in self._read_messages():
+                for record in self._get_records(message):
+                    if self._is_wanted(record):
+                        yield record
+                if self._closed:
+                    return
+
+            if self._closed or not self._reconnect:
+                return
+
+            delay = self._parser.retry
+            if delay is None:
+                delay = DEFAULT_RETRY_DELAY
+            LOG.debug('Event stream %(path)s ended, reconnecting in '
+                      '%(delay)s seconds', {'path': self._path,
+                                            'delay': delay})
+            time.sleep(delay)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
@@ -214,8 +214,8 @@ class Manager(base.ResourceBase):
             self, ["Links", "ManagerForServers"], is_collection=True)
 
         from sushy.resources.system import system
-        return [system.System(self._conn, path,
-                              self.redfish_version, self.registries)
+        return [base.get_shared_resource(system.System, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
     @property
@@ -233,8 +233,8 @@ class Manager(base.ResourceBase):
             self, ["Links", "ManagerForChassis"], is_collection=True)
 
         from sushy.resources.chassis import chassis
-        return [chassis.Chassis(self._conn, path,
-                                self.redfish_version, self.registries)
+        return [base.get_shared_resource(chassis.Chassis, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
 
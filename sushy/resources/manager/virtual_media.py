@@ -90,9 +90,11 @@ class VirtualMedia(base.ResourceBase):
         :param write_protected: indicates the media is write protected
         """
         target_uri = self._get_insert_media_element().target_uri
-        self._conn.post(target_uri, data={"Image": image, "Inserted": inserted,
-                                          "WriteProtected": write_protected})
-        self.invalidate()
+        response = self._conn.post(
+            target_uri, data={"Image": image, "Inserted": inserted,
+                              "WriteProtected": write_protected},
+            headers=dict(base.PREFER_REPRESENTATION_HEADERS))
+        self._update_after_write(response)
 
     def eject_media(self):
         """Detach remote media from virtual media
@@ -100,17 +102,20 @@ class VirtualMedia(base.ResourceBase):
         After ejecting media inserted will be False and image_name will be
         empty.
         """
+        headers = dict(base.PREFER_REPRESENTATION_HEADERS)
+        response = None
         try:
             target_uri = self._get_eject_media_element().target_uri
-            self._conn.post(target_uri)
-        except exceptions.HTTPError as response:
+            response = self._conn.post(target_uri, headers=headers)
+        except exceptions.HTTPError as error:
             # Some vendors like HPE iLO has this kind of implementation.
             # It needs to pass an empty dict.
-            if response.status_code in (
+            if error.status_code in (
                     http_client.UNSUPPORTED_MEDIA_TYPE,
                     http_client.BAD_REQUEST):
-                self._conn.post(target_uri, data={})
-        self.invalidate()
+                response = self._conn.post(target_uri, data={},
+                                           headers=headers)
+        self._update_after_write(response)
 
 
 class VirtualMediaCollection(base.ResourceCollectionBase):
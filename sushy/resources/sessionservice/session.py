@@ -18,6 +18,8 @@
 
 import logging
 
+from dateutil import parser
+
 from sushy.resources import base
 
 LOG = logging.getLogger(__name__)
@@ -37,6 +39,9 @@ class Session(base.ResourceBase):
     username = base.Field('UserName')
     """The UserName for the account for this session."""
 
+    created_time = base.Field('CreatedTime', adapter=parser.parse)
+    """The date and time when this session was created."""
+
     def __init__(self, connector, identity, redfish_version=None,
                  registries=None):
         """A class representing a Session
@@ -119,6 +119,64 @@ class Bios(base.ResourceBase):
         utils.cache_clear(self, force_refresh=False,
                           only_these=['_pending_settings_resource'])
 
+    def get_attribute_changes(self, value):
+        """Work out the attributes an update would actually change
+
+        An attribute is left out when the value it is due to have after
+        the next restart, i.e. its pending value if any, else its current
+        value, already is the desired one.
+
+        :param value: Key-value pairs for the desired attribute names and
+            values
+        :returns: A dict of the attributes to update
+        """
+        current = self.attributes or {}
+        pending = {}
+        if self._settings.resource_uri:
+            try:
+                pending = self.pending_attributes or {}
+            except exceptions.ResourceNotFoundError:
+                LOG.debug('No pending BIOS settings found for %s',
+                          self.identity)
+
+        changes = {}
+        for key, desired in value.items():
+            if key in pending:
+                expected = pending[key]
+            elif key in current:
+                expected = current[key]
+            else:
+                # NOTE: unknown to the BMC, let it have its say
+                changes[key] = desired
+                continue
+            if expected != desired:
+                changes[key] = desired
+        return changes
+
+    def update_attributes(self, value):
+        """Update the attributes not having the desired values yet
+
+        Unlike :py:func:`~set_attributes`, only the attributes that would
+        change are sent, and nothing is sent if none would, so that no
+        useless pending settings (hence restarts) are created. See
+        :py:func:`~get_attribute_changes`.
+
+        :param value: Key-value pairs for the desired attribute names and
+            values
+        :returns: A dict of the attributes updated, empty if none needed to
+        """
+        changes = self.get_attribute_changes(value)
+        if not changes:
+            LOG.debug('BIOS attributes %s already have the desired values',
+                      self.identity)
+            return changes
+
+        LOG.debug('Updating %(count)d out of %(total)d BIOS attributes '
+                  '%(bios)s', {'count': len(changes), 'total': len(value),
+                               'bios': self.identity})
+        self.set_attributes(changes)
+        return changes
+
     def _get_reset_bios_action_element(self):
         actions = self._actions
 
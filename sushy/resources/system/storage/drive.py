@@ -84,5 +84,4 @@ class Drive(base.ResourceBase):
             'IndicatorLED': res_maps.INDICATOR_LED_VALUE_MAP_REV[state]
         }
 
-        self._conn.patch(self.path, data=data)
-        self.invalidate()
+        self._patch(data)
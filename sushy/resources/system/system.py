@@ -17,6 +17,7 @@
 # https://redfish.dmtf.org/schemas/ComputerSystem.v1_5_0.json
 
 import collections
+from concurrent import futures
 import logging
 
 from sushy import exceptions
@@ -38,6 +39,12 @@ from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
+POWER_STATE_SELECT_QUERY = '$select=PowerState'
+"""Query asking for the power state of a system only"""
+
+DEFAULT_PROBE_WORKERS = 8
+"""Default number of concurrent power state probes"""
+
 
 class ActionsField(base.CompositeField):
     reset = common.ResetActionField('#ComputerSystem.Reset')
@@ -257,9 +264,7 @@ class System(base.ResourceBase):
 
             data['Boot']['BootSourceOverrideMode'] = fishy_mode
 
-        # TODO(lucasagomes): Check the return code and response body ?
-        #                    Probably we should call refresh() as well.
-        self._conn.patch(self.path, data=data)
+        self._patch(data)
 
     def set_system_boot_source(
             self, target, enabled=sys_cons.BOOT_SOURCE_ENABLED_ONCE,
@@ -301,8 +306,7 @@ class System(base.ResourceBase):
             'IndicatorLED': res_maps.INDICATOR_LED_VALUE_MAP_REV[state]
         }
 
-        self._conn.patch(self.path, data=data)
-        self.invalidate()
+        self._patch(data)
 
     def _get_processor_collection_path(self):
         """Helper function to find the ProcessorCollection path"""
@@ -411,9 +415,8 @@ class System(base.ResourceBase):
         paths = utils.get_sub_resource_path_by(
             self, ["Links", "ManagedBy"], is_collection=True)
 
-        return [manager.Manager(self._conn, path,
-                                redfish_version=self.redfish_version,
-                                registries=self.registries)
+        return [base.get_shared_resource(manager.Manager, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
     @property
@@ -430,9 +433,8 @@ class System(base.ResourceBase):
         paths = utils.get_sub_resource_path_by(
             self, ["Links", "Chassis"], is_collection=True)
 
-        return [chassis.Chassis(self._conn, path,
-                                redfish_version=self.redfish_version,
-                                registries=self.registries)
+        return [base.get_shared_resource(chassis.Chassis, self._conn, path,
+                                         self.redfish_version, self.registries)
                 for path in paths]
 
 
@@ -454,3 +456,88 @@ class SystemCollection(base.ResourceCollectionBase):
         """
         super(SystemCollection, self).__init__(
             connector, path, redfish_version, registries)
+
+    def probe_power_states(self, protocol_features=None, select=None,
+                           max_workers=DEFAULT_PROBE_WORKERS):
+        """Probe the power state of all the systems of the collection
+
+        The systems are fetched concurrently and no `System` object is
+        built, see `probe_power_state`.
+
+        :param protocol_features: The `protocol_features_supported` field
+            of the root `Sushy` object, used to work out whether the BMC
+            supports the `$select` query when `select` is not given.
+        :param select: Whether to use the `$select` query.
+        :param max_workers: The maximum number of concurrent requests.
+        :returns: A dict of system path to power state, or to the
+            exception raised while probing it
+        """
+        if select is None:
+            select = bool(protocol_features is not None and
+                          protocol_features.select_query)
+        paths = list(self.members_identities)
+        states = probe_power_states([(self._conn, path) for path in paths],
+                                    select=select, max_workers=max_workers)
+        return dict(zip(paths, states))
+
+
+def probe_power_state(connector, path, select=False):
+    """Get the power state of a system without building a `System` object
+
+    Meant for the loops polling the power state of many systems, only the
+    ``PowerState`` property of the response is looked at. BMCs rejecting
+    the `$select` query are asked again without it.
+
+    :param connector: A Connector instance
+    :param path: The path to the System resource
+    :param select: Whether to use the `$select` query, saving the BMC the
+        rendering of the rest of the system.
+    :returns: The power state, one of `POWER_STATE_*` constants, or None
+        if not reported
+    """
+    if select:
+        try:
+            doc = connector.get(
+                path=path + '?' + POWER_STATE_SELECT_QUERY).json()
+        except exceptions.BadRequestError:
+            LOG.debug('The $select query was rejected for system %s, '
+                      'probing its power state without it', path)
+            doc = connector.get(path=path).json()
+    else:
+        doc = connector.get(path=path).json()
+    return res_maps.POWER_STATE_VALUE_MAP.get(doc.get('PowerState'))
+
+
+def probe_power_states(targets, select=False,
+                       max_workers=DEFAULT_PROBE_WORKERS):
+    """Probe the power state of many systems concurrently
+
+    See `probe_power_state`. Usage:
+
+    .. code-block:: python
+
+      targets = [(root._conn, path) for root, path in systems]
+      states = system.probe_power_states(targets, select=True)
+
+    :param targets: An iterable of (connector, system path) tuples,
+        possibly spanning several BMCs.
+    :param select: Whether to use the `$select` query.
+    :param max_workers: The maximum number of concurrent requests.
+    :returns: A list of the power states of the targets, in order, with
+        the exception raised while probing a target instead of its state
+    """
+    def probe(target):
+        connector, path = target
+        try:
+            return probe_power_state(connector, path, select=select)
+        except (exceptions.SushyError, ValueError) as exc:
+            # NOTE: ValueError on an invalid JSON body
+            LOG.warning('Failed to probe the power state of system '
+                        '%(path)s: %(error)s', {'path': path, 'error': exc})
+            return exc
+
+    targets = list(targets)
+    if len(targets) <= 1:
+        return [probe(target) for target in targets]
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(probe, targets))
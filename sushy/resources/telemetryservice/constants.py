@@ -0,0 +1,47 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# Values come from the Redfish MetricReportDefinition json-schema.
+# https://redfish.dmtf.org/schemas/v1/MetricReportDefinition.v1_3_0.json
+
+# Metric Report Definition Type constants
+
+METRIC_REPORT_TYPE_PERIODIC = 'periodic'
+"""The metric report is generated at a periodic time interval"""
+
+METRIC_REPORT_TYPE_ON_CHANGE = 'on change'
+"""The metric report is generated when any of the metrics change"""
+
+METRIC_REPORT_TYPE_ON_REQUEST = 'on request'
+"""The metric report is generated when a client requests it"""
+
+# Report Action constants
+
+METRIC_REPORT_ACTION_LOG = 'log to metric reports collection'
+"""Record the metric report in the MetricReports collection"""
+
+METRIC_REPORT_ACTION_EVENT = 'redfish event'
+"""Send the metric report as a Redfish event"""
+
+# Report Updates constants
+
+METRIC_REPORT_UPDATES_OVERWRITE = 'overwrite'
+"""Overwrite the previous metric report of this definition"""
+
+METRIC_REPORT_UPDATES_APPEND_WRAPS = 'append wraps when full'
+"""Append to the previous report, wrapping around when full"""
+
+METRIC_REPORT_UPDATES_APPEND_STOPS = 'append stops when full'
+"""Append to the previous report, stopping when full"""
+
+METRIC_REPORT_UPDATES_NEW_REPORT = 'new report'
+"""Create a new metric report, named with a timestamp suffix"""
@@ -0,0 +1,42 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+from sushy.resources.telemetryservice import constants as tel_cons
+from sushy import utils
+
+
+METRIC_REPORT_TYPE_VALUE_MAP = {
+    'Periodic': tel_cons.METRIC_REPORT_TYPE_PERIODIC,
+    'OnChange': tel_cons.METRIC_REPORT_TYPE_ON_CHANGE,
+    'OnRequest': tel_cons.METRIC_REPORT_TYPE_ON_REQUEST,
+}
+
+METRIC_REPORT_TYPE_VALUE_MAP_REV = (
+    utils.revert_dictionary(METRIC_REPORT_TYPE_VALUE_MAP))
+
+METRIC_REPORT_ACTION_VALUE_MAP = {
+    'LogToMetricReportsCollection': tel_cons.METRIC_REPORT_ACTION_LOG,
+    'RedfishEvent': tel_cons.METRIC_REPORT_ACTION_EVENT,
+}
+
+METRIC_REPORT_ACTION_VALUE_MAP_REV = (
+    utils.revert_dictionary(METRIC_REPORT_ACTION_VALUE_MAP))
+
+METRIC_REPORT_UPDATES_VALUE_MAP = {
+    'Overwrite': tel_cons.METRIC_REPORT_UPDATES_OVERWRITE,
+    'AppendWrapsWhenFull': tel_cons.METRIC_REPORT_UPDATES_APPEND_WRAPS,
+    'AppendStopsWhenFull': tel_cons.METRIC_REPORT_UPDATES_APPEND_STOPS,
+    'NewReport': tel_cons.METRIC_REPORT_UPDATES_NEW_REPORT,
+}
+
+METRIC_REPORT_UPDATES_VALUE_MAP_REV = (
+    utils.revert_dictionary(METRIC_REPORT_UPDATES_VALUE_MAP))
@@ -0,0 +1,112 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/MetricReport.v1_3_0.json
+
+from dateutil import parser
+
+from sushy.resources import base
+
+
+class MetricValueListField(base.ListField):
+    """A metric value of a metric report"""
+
+    metric_id = base.Field('MetricId')
+    """The metric definition identifier of this value"""
+
+    metric_value = base.Field('MetricValue')
+    """The metric value, as a string"""
+
+    metric_property = base.Field('MetricProperty')
+    """The URI of the property the value was read from"""
+
+    timestamp = base.Field('Timestamp', adapter=parser.parse)
+    """The time when the value was obtained"""
+
+
+class MetricReport(base.ResourceBase):
+
+    identity = base.Field('Id', required=True)
+    """The metric report identity"""
+
+    name = base.Field('Name', required=True)
+    """The metric report name"""
+
+    description = base.Field('Description')
+    """The metric report description"""
+
+    report_sequence = base.Field('ReportSequence')
+    """The current sequence identifier of the metric report"""
+
+    timestamp = base.Field('Timestamp', adapter=parser.parse)
+    """The time the metric report was produced"""
+
+    metric_values = MetricValueListField('MetricValues', default=[])
+    """The metric values of the report"""
+
+    _metric_report_definition_path = base.Field(
+        ['MetricReportDefinition', '@odata.id'])
+    """The path of the definition the report was produced by"""
+
+    def __init__(self, connector, identity, redfish_version=None,
+                 registries=None):
+        """A class representing a MetricReport
+
+        :param connector: A Connector instance
+        :param identity: The identity of the MetricReport resource
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(MetricReport, self).__init__(
+            connector, identity, redfish_version, registries)
+
+    def get_readings(self):
+        """Get the latest value of each metric property of the report
+
+        Numeric values are converted to `float`, others are kept as is.
+
+        :returns: A dict of metric property (or metric ID, when the
+            property is not reported) to value
+        """
+        readings = {}
+        for value in self.metric_values:
+            reading = value.metric_value
+            try:
+                reading = float(reading)
+            except (TypeError, ValueError):
+                pass
+            readings[value.metric_property or value.metric_id] = reading
+        return readings
+
+
+class MetricReportCollection(base.ResourceCollectionBase):
+
+    @property
+    def _resource_type(self):
+        return MetricReport
+
+    def __init__(self, connector, path, redfish_version=None,
+                 registries=None):
+        """A class representing a MetricReportCollection
+
+        :param connector: A Connector instance
+        :param path: The canonical path to the MetricReport collection
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(MetricReportCollection, self).__init__(
+            connector, path, redfish_version, registries)
@@ -0,0 +1,152 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/MetricReportDefinition.v1_3_0.json
+
+from sushy import exceptions
+from sushy.resources import base
+from sushy.resources import common
+from sushy.resources.telemetryservice import mappings as tel_maps
+from sushy.resources.telemetryservice import metric_report
+from sushy import utils
+
+
+class ScheduleField(base.CompositeField):
+
+    recurrence_interval = base.Field('RecurrenceInterval')
+    """The ISO 8601 duration between metric report generations"""
+
+
+class MetricListField(base.ListField):
+
+    metric_id = base.Field('MetricId')
+    """The metric definition identifier"""
+
+    metric_properties = base.Field('MetricProperties', adapter=list,
+                                   default=[])
+    """The URIs of the properties the metric is read from"""
+
+    collection_function = base.Field('CollectionFunction')
+    """The function applied over the collection duration"""
+
+    collection_duration = base.Field('CollectionDuration')
+    """The ISO 8601 duration over which the function is applied"""
+
+
+class MetricReportDefinition(base.ResourceBase):
+
+    identity = base.Field('Id', required=True)
+    """The metric report definition identity"""
+
+    name = base.Field('Name', required=True)
+    """The metric report definition name"""
+
+    description = base.Field('Description')
+    """The metric report definition description"""
+
+    metric_report_definition_type = base.MappedField(
+        'MetricReportDefinitionType',
+        tel_maps.METRIC_REPORT_TYPE_VALUE_MAP)
+    """When the metric report is generated"""
+
+    metric_report_definition_enabled = base.Field(
+        'MetricReportDefinitionEnabled')
+    """Whether the generation of new metric reports is enabled"""
+
+    metric_properties = base.Field('MetricProperties', adapter=list,
+                                   default=[])
+    """The URIs of the properties reported"""
+
+    metrics = MetricListField('Metrics', default=[])
+    """The metrics reported"""
+
+    report_actions = base.MappedListField(
+        'ReportActions', tel_maps.METRIC_REPORT_ACTION_VALUE_MAP)
+    """The actions performed when a metric report is generated"""
+
+    report_updates = base.MappedField(
+        'ReportUpdates', tel_maps.METRIC_REPORT_UPDATES_VALUE_MAP)
+    """How subsequent metric reports are handled"""
+
+    schedule = ScheduleField('Schedule')
+    """The schedule of periodic metric reports"""
+
+    status = common.StatusField('Status')
+    """The status of the metric report definition"""
+
+    _metric_report_path = base.Field(['MetricReport', '@odata.id'])
+    """The path of the metric report produced by this definition"""
+
+    def __init__(self, connector, identity, redfish_version=None,
+                 registries=None):
+        """A class representing a MetricReportDefinition
+
+        :param connector: A Connector instance
+        :param identity: The identity of the MetricReportDefinition
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(MetricReportDefinition, self).__init__(
+            connector, identity, redfish_version, registries)
+
+    @property
+    @utils.cache_it
+    def metric_report(self):
+        """Property to reference the latest `MetricReport` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'MetricReport/@odata.id' field
+            is missing.
+        :returns: `MetricReport` instance
+        """
+        if not self._metric_report_path:
+            raise exceptions.MissingAttributeError(
+                attribute='MetricReport/@odata.id', resource=self._path)
+
+        return metric_report.MetricReport(
+            self._conn, self._metric_report_path,
+            redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    def delete(self):
+        """Delete the metric report definition
+
+        :raises: ServerSideError
+        """
+        self._conn.delete(self.path)
+
+
+class MetricReportDefinitionCollection(base.ResourceCollectionBase):
+
+    @property
+    def _resource_type(self):
+        return MetricReportDefinition
+
+    def __init__(self, connector, path, redfish_version=None,
+                 registries=None):
+        """A class representing a MetricReportDefinitionCollection
+
+        :param connector: A Connector instance
+        :param path: The canonical path to the collection resource
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(MetricReportDefinitionCollection, self).__init__(
+            connector, path, redfish_version, registries)
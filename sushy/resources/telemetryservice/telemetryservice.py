@@ -0,0 +1,217 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+# This is referred from Redfish standard schema.
+# https://redfish.dmtf.org/schemas/v1/TelemetryService.v1_2_0.json
+
+import logging
+
+from sushy import exceptions
+from sushy.resources import base
+from sushy.resources import common
+from sushy.resources.telemetryservice import constants as tel_cons
+from sushy.resources.telemetryservice import mappings as tel_maps
+from sushy.resources.telemetryservice import metric_report
+from sushy.resources.telemetryservice import metric_report_definition
+from sushy import utils
+
+LOG = logging.getLogger(__name__)
+
+
+class TelemetryService(base.ResourceBase):
+
+    identity = base.Field('Id', required=True)
+    """The telemetry service identity"""
+
+    name = base.Field('Name', required=True)
+    """The telemetry service name"""
+
+    description = base.Field('Description')
+    """The telemetry service description"""
+
+    service_enabled = base.Field('ServiceEnabled')
+    """Indicates whether this service is enabled"""
+
+    max_reports = base.Field('MaxReports', adapter=utils.int_or_none)
+    """The maximum number of metric reports supported by this service"""
+
+    min_collection_interval = base.Field('MinCollectionInterval')
+    """The minimum ISO 8601 duration between metric collections"""
+
+    supported_collection_functions = base.Field(
+        'SupportedCollectionFunctions', adapter=list)
+    """The functions that can be applied over metric collections"""
+
+    status = common.StatusField('Status')
+    """The status of the telemetry service"""
+
+    def __init__(self, connector, identity, redfish_version=None,
+                 registries=None):
+        """A class representing a TelemetryService
+
+        :param connector: A Connector instance
+        :param identity: The identity of the TelemetryService resource
+        :param redfish_version: The version of RedFish. Used to construct
+            the object according to schema of given version.
+        :param registries: Dict of Redfish Message Registry objects to be
+            used in any resource that needs registries to parse messages
+        """
+        super(TelemetryService, self).__init__(
+            connector, identity, redfish_version, registries)
+
+    @property
+    @utils.cache_it
+    def metric_report_definitions(self):
+        """Property to reference `MetricReportDefinitionCollection` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'MetricReportDefinitions/@odata.id'
+            field is missing.
+        """
+        return metric_report_definition.MetricReportDefinitionCollection(
+            self._conn,
+            utils.get_sub_resource_path_by(self, 'MetricReportDefinitions'),
+            redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    @property
+    @utils.cache_it
+    def metric_reports(self):
+        """Property to reference `MetricReportCollection` instance
+
+        It is set once when the first time it is queried. On refresh,
+        this property is marked as stale (greedy-refresh not done).
+        Here the actual refresh of the sub-resource happens, if stale.
+
+        :raises: MissingAttributeError if 'MetricReports/@odata.id' field
+            is missing.
+        """
+        return metric_report.MetricReportCollection(
+            self._conn, utils.get_sub_resource_path_by(self, 'MetricReports'),
+            redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    def get_metric_report(self, identity):
+        """Given the identity return a MetricReport object
+
+        Fetching a metric report is a single GET returning all the
+        metric values collected by its definition.
+
+        :param identity: The identity of the MetricReport resource
+        :returns: The MetricReport object
+        """
+        return metric_report.MetricReport(
+            self._conn, identity, redfish_version=self.redfish_version,
+            registries=self.registries)
+
+    def create_metric_report_definition(
+            self, identity, metric_properties,
+            report_type=tel_cons.METRIC_REPORT_TYPE_ON_REQUEST,
+            recurrence_interval=None, report_actions=None,
+            report_updates=tel_cons.METRIC_REPORT_UPDATES_OVERWRITE,
+            name=None):
+        """Create a metric report definition
+
+        Usage, collecting the readings of a chassis in one report:
+
+        .. code-block:: python
+
+          definition = telemetry.create_metric_report_definition(
+              'NodePower', ['/redfish/v1/Chassis/1/Power#/PowerControl/0/'
+                            'PowerConsumedWatts',
+                            '/redfish/v1/Chassis/1/Thermal#/Temperatures/0/'
+                            'ReadingCelsius'],
+              report_type=sushy.METRIC_REPORT_TYPE_PERIODIC,
+              recurrence_interval='PT60S')
+          readings = definition.metric_report.get_readings()
+
+        :param identity: The Id of the new definition.
+        :param metric_properties: A list of URIs of the properties to
+            include in the metric report, wildcards being allowed if the
+            BMC supports them.
+        :param report_type: When the report is generated, one of the
+            `METRIC_REPORT_TYPE_*` constants.
+        :param recurrence_interval: The ISO 8601 duration between reports,
+            required for periodic reports.
+        :param report_actions: A list of `METRIC_REPORT_ACTION_*`
+            constants, defaults to logging the reports to the
+            MetricReports collection.
+        :param report_updates: How subsequent reports are handled, one of
+            the `METRIC_REPORT_UPDATES_*` constants.
+        :param name: The name of the new definition, defaults to
+            `identity`.
+        :raises: InvalidParameterValueError, if any information passed is
+            invalid.
+        :returns: The new MetricReportDefinition object
+        """
+        if report_type not in tel_maps.METRIC_REPORT_TYPE_VALUE_MAP_REV:
+            raise exceptions.InvalidParameterValueError(
+                parameter='report_type', value=report_type,
+                valid_values=list(tel_maps.METRIC_REPORT_TYPE_VALUE_MAP_REV))
+
+        if (report_type == tel_cons.METRIC_REPORT_TYPE_PERIODIC and
+                not recurrence_interval):
+            raise exceptions.InvalidParameterValueError(
+                parameter='recurrence_interval', value=recurrence_interval,
+                valid_values='an ISO 8601 duration such as "PT60S"')
+
+        if report_updates not in tel_maps.METRIC_REPORT_UPDATES_VALUE_MAP_REV:
+            raise exceptions.InvalidParameterValueError(
+                parameter='report_updates', value=report_updates,
+                valid_values=list(
+                    tel_maps.METRIC_REPORT_UPDATES_VALUE_MAP_REV))
+
+        if report_actions is None:
+            report_actions = [tel_cons.METRIC_REPORT_ACTION_LOG]
+
+        for action in report_actions:
+            if action not in tel_maps.METRIC_REPORT_ACTION_VALUE_MAP_REV:
+                raise exceptions.InvalidParameterValueError(
+                    parameter='report_actions', value=action,
+                    valid_values=list(
+                        tel_maps.METRIC_REPORT_ACTION_VALUE_MAP_REV))
+
+        data = {
+            'Id': identity,
+            'Name': name or identity,
+            'MetricReportDefinitionType':
+                tel_maps.METRIC_REPORT_TYPE_VALUE_MAP_REV[report_type],
+            'MetricReportDefinitionEnabled': True,
+            'MetricProperties': list(metric_properties),
+            'ReportActions': [tel_maps.METRIC_REPORT_ACTION_VALUE_MAP_REV[a]
+                              for a in report_actions],
+            'ReportUpdates':
+                tel_maps.METRIC_REPORT_UPDATES_VALUE_MAP_REV[report_updates],
+        }
+        if recurrence_interval:
+            data['Schedule'] = {'RecurrenceInterval': recurrence_interval}
+
+        collection_path = utils.get_sub_resource_path_by(
+            self, 'MetricReportDefinitions')
+
+        LOG.debug('Creating metric report definition %(id)s at %(path)s',
+                  {'id': identity, 'path': collection_path})
+        rsp = self._conn.post(collection_path, data=data)
+
+        location = rsp.headers.get('Location')
+        if not location:
+            location = collection_path.rstrip('/') + '/' + identity
+
+        utils.cache_clear(self, force_refresh=False,
+                          only_these=['metric_report_definitions'])
+
+        return metric_report_definition.MetricReportDefinition(
+            self._conn, location, redfish_version=self.redfish_version,
+            registries=self.registries)
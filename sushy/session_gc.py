@@ -0,0 +1,244 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Garbage collection of the sessions left behind on BMCs
+
+Processes dying without closing their Redfish sessions leave them open
+until they time out, if ever, and BMCs eventually refuse new sessions.
+This module finds the sessions of a service account which are old enough
+and not known to be in use, and deletes them. The sessions held in the
+session store of the authentication are known to be in use. Usage, e.g.
+from a periodic job:
+
+.. code-block:: python
+
+  roots = [sushy.Sushy(url, username='svc', password='secret')
+           for url in urls]
+  results = session_gc.collect_fleet(roots, min_age=3600)
+"""
+
+import collections
+from concurrent import futures
+import datetime
+import logging
+import time
+from urllib import parse as urlparse
+
+from sushy import exceptions
+from sushy import session_store as sushy_session_store
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+"""Default number of concurrent requests per BMC"""
+
+DEFAULT_BATCH_SIZE = 8
+"""Default number of sessions deleted per batch"""
+
+CollectResult = collections.namedtuple('CollectResult',
+                                       ['deleted', 'failed'])
+"""Outcome of a collection: lists of the deleted and undeletable paths"""
+
+
+def _path(uri):
+    return urlparse.urlparse(uri).path.rstrip('/')
+
+
+def _own_auth(root):
+    # NOTE: the connector has the auth actually used, e.g. when pooled
+    return root._conn._auth
+
+
+def _own_session(root):
+    """The path of the session the root resource is authenticated with"""
+    get_session_resource_id = getattr(_own_auth(root),
+                                      'get_session_resource_id', None)
+    if get_session_resource_id is None:
+        return None
+    uri = get_session_resource_id()
+    return _path(uri) if uri else None
+
+
+def _own_username(root):
+    """The name of the user the root resource is authenticated as"""
+    return getattr(_own_auth(root), '_username', None)
+
+
+def _stored_session(root, session_store, username):
+    """The path of the session of a user held in a session store"""
+    if session_store is None:
+        session_store = getattr(_own_auth(root), '_session_store', None)
+    if session_store is None:
+        return None
+    entry = session_store.get(
+        sushy_session_store.make_key(root._conn._url, username))
+    uri = entry.get('uri') if entry else None
+    return _path(uri) if uri else None
+
+
+def _is_stale(session, username, min_age, now):
+    if username is not None and session.username != username:
+        return False
+    created_time = session.created_time
+    if created_time is None:
+        # NOTE: without creation time, there is no telling how old it is
+        return False
+    if created_time.tzinfo is None:
+        created_time = created_time.replace(tzinfo=datetime.timezone.utc)
+    return (now - created_time).total_seconds() >= min_age
+
+
+def find_stale_sessions(session_service, username=None, min_age=None,
+                        keep=(), max_workers=DEFAULT_MAX_WORKERS):
+    """Find the sessions to collect on a BMC
+
+    The members of the sessions collection are fetched in parallel.
+
+    :param session_service: A `SessionService` instance.
+    :param username: Only consider the sessions of this user, None for
+        all users.
+    :param min_age: Only consider the sessions created at least this many
+        seconds ago. Required, sessions without creation time are not
+        considered.
+    :param keep: The URIs of the sessions known to be in use.
+    :param max_workers: The maximum number of concurrent requests.
+    :returns: A list of `Session` instances
+    :raises: ValueError if `min_age` is not set, as the sessions in use
+        by other clients would be considered
+    """
+    if min_age is None:
+        raise ValueError('Refusing to consider the sessions of any age, '
+                         'set a minimum age')
+
+    collection = session_service.sessions
+    keep = {_path(uri) for uri in keep}
+    identities = [identity for identity in collection.members_identities
+                  if _path(identity) not in keep]
+    now = datetime.datetime.now(datetime.timezone.utc)
+
+    def get_member(identity):
+        try:
+            return collection.get_member(identity)
+        except exceptions.ResourceNotFoundError:
+            # NOTE: deleted meanwhile, e.g. expired
+            return None
+
+    with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        sessions = list(executor.map(get_member, identities))
+
+    return [session for session in sessions
+            if session is not None and
+            _is_stale(session, username, min_age, now)]
+
+
+def delete_sessions(sessions, batch_size=DEFAULT_BATCH_SIZE,
+                    batch_delay=0):
+    """Delete sessions in bounded batches
+
+    :param sessions: A list of `Session` instances.
+    :param batch_size: The number of sessions deleted concurrently.
+    :param batch_delay: Seconds to wait between batches, to spare the BMC.
+    :returns: A `CollectResult`
+    """
+    deleted = []
+    failed = []
+
+    def delete(session):
+        try:
+            session.delete()
+        except exceptions.ResourceNotFoundError:
+            pass
+        except exceptions.SushyError as exc:
+            LOG.warning('Failed to delete the session %(session)s: '
+                        '%(error)s', {'session': session.path, 'error': exc})
+            return session.path, False
+        return session.path, True
+
+    with futures.ThreadPoolExecutor(max_workers=batch_size) as executor:
+        for start in range(0, len(sessions), batch_size):
+            if start and batch_delay:
+                time.sleep(batch_delay)
+            batch = sessions[start:start + batch_size]
+            for path, ok in executor.map(delete, batch):
+                (deleted if ok else failed).append(path)
+
+    return CollectResult(deleted, failed)
+
+
+def collect(root, username=None, min_age=None, keep=(), dry_run=False,
+            max_workers=DEFAULT_MAX_WORKERS, batch_size=DEFAULT_BATCH_SIZE,
+            batch_delay=0, session_store=None):
+    """Delete the stale sessions of a BMC
+
+    The session the root resource is authenticated with is always kept,
+    as well as the session of the user held in the session store.
+
+    :param root: A `Sushy` instance.
+    :param username: Only collect the sessions of this user, None for the
+        user the root resource is authenticated as.
+    :param min_age: Only collect the sessions created at least this many
+        seconds ago. Required, as other clients may share the user.
+    :param keep: The URIs of other sessions known to be in use.
+    :param dry_run: Whether to only report the sessions to delete.
+    :param max_workers: The maximum number of concurrent listing requests.
+    :param batch_size: The number of sessions deleted concurrently.
+    :param batch_delay: Seconds to wait between deletion batches.
+    :param session_store: The `SessionStoreBase` holding sessions in use,
+        None for the one of the authentication of the root resource.
+    :returns: A `CollectResult`, whose ``deleted`` paths are the ones to
+        delete on a dry run
+    :raises: ValueError if `min_age` is not set
+    """
+    if min_age is None:
+        raise ValueError('Refusing to collect the sessions of any age, '
+                         'set a minimum age')
+    if username is None:
+        username = _own_username(root)
+    keep = list(keep)
+    for in_use in (_own_session(root),
+                   _stored_session(root, session_store, username)):
+        if in_use:
+            keep.append(in_use)
+
+    sessions = find_stale_sessions(root.get_session_service(),
+                                   username=username, min_age=min_age,
+                                   keep=keep, max_workers=max_workers)
+    LOG.debug('Found %(count)d stale sessions on %(url)s',
+              {'count': len(sessions), 'url': root._base_url})
+    if dry_run:
+        return CollectResult([session.path for session in sessions], [])
+    return delete_sessions(sessions, batch_size=batch_size,
+                           batch_delay=batch_delay)
+
+
+def collect_fleet(roots, max_bmcs=DEFAULT_MAX_WORKERS, **kwargs):
+    """Delete the stale sessions of several BMCs in parallel
+
+    :param roots: An iterable of `Sushy` instances.
+    :param max_bmcs: The maximum number of BMCs processed concurrently.
+    :param kwargs: The arguments of `collect`, `min_age` being required.
+    :returns: A dict of base URL to `CollectResult`, or to the exception
+        raised while collecting
+    """
+    results = {}
+    with futures.ThreadPoolExecutor(max_workers=max_bmcs) as executor:
+        pending = {executor.submit(collect, root, **kwargs): root
+                   for root in roots}
+        for future in futures.as_completed(pending):
+            url = pending[future]._base_url
+            try:
+                results[url] = future.result()
+            except (exceptions.SushyError, ValueError) as exc:
+                LOG.warning('Failed to collect the sessions of %(url)s: '
+                            '%(error)s', {'url': url, 'error': exc})
+                results[url] = exc
+    return results
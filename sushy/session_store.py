@@ -0,0 +1,283 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Stores of Redfish sessions shared between authentication objects
+
+A session store lets a `SessionAuth` reuse the session established by a
+previous instance, possibly in another process, instead of creating a new
+one on the BMC. An `AuthMethodMemo` similarly lets `SessionOrBasicAuth`
+remember the BMCs not supporting sessions. Usage:
+
+.. code-block:: python
+
+  store = session_store.FileSessionStore('/var/lib/myapp/sessions.json')
+  auth = sushy_auth.SessionAuth('foo', 'bar', session_store=store)
+  root = sushy.Sushy(url, auth=auth)
+"""
+
+import abc
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # NOTE: not available on Windows
+    fcntl = None
+
+LOG = logging.getLogger(__name__)
+
+STORE_VERSION = 1
+"""Version of the session store file format"""
+
+AUTH_METHOD_SESSION = 'session'
+"""Session based authentication method"""
+
+AUTH_METHOD_BASIC = 'basic'
+"""Basic authentication method"""
+
+DEFAULT_AUTH_METHOD_TTL = 3600
+"""Default time in seconds the authentication methods are remembered for"""
+
+
+def make_key(url, username):
+    """Build the key of the sessions of a user on a BMC
+
+    :param url: The base URL of the BMC.
+    :param username: The name of the user.
+    :returns: The key as a string
+    """
+    return '%s|%s' % (url.rstrip('/'), username or '')
+
+
+class SessionStoreBase(object, metaclass=abc.ABCMeta):
+    """Interface of the session stores
+
+    Entries are dicts with the ``token``, ``uri`` and idle ``timeout`` of a
+    session and the ``created`` time of the entry.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        """Get the session stored under a key
+
+        :param key: The key built by `make_key`.
+        :returns: The entry dict, or None if no session is stored
+        """
+
+    @abc.abstractmethod
+    def set(self, key, token, uri, timeout=None):
+        """Store a session, replacing any session stored under the key
+
+        :param key: The key built by `make_key`.
+        :param token: The X-Auth-Token of the session.
+        :param uri: The URI of the session resource, or None.
+        :param timeout: The idle time in seconds after which the BMC
+            expires the session, or None if unknown.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key, token=None):
+        """Forget the session stored under a key
+
+        :param key: The key built by `make_key`.
+        :param token: If set, only forget the session if it still has this
+            token, so that a session refreshed meanwhile is kept.
+        """
+
+
+def _entry(token, uri, timeout):
+    return {'token': token, 'uri': uri, 'timeout': timeout,
+            'created': time.time()}
+
+
+class MemorySessionStore(SessionStoreBase):
+    """Session store local to the process"""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._sessions.get(key)
+            return dict(entry) if entry is not None else None
+
+    def set(self, key, token, uri, timeout=None):
+        with self._lock:
+            self._sessions[key] = _entry(token, uri, timeout)
+
+    def delete(self, key, token=None):
+        with self._lock:
+            entry = self._sessions.get(key)
+            if entry is not None and token in (None, entry['token']):
+                del self._sessions[key]
+
+
+class _JsonFile(object):
+    """A JSON file shared between processes
+
+    Accesses are serialized with an advisory lock on a companion ``.lock``
+    file (where ``fcntl`` is available) and the file is replaced
+    atomically on updates. The file is only readable by its owner.
+    """
+
+    def __init__(self, filename, section):
+        self._filename = filename
+        self._lock_filename = filename + '.lock'
+        self._section = section
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def locked(self):
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            fd = os.open(self._lock_filename, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+
+    def load(self):
+        try:
+            with open(self._filename) as f:
+                doc = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError as e:
+            LOG.warning('Ignoring the corrupted file %(file)s: %(error)s',
+                        {'file': self._filename, 'error': e})
+            return {}
+
+        if doc.get('version') != STORE_VERSION:
+            LOG.warning('Ignoring the file %(file)s of unsupported '
+                        'version %(version)s',
+                        {'file': self._filename,
+                         'version': doc.get('version')})
+            return {}
+        return doc.get(self._section, {})
+
+    def save(self, data):
+        directory = os.path.dirname(os.path.abspath(self._filename))
+        fd, tmp_filename = tempfile.mkstemp(dir=directory,
+                                            prefix='.sushy-')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'version': STORE_VERSION, self._section: data},
+                          f)
+            os.replace(tmp_filename, self._filename)
+        except Exception:
+            os.unlink(tmp_filename)
+            raise
+
+
+class FileSessionStore(SessionStoreBase):
+    """Session store in a JSON file, shared between processes
+
+    Accesses are serialized with an advisory lock on a companion
+    ``.lock`` file (where ``fcntl`` is available) and the file is replaced
+    atomically on updates. Session tokens are credentials, so the file is
+    only readable by its owner.
+    """
+
+    def __init__(self, filename):
+        """A class representing a session store file
+
+        :param filename: The path of the store file, created on the first
+            update.
+        """
+        self._file = _JsonFile(filename, 'sessions')
+
+    def get(self, key):
+        with self._file.locked():
+            return self._file.load().get(key)
+
+    def set(self, key, token, uri, timeout=None):
+        with self._file.locked():
+            sessions = self._file.load()
+            sessions[key] = _entry(token, uri, timeout)
+            self._file.save(sessions)
+
+    def delete(self, key, token=None):
+        with self._file.locked():
+            sessions = self._file.load()
+            entry = sessions.get(key)
+            if entry is not None and token in (None, entry['token']):
+                del sessions[key]
+                self._file.save(sessions)
+
+
+class AuthMethodMemo(object):
+    """Memo of the authentication method working with each BMC
+
+    Lets `SessionOrBasicAuth` go straight to basic authentication with the
+    BMCs known not to support sessions. Entries expire, so that a BMC
+    gaining session support (or failing sessions transiently) gets tried
+    again.
+    """
+
+    def __init__(self, filename=None, ttl=DEFAULT_AUTH_METHOD_TTL):
+        """A class representing a memo of authentication methods
+
+        :param filename: The path of a file to share the memo between
+            processes through, None to keep it in memory.
+        :param ttl: The time in seconds entries are valid for.
+        """
+        self._file = _JsonFile(filename, 'methods') if filename else None
+        self._methods = {}
+        self._lock = threading.Lock()
+        self._ttl = ttl
+
+    def get(self, url):
+        """Get the authentication method known to work with a BMC
+
+        :param url: The base URL of the BMC.
+        :returns: The method, e.g. `AUTH_METHOD_BASIC`, or None if unknown
+        """
+        key = url.rstrip('/')
+        if self._file is not None:
+            with self._file.locked():
+                entry = self._file.load().get(key)
+        else:
+            with self._lock:
+                entry = self._methods.get(key)
+
+        if entry is None or entry['expires'] < time.time():
+            return None
+        return entry['method']
+
+    def set(self, url, method):
+        """Record the authentication method working with a BMC
+
+        :param url: The base URL of the BMC.
+        :param method: The method, e.g. `AUTH_METHOD_SESSION`.
+        """
+        key = url.rstrip('/')
+        entry = {'method': method, 'expires': time.time() + self._ttl}
+        if self._file is not None:
+            with self._file.locked():
+                methods = self._file.load()
+                now = time.time()
+                methods = {k: v for k, v in methods.items()
+                           if v['expires'] >= now}
+                methods[key] = entry
+                self._file.save(methods)
+        else:
+            with self._lock:
+                self._methods[key] = entry
@@ -0,0 +1,66 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Run the sushy benchmarks, reporting the results as JSON
+
+Usage::
+
+  python -m sushy.tests.benchmarks [--rounds N] [--nodes N]
+      [--workers N] [--output FILE] [PATTERN ...]
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from sushy.tests.benchmarks import macro  # noqa
+from sushy.tests.benchmarks import micro  # noqa
+from sushy.tests.benchmarks import runner
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m sushy.tests.benchmarks',
+                                     description=__doc__.split('\n')[0])
+    parser.add_argument('patterns', nargs='*', metavar='PATTERN',
+                        help='shell-style patterns of the benchmark names '
+                             'to run, e.g. "parse.*", defaults to all')
+    parser.add_argument('--rounds', type=int, default=5,
+                        help='timed rounds per benchmark')
+    parser.add_argument('--nodes', type=int, default=macro.DEFAULT_NODES,
+                        help='number of nodes of the fleet benchmarks')
+    parser.add_argument('--workers', type=int,
+                        default=macro.DEFAULT_WORKERS,
+                        help='concurrent workers of the fleet benchmarks')
+    parser.add_argument('--output', type=argparse.FileType('w'),
+                        default=sys.stdout,
+                        help='file to write the JSON results to')
+    parser.add_argument('--list', action='store_true',
+                        help='list the benchmarks and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in runner.BENCHMARKS.values():
+            print('%s (%s)' % (bench.name, bench.group))
+        return 0
+
+    logging.basicConfig(level=logging.ERROR)
+    results = runner.run(args.patterns, rounds=args.rounds,
+                         options={'nodes': args.nodes,
+                                  'workers': args.workers})
+    json.dump(results, args.output, indent=2)
+    args.output.write('\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
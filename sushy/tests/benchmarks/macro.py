@@ -0,0 +1,171 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Macrobenchmarks against the in-process Redfish emulator"""
+
+from concurrent import futures
+
+from sushy import auth as sushy_auth
+from sushy import main
+from sushy.resources.system import system
+from sushy.tests.benchmarks import runner
+from sushy.tests import emulator
+
+DEFAULT_NODES = 1000
+"""Default number of nodes of the fleet benchmarks"""
+
+DEFAULT_WORKERS = 32
+"""Default number of concurrent workers of the fleet benchmarks"""
+
+SYSTEM_PATH = '/redfish/v1/Systems/437XR1138R2'
+"""Path of the system served by the emulator"""
+
+_USERNAME = 'admin'
+_PASSWORD = 'password'
+
+
+class _Context(object):
+
+    def __init__(self, emu):
+        self.emulator = emu
+        self.executor = None
+        self.resources = []
+        self.workers = DEFAULT_WORKERS
+
+
+def _start_emulator(count, virtual_hosts=False):
+    emu = emulator.Emulator(virtual_hosts=virtual_hosts)
+    emu.add_bmcs(count, profile=emulator.BmcProfile(username=_USERNAME,
+                                                    password=_PASSWORD))
+    emu.start()
+    return _Context(emu)
+
+
+def _connect(emu, name):
+    conn = emu.connector(name)
+    conn.set_auth(sushy_auth.BasicAuth(_USERNAME, _PASSWORD))
+    conn.set_http_basic_auth(_USERNAME, _PASSWORD)
+    return conn
+
+
+def _stop_emulator(context):
+    if context.executor is not None:
+        context.executor.shutdown()
+    context.emulator.stop()
+
+
+def _cold_start_setup(options):
+    return _start_emulator(1)
+
+
+@runner.benchmark('sushy.cold_start', 'macro', iterations=5,
+                  setup=_cold_start_setup, teardown=_stop_emulator)
+def cold_start(context):
+    emu = context.emulator
+    auth = sushy_auth.SessionOrBasicAuth(_USERNAME, _PASSWORD)
+    main.Sushy(emu.url('bmc-0'), auth=auth,
+               connector=emu.connector('bmc-0'))
+    auth.close()
+
+
+def _read_power_state_once(context, **kwargs):
+    emu = context.emulator
+    auth = sushy_auth.SessionOrBasicAuth(_USERNAME, _PASSWORD)
+    root = main.Sushy(emu.url('bmc-0'), auth=auth,
+                      connector=emu.connector('bmc-0'), **kwargs)
+    root.get_system(SYSTEM_PATH).power_state
+    auth.close()
+
+
+@runner.benchmark('sushy.cold_power_read', 'macro', iterations=5,
+                  setup=_cold_start_setup, teardown=_stop_emulator)
+def cold_power_read(context):
+    _read_power_state_once(context)
+
+
+def _fast_start_setup(options):
+    context = _start_emulator(1)
+    # NOTE: warm the root document cache up, as a previous job would
+    _read_power_state_once(context, fast_start=True)
+    return context
+
+
+@runner.benchmark('sushy.fast_start_power_read', 'macro', iterations=5,
+                  setup=_fast_start_setup, teardown=_stop_emulator)
+def fast_start_power_read(context):
+    _read_power_state_once(context, fast_start=True)
+
+
+def _system_setup(options):
+    context = _start_emulator(1)
+    conn = _connect(context.emulator, 'bmc-0')
+    context.resources.append(system.System(conn, SYSTEM_PATH))
+    return context
+
+
+@runner.benchmark('system.refresh', 'macro', iterations=5,
+                  setup=_system_setup, teardown=_stop_emulator)
+def system_refresh(context):
+    resource = context.resources[0]
+    resource.refresh(force=True)
+    # NOTE: pull the commonly used sub-resources in as well
+    resource.processors.summary
+    resource.ethernet_interfaces.summary
+    resource.bios.attributes
+
+
+def _fleet_setup(options):
+    nodes = options.get('nodes', DEFAULT_NODES)
+    context = _start_emulator(nodes, virtual_hosts=True)
+    context.executor = futures.ThreadPoolExecutor(
+        max_workers=options.get('workers', DEFAULT_WORKERS))
+
+    def connect(name):
+        return system.System(_connect(context.emulator, name), SYSTEM_PATH)
+
+    context.resources = list(context.executor.map(connect,
+                                                  context.emulator.bmcs))
+    return context
+
+
+def _read_power_state(resource):
+    resource.refresh()
+    return resource.power_state
+
+
+@runner.benchmark('fleet.power_state_sweep', 'macro', iterations=1,
+                  setup=_fleet_setup, teardown=_stop_emulator)
+def power_state_sweep(context):
+    list(context.executor.map(_read_power_state, context.resources))
+
+
+def _probe_setup(options):
+    nodes = options.get('nodes', DEFAULT_NODES)
+    context = _start_emulator(nodes, virtual_hosts=True)
+    context.workers = options.get('workers', DEFAULT_WORKERS)
+    context.resources = [(_connect(context.emulator, name), SYSTEM_PATH)
+                         for name in context.emulator.bmcs]
+    return context
+
+
+@runner.benchmark('fleet.power_state_probe', 'macro', iterations=1,
+                  setup=_probe_setup, teardown=_stop_emulator)
+def power_state_probe(context):
+    system.probe_power_states(context.resources,
+                              max_workers=context.workers)
+
+
+@runner.benchmark('fleet.power_state_probe_select', 'macro', iterations=1,
+                  setup=_probe_setup, teardown=_stop_emulator)
+def power_state_probe_select(context):
+    system.probe_power_states(context.resources, select=True,
+                              max_workers=context.workers)
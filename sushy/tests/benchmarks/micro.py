@@ -0,0 +1,173 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Microbenchmarks of parsing, caching and registry lookups
+
+The resources are served from the unit test JSON samples by an in-memory
+connector, so no network is involved.
+"""
+
+import json
+import types
+from urllib import parse as urlparse
+
+import requests
+
+from sushy import connector as sushy_connector
+from sushy.resources import base
+from sushy.resources.chassis import chassis
+from sushy.resources.chassis.power import power
+from sushy.resources.chassis import sensor
+from sushy.resources.chassis.thermal import thermal
+from sushy.resources.manager import manager
+from sushy.resources.registry import message_registry
+from sushy.resources.system import bios
+from sushy.resources.system import ethernet_interface
+from sushy.resources.system import processor
+from sushy.resources.system.storage import drive
+from sushy.resources.system.storage import volume
+from sushy.resources.system import system
+from sushy.tests.benchmarks import runner
+from sushy.tests import emulator
+
+COLLECTION_SIZE = 100
+"""Number of members of the collection of the get_members benchmarks"""
+
+_PROCESSORS_PATH = '/redfish/v1/Systems/437XR1138R2/Processors'
+
+
+class SampleConnector(sushy_connector.Connector):
+    """Connector serving a Redfish tree from memory"""
+
+    def __init__(self, tree):
+        super(SampleConnector, self).__init__('http://sushy.invalid')
+        self._tree = tree
+
+    def _request(self, method, url, data=None, headers=None,
+                 **extra_session_req_kwargs):
+        path = emulator._normalize(urlparse.urlparse(url).path)
+        doc = self._tree.get(path)
+        response = requests.Response()
+        response.status_code = 404 if doc is None else 200
+        response._content = json.dumps(doc or {}).encode('utf-8')
+        response.encoding = 'utf-8'
+        return response
+
+
+def _sample_tree():
+    tree = emulator.load_samples()
+    cpu = tree[_PROCESSORS_PATH + '/CPU1']
+    members = []
+    for i in range(COLLECTION_SIZE):
+        path = '%s/CPU%d' % (_PROCESSORS_PATH, i)
+        tree[path] = dict(cpu, **{'@odata.id': path, 'Id': 'CPU%d' % i})
+        members.append({'@odata.id': path})
+    tree[_PROCESSORS_PATH] = dict(tree[_PROCESSORS_PATH], Members=members)
+    return tree
+
+
+# Resource class, sample path of the field parsing benchmarks
+_PARSED_RESOURCES = (
+    ('system', system.System, '/redfish/v1/Systems/437XR1138R2'),
+    ('chassis', chassis.Chassis, '/redfish/v1/Chassis/Blade1'),
+    ('manager', manager.Manager, '/redfish/v1/Managers/BMC'),
+    ('processor', processor.Processor, _PROCESSORS_PATH + '/CPU1'),
+    ('bios', bios.Bios, '/redfish/v1/Systems/437XR1138R2/BIOS'),
+    ('power', power.Power, '/redfish/v1/Chassis/MultiBladeEncl/Power'),
+    ('thermal', thermal.Thermal, '/redfish/v1/Chassis/Blade1/Thermal'),
+    ('drive', drive.Drive, '/redfish/v1/Systems/437XR1138R2/Storage/1/'
+                           'Drives/35D38F11ACEF7BD3'),
+    ('volume', volume.Volume, '/redfish/v1/Systems/437XR1138R2/Storage/1/'
+                              'Volumes/1'),
+    ('ethernet_interface', ethernet_interface.EthernetInterface,
+     '/redfish/v1/Systems/437XR1138R2/EthernetInterfaces/12446A3B0411'),
+    ('sensor', sensor.Sensor, '/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp'),
+)
+
+
+def _make_parse_setup(resource_type, path):
+    def setup(options):
+        conn = SampleConnector(_sample_tree())
+        resource = resource_type(conn, path, redfish_version='1.0.2')
+        return resource, resource.json
+    return setup
+
+
+def _parse(context):
+    resource, doc = context
+    resource._parse_attributes(doc)
+
+
+def _collect_fields(context):
+    resource, _doc = context
+    list(base._collect_fields(resource))
+
+
+for _name, _type, _path in _PARSED_RESOURCES:
+    runner.benchmark('parse.' + _name, 'micro', iterations=100,
+                     setup=_make_parse_setup(_type, _path))(_parse)
+
+runner.benchmark('collect_fields.system', 'micro', iterations=1000,
+                 setup=_make_parse_setup(*_PARSED_RESOURCES[0][1:]))(
+                     _collect_fields)
+
+
+def _registries_setup(options):
+    conn = SampleConnector(_sample_tree())
+    registry = message_registry.MessageRegistry(
+        conn, '/redfish/v1/Registries/Test/Test.1.0.json')
+    return {'Test.1.1.1': registry}
+
+
+@runner.benchmark('parse_message', 'micro', iterations=1000,
+                  setup=_registries_setup)
+def parse_message(registries):
+    field = types.SimpleNamespace(
+        message_id='Test.1.1.1.TooBig', message_args=['BootMode', 10],
+        severity=None, resolution=None, message=None)
+    message_registry.parse_message(registries, field)
+
+
+def _collection_setup(options):
+    return SampleConnector(_sample_tree())
+
+
+@runner.benchmark('get_members.cold', 'micro', iterations=5,
+                  setup=_collection_setup)
+def get_members_cold(conn):
+    processor.ProcessorCollection(conn, _PROCESSORS_PATH).get_members()
+
+
+def _warm_collection_setup(options):
+    collection = processor.ProcessorCollection(
+        _collection_setup(options), _PROCESSORS_PATH)
+    collection.get_members()
+    return collection
+
+
+@runner.benchmark('get_members.cached', 'micro', iterations=1000,
+                  setup=_warm_collection_setup)
+def get_members_cached(collection):
+    collection.get_members()
+
+
+def _system_setup(options):
+    conn = SampleConnector(_sample_tree())
+    resource = system.System(conn, '/redfish/v1/Systems/437XR1138R2')
+    resource.processors
+    return resource
+
+
+@runner.benchmark('cache_it.hit', 'micro', iterations=10000,
+                  setup=_system_setup)
+def cache_it_hit(resource):
+    resource.processors
@@ -0,0 +1,104 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import datetime
+import fnmatch
+import platform
+import statistics
+import time
+
+import pbr.version
+
+BENCHMARKS = collections.OrderedDict()
+"""Ordered dict of benchmark name to `Benchmark`"""
+
+Benchmark = collections.namedtuple(
+    'Benchmark', ['name', 'group', 'func', 'iterations', 'setup',
+                  'teardown'])
+"""A registered benchmark"""
+
+
+def benchmark(name, group, iterations=1, setup=None, teardown=None):
+    """Register a benchmark function
+
+    The function is called with the `context` returned by `setup` (None
+    without `setup`), `iterations` times per timed round.
+
+    :param name: The unique name of the benchmark.
+    :param group: The group of the benchmark, e.g. 'micro' or 'macro'.
+    :param iterations: The number of calls per timed round.
+    :param setup: A callable taking the runner options and returning the
+        context of the benchmark.
+    :param teardown: A callable taking the context, run once the
+        benchmark is done.
+    """
+    def decorator(func):
+        BENCHMARKS[name] = Benchmark(name, group, func, iterations, setup,
+                                     teardown)
+        return func
+    return decorator
+
+
+def _run_one(bench, rounds, options):
+    context = bench.setup(options) if bench.setup is not None else None
+
+    try:
+        timings = []
+        for _ in range(rounds):
+            started = time.perf_counter()
+            for _ in range(bench.iterations):
+                bench.func(context)
+            timings.append((time.perf_counter() - started) /
+                           bench.iterations)
+    finally:
+        if bench.teardown is not None:
+            bench.teardown(context)
+
+    return {
+        'name': bench.name,
+        'group': bench.group,
+        'iterations': bench.iterations,
+        'rounds': rounds,
+        'min': min(timings),
+        'max': max(timings),
+        'mean': statistics.mean(timings),
+        'median': statistics.median(timings),
+        'stdev': statistics.stdev(timings) if rounds > 1 else 0.0,
+    }
+
+
+def run(patterns=None, rounds=5, options=None):
+    """Run the registered benchmarks
+
+    :param patterns: A list of shell-style patterns of the benchmark
+        names to run, None to run all of them.
+    :param rounds: The number of timed rounds per benchmark.
+    :param options: A dict of options passed to the benchmark setups.
+    :returns: A JSON serializable dict of the results, timings being in
+        seconds per call.
+    """
+    results = []
+    for bench in BENCHMARKS.values():
+        if patterns and not any(fnmatch.fnmatch(bench.name, p)
+                                for p in patterns):
+            continue
+        results.append(_run_one(bench, rounds, options or {}))
+
+    return {
+        'sushy_version': pbr.version.VersionInfo('sushy').version_string(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.datetime.now(
+            datetime.timezone.utc).isoformat(),
+        'results': results,
+    }
@@ -0,0 +1,531 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""In-process Redfish emulator for load testing
+
+Serves a Redfish tree, by default the JSON samples of the unit tests, as
+any number of virtual BMCs from threaded HTTP servers, either one port
+per BMC or all BMCs behind a single port told apart by the Host header.
+Each BMC has its own copy-on-write state and its own `BmcProfile` of
+latency, bandwidth and misbehaviours. Usage:
+
+.. code-block:: python
+
+  with Emulator() as emu:
+      emu.add_bmcs(100, profile=BmcProfile(latency=0.05))
+      emu.start()
+      for name in emu.bmcs:
+          root = sushy.Sushy(emu.url(name), username='admin',
+                             password='password')
+"""
+
+import base64
+import collections
+import copy
+import datetime
+import glob
+import http.server
+import json
+import logging
+import os
+import random
+import threading
+import time
+import uuid
+import zipfile
+
+from sushy import connector as sushy_connector
+
+LOG = logging.getLogger(__name__)
+
+SAMPLES_DIR = os.path.join(os.path.dirname(__file__), 'unit', 'json_samples')
+"""Directory of the JSON samples served by default"""
+
+SESSIONS_PATH = '/redfish/v1/SessionService/Sessions'
+"""Path of the Sessions collection"""
+
+RESET_ACTION = 'ComputerSystem.Reset'
+"""Name of the reset action changing the power state of a system"""
+
+_POWER_STATES_AFTER_RESET = {
+    'On': 'On',
+    'ForceOn': 'On',
+    'ForceOff': 'Off',
+    'GracefulShutdown': 'Off',
+    'PushPowerButton': None,
+}
+
+
+# Samples lacking an @odata.id, but referred to by other samples
+_SAMPLE_PATHS = {
+    'message_registry.json': '/redfish/v1/Registries/Test/Test.1.0.json',
+}
+
+
+def _normalize(path):
+    return path.split('#', 1)[0].rstrip('/') or '/'
+
+
+def load_samples(directory=SAMPLES_DIR):
+    """Build a Redfish tree out of a directory of JSON documents
+
+    Documents are keyed by their `@odata.id`, the one with the most
+    properties winning when several share a path. Documents with no
+    `@odata.id` are skipped.
+
+    :param directory: The directory of the `*.json` files.
+    :returns: A dict of path to JSON document
+    """
+    tree = {}
+    for filename in sorted(glob.glob(os.path.join(directory, '*.json'))):
+        with open(filename) as f:
+            try:
+                doc = json.load(f)
+            except ValueError:
+                continue
+        path = _SAMPLE_PATHS.get(os.path.basename(filename))
+        if path is None and isinstance(doc, dict):
+            path = doc.get('@odata.id')
+        if isinstance(path, str):
+            path = _normalize(path)
+            if len(doc) > len(tree.get(path, ())):
+                tree[path] = doc
+    return tree
+
+
+def load_recording(filename):
+    """Build a Redfish tree out of a recording archive
+
+    :param filename: The path of an archive written by
+        `sushy.recorder.ArchiveRecorder`.
+    :returns: A dict of path to JSON document
+    """
+    tree = {}
+    with zipfile.ZipFile(filename) as archive:
+        index = json.loads(archive.read('recording.json').decode('utf-8'))
+        for entry in index['entries']:
+            if entry['method'] != 'GET' or entry['status'] != 200:
+                continue
+            try:
+                doc = json.loads(archive.read(entry['body']).decode('utf-8'))
+            except ValueError:
+                continue
+            tree[_normalize(entry['url'].split('?', 1)[0])] = doc
+    return tree
+
+
+class BmcProfile(object):
+    """Behaviour of a virtual BMC"""
+
+    def __init__(self, latency=0.0, bandwidth=None, close_connection=False,
+                 burst_every=0, burst_length=0, retry_after=1,
+                 max_sessions=None, username='admin', password='password'):
+        """A class representing the behaviour of a virtual BMC
+
+        :param latency: Seconds to wait before responding, or a (min, max)
+            tuple to pick the wait from uniformly.
+        :param bandwidth: Bytes per second to send response bodies at,
+            None for no limit.
+        :param close_connection: Whether to close the connection after
+            each response, whatever the client asks for.
+        :param burst_every: Period, in requests, of the bursts of
+            503 responses, 0 for no bursts.
+        :param burst_length: Number of requests answered with 503 at the
+            end of each period.
+        :param retry_after: The Retry-After value of the 503 responses.
+        :param max_sessions: Maximum number of concurrent sessions, None
+            for no limit.
+        :param username: The valid user name.
+        :param password: The valid password.
+        """
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.close_connection = close_connection
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.retry_after = retry_after
+        self.max_sessions = max_sessions
+        self.username = username
+        self.password = password
+
+    def get_latency(self):
+        if isinstance(self.latency, (tuple, list)):
+            return random.uniform(*self.latency)
+        return self.latency
+
+
+class VirtualBmc(object):
+    """State of a virtual BMC"""
+
+    def __init__(self, name, tree, profile):
+        self.name = name
+        self.profile = profile
+        self._tree = tree
+        self._changed = {}
+        self._sessions = {}
+        self._session_docs = {}
+        self._lock = threading.Lock()
+        self.requests = collections.Counter()
+        """Counter of the requests served per method"""
+
+    def _get_doc(self, path):
+        doc = self._changed.get(path)
+        if doc is None:
+            doc = self._tree.get(path)
+        return doc
+
+    def _get_mutable_doc(self, path):
+        doc = self._changed.get(path)
+        if doc is None and path in self._tree:
+            doc = self._changed[path] = copy.deepcopy(self._tree[path])
+        return doc
+
+    def count_request(self, method):
+        """Count a request, telling whether it falls into a 503 burst"""
+        with self._lock:
+            count = sum(self.requests.values())
+            self.requests[method] += 1
+        every = self.profile.burst_every
+        return bool(every and
+                    count % every >= every - self.profile.burst_length)
+
+    def authenticate(self, headers):
+        token = headers.get('X-Auth-Token')
+        if token:
+            with self._lock:
+                return token in self._sessions
+
+        auth = headers.get('Authorization') or ''
+        if auth.startswith('Basic '):
+            try:
+                user, _, password = base64.b64decode(
+                    auth[6:]).decode('utf-8').partition(':')
+            except ValueError:
+                return False
+            return (user == self.profile.username and
+                    password == self.profile.password)
+        return False
+
+    def create_session(self, data):
+        """Create a session, returning (status, headers, doc)"""
+        if (data.get('UserName') != self.profile.username or
+                data.get('Password') != self.profile.password):
+            return 401, {}, None
+
+        with self._lock:
+            if (self.profile.max_sessions is not None and
+                    len(self._sessions) >= self.profile.max_sessions):
+                return 503, {'Retry-After': str(self.profile.retry_after)}, {
+                    'error': {'code': 'Base.1.0.SessionLimitExceeded',
+                              'message': 'The session establishment failed '
+                                         'due to the number of simultaneous '
+                                         'sessions exceeding the limit.'}}
+
+            identity = uuid.uuid4().hex
+            token = uuid.uuid4().hex
+            path = '%s/%s' % (SESSIONS_PATH, identity)
+            doc = {'@odata.id': path,
+                   '@odata.type': '#Session.v1_5_0.Session',
+                   'Id': identity, 'Name': 'User Session',
+                   'UserName': data['UserName'],
+                   'CreatedTime': datetime.datetime.now(
+                       datetime.timezone.utc).isoformat()}
+            self._sessions[token] = path
+            self._session_docs[path] = doc
+
+        return 201, {'X-Auth-Token': token, 'Location': path}, doc
+
+    def delete_session(self, path):
+        with self._lock:
+            for token, session_path in list(self._sessions.items()):
+                if session_path == path:
+                    del self._sessions[token]
+                    del self._session_docs[path]
+                    return True
+        return False
+
+    @property
+    def sessions(self):
+        """The paths of the open sessions"""
+        with self._lock:
+            return list(self._sessions.values())
+
+    def get(self, path):
+        if path == SESSIONS_PATH:
+            return {'@odata.id': SESSIONS_PATH,
+                    '@odata.type': '#SessionCollection.SessionCollection',
+                    'Name': 'Session Collection',
+                    'Members': [{'@odata.id': p} for p in self.sessions]}
+        with self._lock:
+            if path in self._session_docs:
+                return copy.deepcopy(self._session_docs[path])
+            return self._get_doc(path)
+
+    def patch(self, path, data):
+        with self._lock:
+            doc = self._get_mutable_doc(path)
+            if doc is None:
+                return None
+            doc.update(data)
+            return copy.deepcopy(doc)
+
+    def reset(self, path, data):
+        """Run a reset action, returning False for unknown resources"""
+        target = _normalize(path.split('/Actions/', 1)[0])
+        state = _POWER_STATES_AFTER_RESET.get(data.get('ResetType'), 'On')
+        with self._lock:
+            doc = self._get_mutable_doc(target)
+            if doc is None:
+                return False
+            if state is None:
+                state = 'Off' if doc.get('PowerState') == 'On' else 'On'
+            doc['PowerState'] = state
+        return True
+
+
+def _select(doc, query):
+    for param in query.split('&'):
+        name, _, value = param.partition('=')
+        if name == '$select' and value:
+            props = value.split(',')
+            return {k: v for k, v in doc.items()
+                    if k in props or k.startswith('@odata.')}
+    return doc
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        LOG.debug('%s - %s', self.address_string(), format % args)
+
+    def _bmc(self):
+        return self.server.emulator._resolve(self.server, self.headers)
+
+    def _read_json(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        if not length:
+            return {}
+        try:
+            return json.loads(self.rfile.read(length).decode('utf-8'))
+        except ValueError:
+            return {}
+
+    def _send(self, bmc, status, doc=None, headers=None):
+        body = json.dumps(doc).encode('utf-8') if doc is not None else b''
+        self.send_response(status)
+        if body:
+            self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('OData-Version', '4.0')
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if ((bmc is not None and bmc.profile.close_connection) or
+                self.headers.get('Connection', '').lower() == 'close'):
+            self.send_header('Connection', 'close')
+            self.close_connection = True
+        self.end_headers()
+
+        bandwidth = bmc.profile.bandwidth if bmc is not None else None
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+
+        chunk = max(1, int(bandwidth / 10))
+        for offset in range(0, len(body), chunk):
+            data = body[offset:offset + chunk]
+            time.sleep(len(data) / float(bandwidth))
+            self.wfile.write(data)
+
+    def _handle(self, method):
+        bmc = self._bmc()
+        data = self._read_json() if method in ('POST', 'PATCH') else {}
+        if bmc is None:
+            self._send(None, 404)
+            return
+
+        latency = bmc.profile.get_latency()
+        if latency:
+            time.sleep(latency)
+
+        if bmc.count_request(method):
+            self._send(bmc, 503,
+                       headers={'Retry-After': str(bmc.profile.retry_after)})
+            return
+
+        path, _, query = self.path.partition('?')
+        path = _normalize(path)
+
+        if method == 'POST' and path == SESSIONS_PATH:
+            status, headers, doc = bmc.create_session(data)
+            self._send(bmc, status, doc, headers)
+            return
+
+        if (path not in ('/redfish/v1', '/redfish') and
+                not bmc.authenticate(self.headers)):
+            self._send(bmc, 401)
+            return
+
+        if method == 'GET':
+            doc = bmc.get(path)
+            if doc is None:
+                self._send(bmc, 404)
+            else:
+                self._send(bmc, 200, _select(doc, query))
+        elif method == 'PATCH':
+            doc = bmc.patch(path, data)
+            self._send(bmc, 404 if doc is None else 200, doc)
+        elif method == 'DELETE' and path.startswith(SESSIONS_PATH + '/'):
+            self._send(bmc, 204 if bmc.delete_session(path) else 404)
+        elif method == 'POST' and path.endswith('/Actions/' + RESET_ACTION):
+            self._send(bmc, 204 if bmc.reset(path, data) else 404)
+        else:
+            self._send(bmc, 405)
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+    def do_PATCH(self):
+        self._handle('PATCH')
+
+    def do_DELETE(self):
+        self._handle('DELETE')
+
+
+class _Server(http.server.ThreadingHTTPServer):
+
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(self, address, emulator, bmc=None):
+        super(_Server, self).__init__(address, _Handler)
+        self.emulator = emulator
+        self.bmc = bmc
+
+
+class Emulator(object):
+    """A fleet of virtual BMCs served over HTTP"""
+
+    def __init__(self, tree=None, host='127.0.0.1', virtual_hosts=False):
+        """A class representing a fleet of virtual BMCs
+
+        :param tree: The default Redfish tree of the BMCs, a dict of path
+            to JSON document, defaults to the unit test samples.
+        :param host: The address to listen on.
+        :param virtual_hosts: Whether to serve all the BMCs from a single
+            port, telling them apart by the Host header, instead of one
+            port per BMC.
+        """
+        self._tree = tree if tree is not None else load_samples()
+        self._host = host
+        self._virtual_hosts = virtual_hosts
+        self._servers = []
+        self._threads = []
+        self.bmcs = collections.OrderedDict()
+        """Ordered dict of name to `VirtualBmc`"""
+
+    def add_bmc(self, name, profile=None, tree=None):
+        """Add a virtual BMC, before starting the emulator
+
+        :param name: The name of the BMC, used as Host header with
+            virtual hosts.
+        :param profile: The `BmcProfile` of the BMC.
+        :param tree: The Redfish tree of the BMC, defaults to the one of
+            the emulator.
+        :returns: The `VirtualBmc` object
+        """
+        bmc = VirtualBmc(name, self._tree if tree is None else tree,
+                         profile or BmcProfile())
+        self.bmcs[name] = bmc
+        return bmc
+
+    def add_bmcs(self, count, profile=None, prefix='bmc-'):
+        """Add many identical virtual BMCs
+
+        :param count: The number of BMCs to add.
+        :param profile: The `BmcProfile` shared by the BMCs.
+        :param prefix: The prefix of the BMC names.
+        :returns: A list of `VirtualBmc` objects
+        """
+        start = len(self.bmcs)
+        return [self.add_bmc('%s%d' % (prefix, i), profile)
+                for i in range(start, start + count)]
+
+    def _resolve(self, server, headers):
+        if server.bmc is not None:
+            return server.bmc
+        host = (headers.get('Host') or '').rsplit(':', 1)[0]
+        return self.bmcs.get(host)
+
+    def _serve(self, bmc=None):
+        server = _Server((self._host, 0), self, bmc)
+        thread = threading.Thread(target=server.serve_forever,
+                                  kwargs={'poll_interval': 0.1})
+        thread.daemon = True
+        thread.start()
+        self._servers.append(server)
+        self._threads.append(thread)
+        return server
+
+    def start(self):
+        """Start serving the virtual BMCs"""
+        if self._virtual_hosts:
+            server = self._serve()
+            for bmc in self.bmcs.values():
+                bmc.port = server.server_address[1]
+        else:
+            for bmc in self.bmcs.values():
+                bmc.port = self._serve(bmc).server_address[1]
+        LOG.debug('Emulating %(count)d BMCs on %(ports)d ports',
+                  {'count': len(self.bmcs), 'ports': len(self._servers)})
+
+    def stop(self):
+        """Stop serving the virtual BMCs"""
+        for server in self._servers:
+            server.shutdown()
+            server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._servers = []
+        self._threads = []
+
+    def url(self, name):
+        """The base URL of a virtual BMC
+
+        :param name: The name of the BMC.
+        """
+        return 'http://%s:%d' % (self._host, self.bmcs[name].port)
+
+    def connector(self, name, **kwargs):
+        """Build a connector to a virtual BMC
+
+        With virtual hosts, the connector sends the Host header of the
+        BMC.
+
+        :param name: The name of the BMC.
+        :param kwargs: Extra arguments for the `Connector`.
+        :returns: A `Connector` object
+        """
+        conn = sushy_connector.Connector(self.url(name), **kwargs)
+        if self._virtual_hosts:
+            conn._session.headers['Host'] = name
+        return conn
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_args):
+        self.stop()
@@ -19,6 +19,9 @@ import mock
 import sushy
 from sushy import exceptions
 from sushy.resources.chassis import chassis
+from sushy.resources.chassis import powersubsystem
+from sushy.resources.chassis import sensor
+from sushy.resources.chassis import thermalsubsystem
 from sushy.resources.manager import manager
 from sushy.resources.system import system
 from sushy.tests.unit import base
@@ -123,12 +126,14 @@ class ChassisTestCase(base.TestCase):
                           self.chassis.reset_chassis, 'invalid-value')
 
     def test_set_indicator_led(self):
+        self.conn.write_through = False
         with mock.patch.object(
                 self.chassis, 'invalidate', autospec=True) as invalidate_mock:
             self.chassis.set_indicator_led(sushy.INDICATOR_LED_BLINKING)
             self.chassis._conn.patch.assert_called_once_with(
                 '/redfish/v1/Chassis/Blade1',
-                data={'IndicatorLED': 'Blinking'})
+                data={'IndicatorLED': 'Blinking'},
+                headers={'Prefer': 'return=representation'})
 
             invalidate_mock.assert_called_once_with()
 
@@ -161,6 +166,50 @@ class ChassisTestCase(base.TestCase):
         self.assertEqual(
             '/redfish/v1/Systems/529QB9450R6', actual_systems[0].path)
 
+    def test_sensors(self):
+        # | GIVEN |
+        with open('sushy/tests/unit/json_samples/'
+                  'sensor_collection.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        # | WHEN & THEN |
+        actual_sensors = self.chassis.sensors
+        self.assertIsInstance(actual_sensors, sensor.SensorCollection)
+        self.assertEqual('/redfish/v1/Chassis/Blade1/Sensors',
+                         actual_sensors.path)
+        self.assertIs(actual_sensors, self.chassis.sensors)
+
+    def test_sensors_missing(self):
+        self.chassis._json.pop('Sensors')
+        self.assertRaisesRegex(exceptions.MissingAttributeError,
+                               'Sensors', getattr, self.chassis, 'sensors')
+
+    def test_power_subsystem(self):
+        # | GIVEN |
+        with open('sushy/tests/unit/json_samples/'
+                  'powersubsystem.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        # | WHEN & THEN |
+        actual = self.chassis.power_subsystem
+        self.assertIsInstance(actual, powersubsystem.PowerSubsystem)
+        self.assertEqual(2000, actual.capacity_watts)
+        self.assertEqual(1200, actual.allocation.allocated_watts)
+        self.assertEqual(1500, actual.allocation.requested_watts)
+        self.assertEqual(sushy.HEALTH_OK, actual.status.health)
+
+    def test_thermal_subsystem(self):
+        # | GIVEN |
+        with open('sushy/tests/unit/json_samples/'
+                  'thermalsubsystem.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        # | WHEN & THEN |
+        actual = self.chassis.thermal_subsystem
+        self.assertIsInstance(actual, thermalsubsystem.ThermalSubsystem)
+        self.assertEqual('ThermalSubsystem', actual.identity)
+        self.assertEqual(sushy.STATE_ENABLED, actual.status.state)
+
 
 class ChassisCollectionTestCase(base.TestCase):
 
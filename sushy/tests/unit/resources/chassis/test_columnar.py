@@ -0,0 +1,130 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+import math
+import unittest
+
+import mock
+
+from sushy import exceptions
+from sushy.resources.chassis import columnar
+from sushy.resources.chassis.power import power
+from sushy.resources.chassis.thermal import thermal
+from sushy.resources import constants as res_cons
+from sushy.tests.unit import base
+
+
+class SensorTableTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SensorTableTestCase, self).setUp()
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/thermal.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        self.thermal = thermal.Thermal(conn, '/redfish/v1/Chassis/1/Thermal')
+
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/power.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        self.power = power.Power(conn, '/redfish/v1/Chassis/2/Power')
+
+        self.table = columnar.export_sensor_readings(
+            [self.thermal, self.power])
+
+    def test_export(self):
+        self.assertEqual(4, len(self.table))
+        self.assertEqual(['/redfish/v1/Chassis/1'] * 2 +
+                         ['/redfish/v1/Chassis/2'] * 2,
+                         self.table['chassis'])
+        self.assertEqual(['temperature', 'fan', 'power_supply',
+                          'power_supply'], self.table['kind'])
+        self.assertEqual(['0', '0', '0', '1'], self.table['sensor'])
+        self.assertEqual(['Cel', 'RPM', 'W', 'W'], self.table['units'])
+        self.assertEqual([62, 6000, 650, 635], list(self.table['reading']))
+        self.assertEqual(90, self.table['upper_threshold_critical'][0])
+        self.assertTrue(math.isnan(self.table['upper_threshold_critical'][1]))
+        self.assertEqual(2000, self.table['lower_threshold_fatal'][1])
+        self.assertEqual([res_cons.HEALTH_OK] * 4, self.table['health'])
+        self.assertEqual([res_cons.STATE_ENABLED] * 4, self.table['state'])
+
+    def test_export_single_resource(self):
+        table = columnar.export_sensor_readings(self.thermal)
+        self.assertEqual(2, len(table))
+
+    def test_add_resource_chassis(self):
+        table = columnar.SensorTable()
+        table.add_resource(self.power, chassis='Enclosure1')
+        self.assertEqual(['Enclosure1'] * 2, table['chassis'])
+
+    def test_add_resource_voltages(self):
+        self.power.json['Voltages'] = [{
+            'MemberId': '0', 'Name': 'VRM1 Voltage', 'ReadingVolts': 12.1,
+            'UpperThresholdCritical': 13,
+            'Status': {'State': 'Enabled', 'Health': 'OK'}}]
+        table = columnar.SensorTable()
+        table.add_resource(self.power)
+        self.assertEqual(['power_supply', 'power_supply', 'voltage'],
+                         table['kind'])
+        self.assertEqual(['W', 'W', 'V'], table['units'])
+        self.assertEqual(12.1, table['reading'][2])
+        self.assertEqual(13, table['upper_threshold_critical'][2])
+        self.assertEqual(res_cons.HEALTH_OK, table['health'][2])
+
+    def test_add_resource_malformed_reading(self):
+        self.thermal.json['Temperatures'][0]['ReadingCelsius'] = 'n/a'
+        table = columnar.export_sensor_readings(self.thermal)
+        self.assertTrue(math.isnan(table['reading'][0]))
+
+    @mock.patch.object(columnar, '_get_numpy', autospec=True,
+                       return_value=None)
+    def test_find_breaches(self, mock_numpy):
+        self.thermal.json['Temperatures'][0]['ReadingCelsius'] = 90
+        table = columnar.export_sensor_readings([self.thermal, self.power])
+        self.assertEqual([0], table.find_breaches())
+        self.assertEqual([], table.find_breaches('upper_threshold_fatal'))
+        self.assertEqual([], table.find_breaches('lower_threshold_fatal'))
+        self.thermal.json['Fans'][0]['Reading'] = 1500
+        table = columnar.export_sensor_readings(self.thermal)
+        self.assertEqual([1], table.find_breaches('lower_threshold_fatal'))
+
+    def test_find_breaches_invalid_threshold(self):
+        self.assertRaises(exceptions.InvalidParameterValueError,
+                          self.table.find_breaches, 'reading')
+
+    def test_rows(self):
+        rows = self.table.rows([0, 3])
+        self.assertEqual(2, len(rows))
+        self.assertEqual('CPU Temp', rows[0]['name'])
+        self.assertEqual(62, rows[0]['reading'])
+        self.assertEqual('power_supply', rows[1]['kind'])
+        self.assertEqual(635, rows[1]['reading'])
+
+    @mock.patch.object(columnar, '_get_numpy', autospec=True,
+                       return_value=None)
+    def test_to_numpy_not_installed(self, mock_numpy):
+        self.assertRaisesRegex(exceptions.ExtensionError, 'NumPy',
+                               self.table.to_numpy)
+
+    @unittest.skipUnless(columnar._get_numpy(), 'NumPy is not installed')
+    def test_to_numpy(self):
+        arrays = self.table.to_numpy()
+        self.assertEqual('float64', arrays['reading'].dtype.name)
+        self.assertEqual([62, 6000, 650, 635], arrays['reading'].tolist())
+        self.assertEqual('object', arrays['chassis'].dtype.name)
+
+    @unittest.skipUnless(columnar._get_numpy(), 'NumPy is not installed')
+    def test_find_breaches_numpy(self):
+        self.thermal.json['Temperatures'][0]['ReadingCelsius'] = 91
+        table = columnar.export_sensor_readings([self.thermal, self.power])
+        self.assertEqual([0], table.find_breaches())
+        self.assertEqual([], table.find_breaches('lower_threshold_fatal'))
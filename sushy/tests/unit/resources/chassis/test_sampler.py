@@ -0,0 +1,176 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+
+from sushy import exceptions
+from sushy.resources.chassis.power import power
+from sushy.resources.chassis import sampler
+from sushy.resources.chassis.thermal import thermal
+from sushy.tests.unit import base
+
+
+class RingBufferTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RingBufferTestCase, self).setUp()
+        self.buf = sampler.RingBuffer(3)
+
+    def test_init_invalid_capacity(self):
+        self.assertRaises(ValueError, sampler.RingBuffer, 0)
+
+    def test_append(self):
+        self.buf.append(1, timestamp=10)
+        self.buf.append(None, timestamp=11)
+        self.buf.append(2, timestamp=12)
+        self.assertEqual(2, len(self.buf))
+        self.assertEqual((12, 2), self.buf.last)
+        timestamps, values = self.buf.window()
+        self.assertEqual([10, 12], list(timestamps))
+        self.assertEqual([1, 2], list(values))
+
+    def test_append_wraps_around(self):
+        for i in range(5):
+            self.buf.append(i, timestamp=i)
+        self.assertEqual(3, len(self.buf))
+        self.assertEqual(3, self.buf.capacity)
+        timestamps, values = self.buf.window()
+        self.assertEqual([2, 3, 4], list(timestamps))
+        self.assertEqual([2, 3, 4], list(values))
+
+    def test_window(self):
+        for i in range(5):
+            self.buf.append(i * 10, timestamp=100 + i)
+        self.assertEqual([30, 40],
+                         list(self.buf.window(seconds=1.5, now=104.5)[1]))
+        self.assertEqual([40], list(self.buf.window(samples=1)[1]))
+        self.assertEqual([], list(self.buf.window(seconds=1, now=200)[1]))
+
+    def test_stats(self):
+        for i, value in enumerate((5, 1, 9, 3)):
+            self.buf.append(value, timestamp=i)
+        self.assertEqual(sampler.WindowStats(3, 1, 9, 13 / 3.0),
+                         self.buf.stats())
+        self.assertEqual(sampler.WindowStats(2, 3, 9, 6),
+                         self.buf.stats(samples=2))
+
+    def test_stats_empty(self):
+        self.assertEqual(sampler.WindowStats(0, None, None, None),
+                         self.buf.stats())
+        self.assertIsNone(self.buf.last)
+
+
+class TelemetrySamplerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(TelemetrySamplerTestCase, self).setUp()
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/power.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        self.power = power.Power(conn, '/redfish/v1/Chassis/1/Power')
+
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/thermal.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        self.thermal = thermal.Thermal(conn, '/redfish/v1/Chassis/1/Thermal')
+
+        self.chassis = mock.Mock(path='/redfish/v1/Chassis/1',
+                                 power=self.power, thermal=self.thermal)
+        self.sampler = sampler.TelemetrySampler(self.chassis, capacity=10)
+
+    def test_sample(self):
+        self.sampler.sample()
+        self.sampler.sample()
+
+        buffers = self.sampler.buffers
+        self.assertEqual(6, len(buffers))
+        key = sampler.SensorKey('/redfish/v1/Chassis/1', 'thermal',
+                                'temperatures/0', 'reading_celsius')
+        self.assertEqual(2, len(buffers[key]))
+        self.assertEqual(62, buffers[key].last[1])
+        key = sampler.SensorKey('/redfish/v1/Chassis/1', 'power',
+                                'power_supplies/1',
+                                'last_power_output_watts')
+        self.assertEqual(635, buffers[key].last[1])
+        key = sampler.SensorKey('/redfish/v1/Chassis/1', 'thermal',
+                                'fans/0', 'reading')
+        self.assertEqual(6000, buffers[key].last[1])
+
+    def test_sample_refreshes_resources(self):
+        with mock.patch.object(self.power, 'refresh',
+                               autospec=True) as mock_refresh:
+            self.sampler.sample()
+        mock_refresh.assert_called_once_with()
+
+    def test_sample_missing_resource(self):
+        type(self.chassis).power = mock.PropertyMock(
+            side_effect=exceptions.MissingAttributeError(
+                attribute='Power', resource='/redfish/v1/Chassis/1'))
+        self.sampler.sample()
+        self.assertEqual({'thermal'},
+                         {k.resource for k in self.sampler.buffers})
+
+    def test_sample_error(self):
+        with mock.patch.object(
+                self.thermal, 'refresh', autospec=True,
+                side_effect=exceptions.ConnectionError(url='x', error='y')):
+            self.sampler.sample()
+        self.assertEqual({'power'},
+                         {k.resource for k in self.sampler.buffers})
+
+    def test_custom_readings(self):
+        smp = sampler.TelemetrySampler(
+            [self.chassis],
+            readings=[('power', 'power_supplies', 'power_capacity_watts')])
+        smp.sample()
+        self.assertEqual(
+            [1450, 1450],
+            [b.last[1] for b in smp.buffers.values()])
+
+    def test_stats(self):
+        self.sampler.sample()
+        stats = self.sampler.stats(samples=5)
+        key = sampler.SensorKey('/redfish/v1/Chassis/1', 'power',
+                                'power_supplies/0', 'line_input_voltage')
+        self.assertEqual(sampler.WindowStats(1, 220, 220, 220), stats[key])
+
+    def test_start_stop(self):
+        with mock.patch.object(self.sampler, 'sample',
+                               autospec=True) as mock_sample:
+            mock_sample.side_effect = lambda: self.sampler._stop_event.set()
+            self.sampler.start()
+            self.sampler._thread.join(5)
+            self.sampler.stop()
+        mock_sample.assert_called_once_with()
+        self.assertIsNone(self.sampler._thread)
+        self.assertIsNone(self.sampler.last_error)
+
+    def test_start_unexpected_error(self):
+        error = ValueError('malformed reading')
+
+        def _sample():
+            if mock_sample.call_count == 2:
+                self.sampler._stop_event.set()
+                raise error
+            raise TypeError('callback failed')
+
+        self.sampler._interval = 0
+        with mock.patch.object(self.sampler, 'sample',
+                               autospec=True) as mock_sample:
+            mock_sample.side_effect = _sample
+            self.sampler.start()
+            self.sampler._thread.join(5)
+            self.sampler.stop()
+        self.assertEqual(2, mock_sample.call_count)
+        self.assertIs(error, self.sampler.last_error)
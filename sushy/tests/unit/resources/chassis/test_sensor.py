@@ -0,0 +1,194 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+
+import sushy
+from sushy import exceptions
+from sushy.resources.chassis import sensor
+from sushy.tests.unit import base
+
+
+class SensorTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SensorTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/sensor.json') as f:
+            self.json_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+        self.sensor = sensor.Sensor(
+            self.conn, '/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp',
+            redfish_version='1.8.0')
+
+    def test__parse_attributes(self):
+        self.sensor._parse_attributes(self.json_doc)
+        self.assertEqual('CPU1Temp', self.sensor.identity)
+        self.assertEqual('CPU 1 Temperature', self.sensor.name)
+        self.assertEqual('Temperature', self.sensor.reading_type)
+        self.assertEqual(62, self.sensor.reading)
+        self.assertEqual('Cel', self.sensor.reading_units)
+        self.assertEqual(0, self.sensor.reading_range_min)
+        self.assertEqual(120, self.sensor.reading_range_max)
+        self.assertEqual('CPU', self.sensor.physical_context)
+        self.assertEqual(sushy.STATE_ENABLED, self.sensor.status.state)
+        self.assertEqual(sushy.HEALTH_OK, self.sensor.status.health)
+        self.assertEqual(80, self.sensor.thresholds.upper_caution.reading)
+        self.assertEqual(90, self.sensor.thresholds.upper_critical.reading)
+        self.assertEqual(100, self.sensor.thresholds.upper_fatal.reading)
+        self.assertEqual(5, self.sensor.thresholds.lower_critical.reading)
+        self.assertIsNone(self.sensor.thresholds.lower_fatal)
+
+
+class SensorCollectionTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SensorCollectionTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'sensor_collection.json') as f:
+            self.json_doc = json.load(f)
+        with open('sushy/tests/unit/json_samples/'
+                  'sensor_collection_expanded.json') as f:
+            self.expanded_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+        self.sensors = sensor.SensorCollection(
+            self.conn, '/redfish/v1/Chassis/Blade1/Sensors',
+            redfish_version='1.8.0')
+
+    def test__parse_attributes(self):
+        self.sensors._parse_attributes(self.json_doc)
+        self.assertEqual(
+            ('/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp',
+             '/redfish/v1/Chassis/Blade1/Sensors/PS1Power'),
+            self.sensors.members_identities)
+
+    def test_get_readings_expand_excerpt(self):
+        self.conn.get.return_value.json.return_value = self.expanded_doc
+        features = mock.Mock(expand_query=True, excerpt_query=True,
+                             select_query=True)
+
+        readings = self.sensors.get_readings(features)
+
+        self.conn.get.assert_called_with(
+            path='/redfish/v1/Chassis/Blade1/Sensors'
+                 '?$expand=.($levels=1)&excerpt')
+        self.assertEqual(['CPU1Temp', 'PS1Power'],
+                         [r.identity for r in readings])
+        self.assertEqual([62, 350.5], [r.reading for r in readings])
+        self.assertEqual(['Cel', 'W'], [r.reading_units for r in readings])
+        self.assertEqual([sushy.HEALTH_OK, sushy.HEALTH_WARNING],
+                         [r.health for r in readings])
+        self.assertEqual(sushy.STATE_ENABLED, readings[0].state)
+        self.assertEqual('/redfish/v1/Chassis/Blade1/Sensors/PS1Power',
+                         readings[1].path)
+
+    def test_get_readings_expand_select(self):
+        self.conn.get.return_value.json.return_value = self.expanded_doc
+
+        self.sensors.get_readings(expand=True, select=True)
+
+        self.conn.get.assert_called_with(
+            path='/redfish/v1/Chassis/Blade1/Sensors'
+                 '?$expand=.($levels=1)&$select=Id,Reading,ReadingUnits,'
+                 'Status')
+
+    def test_get_readings_expand_ignored(self):
+        member = self.expanded_doc['Members'][0]
+        self.conn.get.return_value.json.side_effect = [
+            self.json_doc, dict(member), dict(member)]
+
+        readings = self.sensors.get_readings(expand=True, excerpt=True)
+
+        self.assertEqual(2, len(readings))
+        self.conn.get.assert_has_calls([
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors'
+                           '?$expand=.($levels=1)&excerpt'),
+            mock.call().json(),
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp'
+                           '?excerpt'),
+            mock.call().json(),
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/PS1Power'
+                           '?excerpt'),
+            mock.call().json()])
+
+    def test_get_readings_expand_rejected(self):
+        member = self.expanded_doc['Members'][0]
+        self.conn.get.return_value.json.side_effect = [
+            dict(member), dict(member)]
+        self.conn.get.side_effect = [
+            exceptions.BadRequestError(
+                'GET', '/redfish/v1/Chassis/Blade1/Sensors',
+                mock.MagicMock()),
+            self.conn.get.return_value, self.conn.get.return_value]
+
+        readings = self.sensors.get_readings(expand=True)
+
+        self.assertEqual(2, len(readings))
+        self.conn.get.assert_has_calls([
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors'
+                           '?$expand=.($levels=1)'),
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp'),
+            mock.call().json(),
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/PS1Power'),
+            mock.call().json()])
+
+    def test_get_readings_expand_without_reading(self):
+        doc = dict(self.expanded_doc)
+        doc['Members'] = [dict(m) for m in doc['Members']]
+        del doc['Members'][1]['Reading']
+        self.conn.get.return_value.json.return_value = doc
+        self.conn.get.reset_mock()
+
+        readings = self.sensors.get_readings(expand=True)
+
+        self.conn.get.assert_called_once_with(
+            path='/redfish/v1/Chassis/Blade1/Sensors?$expand=.($levels=1)')
+        self.assertEqual(2, len(readings))
+        self.assertIsNone(readings[1].reading)
+
+    def test_get_readings_no_features(self):
+        member = self.expanded_doc['Members'][1]
+        doc = {k: v for k, v in member.items() if k != '@odata.id'}
+        self.conn.get.return_value.json.side_effect = [doc, dict(doc)]
+
+        readings = self.sensors.get_readings()
+
+        self.conn.get.assert_has_calls([
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp'),
+            mock.call().json(),
+            mock.call(path='/redfish/v1/Chassis/Blade1/Sensors/PS1Power'),
+            mock.call().json()])
+        self.assertEqual('/redfish/v1/Chassis/Blade1/Sensors/CPU1Temp',
+                         readings[0].path)
+
+    def test_get_query_options(self):
+        self.assertEqual({'expand': False, 'excerpt': False,
+                          'select': False},
+                         sensor.get_query_options(None))
+        features = mock.Mock(expand_query=True, excerpt_query=None,
+                             select_query=True)
+        self.assertEqual({'expand': True, 'excerpt': False, 'select': True},
+                         sensor.get_query_options(features))
+
+    def test_get_query_options_expand_object(self):
+        expand_query = {'ExpandAll': False, 'Levels': False,
+                        'Links': False, 'MaxLevels': 0, 'NoLinks': False}
+        features = mock.Mock(expand_query=expand_query, excerpt_query=None,
+                             select_query=None)
+        self.assertFalse(sensor.get_query_options(features)['expand'])
+        expand_query.update(Levels=True, NoLinks=True, MaxLevels=6)
+        self.assertTrue(sensor.get_query_options(features)['expand'])
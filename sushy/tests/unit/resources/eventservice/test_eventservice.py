@@ -0,0 +1,68 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import mock
+
+from sushy import exceptions
+from sushy.resources import constants as res_cons
+from sushy.resources.eventservice import eventservice
+from sushy.resources.eventservice import sse
+from sushy.tests.unit import base
+
+
+class EventServiceTestCase(base.TestCase):
+
+    def setUp(self):
+        super(EventServiceTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/eventservice.json') as f:
+            self.json_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+
+        self.event_service = eventservice.EventService(
+            self.conn, '/redfish/v1/EventService', redfish_version='1.5.0')
+
+    def test__parse_attributes(self):
+        self.event_service._parse_attributes(self.json_doc)
+        self.assertEqual('1.5.0', self.event_service.redfish_version)
+        self.assertEqual('EventService', self.event_service.identity)
+        self.assertEqual('Event Service', self.event_service.name)
+        self.assertTrue(self.event_service.service_enabled)
+        self.assertEqual(3, self.event_service.delivery_retry_attempts)
+        self.assertEqual(60, self.event_service.delivery_retry_interval)
+        self.assertIn('Alert',
+                      self.event_service.event_types_for_subscription)
+        self.assertEqual(['Base', 'ResourceEvent'],
+                         self.event_service.registry_prefixes)
+        self.assertIn('Power', self.event_service.resource_types)
+        self.assertEqual('/redfish/v1/EventService/SSE',
+                         self.event_service.server_sent_event_uri)
+        self.assertEqual(res_cons.STATE_ENABLED,
+                         self.event_service.status.state)
+
+    def test_get_event_stream(self):
+        stream = self.event_service.get_event_stream(
+            message_ids=['ResourceEvent'], resource_types=['Power'])
+        self.assertIsInstance(stream, sse.EventStream)
+        self.assertEqual('/redfish/v1/EventService/SSE', stream.path)
+        # Opening the stream is deferred
+        self.conn.get.reset_mock()
+        self.assertFalse(self.conn.get.called)
+
+    def test_get_event_stream_not_supported(self):
+        self.event_service.server_sent_event_uri = None
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError, 'ServerSentEventUri',
+            self.event_service.get_event_stream)
@@ -0,0 +1,258 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+
+import mock
+
+from sushy.resources.eventservice import sse
+from sushy.tests.unit import base
+
+
+def _event(message_id, origin, odata_type=None, event_id='1'):
+    record = {'EventType': 'Alert',
+              'EventId': event_id,
+              'Severity': 'OK',
+              'Message': 'Something happened',
+              'MessageId': message_id,
+              'MessageArgs': ['foo'],
+              'OriginOfCondition': {'@odata.id': origin}}
+    if odata_type:
+        record['OriginOfCondition']['@odata.type'] = odata_type
+    return record
+
+
+def _stream_lines(*docs):
+    lines = [': keep-alive']
+    for i, doc in enumerate(docs, 1):
+        lines.append('id: %d' % i)
+        data = json.dumps(doc, indent=1).split('\n')
+        lines.extend('data: ' + line for line in data)
+        lines.append('')
+    return lines
+
+
+class ServerSentEventParserTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ServerSentEventParserTestCase, self).setUp()
+        self.parser = sse.ServerSentEventParser()
+
+    def test_feed(self):
+        self.assertIsNone(self.parser.feed(': comment'))
+        self.assertIsNone(self.parser.feed('event: update'))
+        self.assertIsNone(self.parser.feed('id: 42'))
+        self.assertIsNone(self.parser.feed('retry: 1500'))
+        self.assertIsNone(self.parser.feed('data: first'))
+        self.assertIsNone(self.parser.feed('data:second'))
+        message = self.parser.feed('')
+        self.assertEqual('first\nsecond', message.data)
+        self.assertEqual('update', message.event)
+        self.assertEqual('42', message.last_event_id)
+        self.assertEqual(1.5, self.parser.retry)
+
+    def test_feed_resets_event_type(self):
+        self.parser.feed('event: update')
+        self.parser.feed('data: x')
+        self.parser.feed('')
+        self.parser.feed('data: y')
+        message = self.parser.feed('')
+        self.assertEqual('y', message.data)
+        self.assertIsNone(message.event)
+
+    def test_feed_no_data(self):
+        self.parser.feed('id: 1')
+        self.assertIsNone(self.parser.feed(''))
+        self.assertEqual('1', self.parser.last_event_id)
+
+    def test_feed_ignores_bad_retry(self):
+        self.parser.feed('retry: soon')
+        self.assertIsNone(self.parser.retry)
+
+
+class EventRecordTestCase(base.TestCase):
+
+    def test_init(self):
+        record = sse.EventRecord(
+            _event('ResourceEvent.1.0.ResourceChanged',
+                   '/redfish/v1/Chassis/1/Power',
+                   odata_type='#Power.v1_5_0.Power'), stream_id='7')
+        self.assertEqual('Alert', record.event_type)
+        self.assertEqual('ResourceEvent.1.0.ResourceChanged',
+                         record.message_id)
+        self.assertEqual('ResourceEvent', record.registry_prefix)
+        self.assertEqual('ResourceChanged', record.message_key)
+        self.assertEqual(['foo'], record.message_args)
+        self.assertEqual('/redfish/v1/Chassis/1/Power',
+                         record.origin_of_condition)
+        self.assertEqual('Power', record.resource_type)
+        self.assertEqual('7', record.stream_id)
+
+    def test_init_minimal(self):
+        record = sse.EventRecord({'OriginOfCondition': '/redfish/v1'})
+        self.assertEqual('/redfish/v1', record.origin_of_condition)
+        self.assertIsNone(record.resource_type)
+        self.assertIsNone(record.registry_prefix)
+        self.assertIsNone(record.message_key)
+
+
+class EventStreamTestCase(base.TestCase):
+
+    def setUp(self):
+        super(EventStreamTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.response = self.conn.get.return_value
+
+    def _set_events(self, *docs):
+        self.response.iter_lines.return_value = iter(_stream_lines(*docs))
+
+    def test_iterate(self):
+        self._set_events(
+            {'Events': [_event('Base.1.0.Success', '/redfish/v1/Systems/1'),
+                        _event('Base.1.0.Success', '/redfish/v1/Chassis/1')]},
+            {'Events': [_event('ResourceEvent.1.0.ResourceChanged',
+                               '/redfish/v1/Systems/1')]})
+        stream = sse.EventStream(self.conn, '/redfish/v1/EventService/SSE',
+                                 reconnect=False)
+
+        records = list(stream)
+
+        self.assertEqual(['/redfish/v1/Systems/1', '/redfish/v1/Chassis/1',
+                          '/redfish/v1/Systems/1'],
+                         [r.origin_of_condition for r in records])
+        self.assertEqual(['1', '1', '2'], [r.stream_id for r in records])
+        self.conn.get.assert_called_once_with(
+            '/redfish/v1/EventService/SSE',
+            headers={'Accept': 'text/event-stream'}, stream=True)
+        self.response.close.assert_called_once_with()
+        self.assertEqual('2', stream.last_event_id)
+
+    def test_iterate_filter_message_ids(self):
+        self._set_events(
+            {'Events': [_event('Base.1.0.Success', '/a'),
+                        _event('ResourceEvent.1.0.ResourceChanged', '/b'),
+                        _event('ResourceEvent.1.2.ResourceCreated', '/c'),
+                        _event('TaskEvent.1.0.TaskStarted', '/d'),
+                        _event('Oem.1.0.Foo', '/e')]})
+        stream = sse.EventStream(
+            self.conn, '/SSE', reconnect=False,
+            message_ids=['ResourceEvent.ResourceChanged',
+                         'TaskEvent', 'Oem.1.0.Foo'])
+
+        self.assertEqual(['/b', '/d', '/e'],
+                         [r.origin_of_condition for r in stream])
+
+    def test_iterate_filter_resource_types(self):
+        self._set_events(
+            {'Events': [_event('Base.1.0.Success', '/a',
+                               odata_type='#Power.v1_5_0.Power'),
+                        _event('Base.1.0.Success', '/b',
+                               odata_type='#Thermal.v1_5_0.Thermal'),
+                        _event('Base.1.0.Success', '/c')]})
+        stream = sse.EventStream(self.conn, '/SSE', reconnect=False,
+                                 resource_types=['Power'])
+
+        self.assertEqual(['/a', '/c'],
+                         [r.origin_of_condition for r in stream])
+
+    def test_iterate_skips_non_events(self):
+        self.response.iter_lines.return_value = iter(
+            ['data: {"@odata.type": "#MetricReport.v1_0_0.MetricReport"}',
+             '', 'data: not json', '',
+             'data: {"Events": [{"MessageId": "Base.1.0.Success"}]}'])
+        stream = sse.EventStream(self.conn, '/SSE', reconnect=False)
+
+        records = list(stream)
+
+        self.assertEqual(1, len(records))
+        self.assertEqual('Base.1.0.Success', records[0].message_id)
+
+    def test_path_server_side_filter(self):
+        stream = sse.EventStream(
+            self.conn, '/SSE', message_ids=['Base.1.0.Success'],
+            resource_types=['Power', 'Thermal'], server_side_filter=True)
+        self.assertEqual(
+            "/SSE?%24filter=%28MessageId%20eq%20%27Base.1.0.Success%27%29"
+            "%20and%20%28ResourceType%20eq%20%27Power%27%20or%20"
+            "ResourceType%20eq%20%27Thermal%27%29", stream.path)
+
+    def test_path_server_side_filter_prefixes(self):
+        stream = sse.EventStream(
+            self.conn, '/SSE', message_ids=['Base.1.0.Success',
+                                            'ResourceEvent'],
+            server_side_filter=True)
+        self.assertEqual(
+            "/SSE?%24filter=%28MessageId%20eq%20%27Base.1.0.Success%27%20or"
+            "%20RegistryPrefix%20eq%20%27ResourceEvent%27%29", stream.path)
+
+    def test_path_server_side_filter_unversioned(self):
+        stream = sse.EventStream(
+            self.conn, '/SSE', message_ids=['Base.1.0.Success',
+                                            'ResourceEvent.ResourceChanged'],
+            resource_types=['Power'], server_side_filter=True)
+        # NOTE: the message IDs are only filtered on the client side
+        self.assertEqual(
+            "/SSE?%24filter=%28ResourceType%20eq%20%27Power%27%29",
+            stream.path)
+
+        stream = sse.EventStream(
+            self.conn, '/SSE', message_ids=['ResourceEvent.ResourceChanged'],
+            server_side_filter=True)
+        self.assertEqual('/SSE', stream.path)
+
+    def test_path_no_filters(self):
+        stream = sse.EventStream(self.conn, '/SSE', server_side_filter=True)
+        self.assertEqual('/SSE', stream.path)
+
+    @mock.patch('time.sleep', autospec=True)
+    def test_iterate_reconnect(self, mock_sleep):
+        first = mock.Mock()
+        first.iter_lines.return_value = iter(
+            ['retry: 500', 'id: 5',
+             'data: {"Events": [{"MessageId": "Base.1.0.Success"}]}', ''])
+        stream = sse.EventStream(self.conn, '/SSE')
+        second = mock.Mock()
+
+        def _second_lines(**kwargs):
+            stream.close()
+            return iter([])
+
+        second.iter_lines.side_effect = _second_lines
+        self.conn.get.side_effect = [first, second]
+
+        records = list(stream)
+
+        self.assertEqual(1, len(records))
+        mock_sleep.assert_called_once_with(0.5)
+        self.conn.get.assert_called_with(
+            '/SSE', headers={'Accept': 'text/event-stream',
+                             'Last-Event-ID': '5'}, stream=True)
+
+    def test_iterate_interrupted(self):
+        def _lines(**kwargs):
+            yield 'data: {"Events": [{"MessageId": "Base.1.0.Success"}]}'
+            yield ''
+            raise IOError('connection reset')
+
+        self.response.iter_lines.side_effect = _lines
+        stream = sse.EventStream(self.conn, '/SSE', reconnect=False)
+
+        self.assertEqual(1, len(list(stream)))
+        self.response.close.assert_called_once_with()
+
+    def test_context_manager(self):
+        with sse.EventStream(self.conn, '/SSE') as stream:
+            self.conn.get.assert_called_once_with(
+                '/SSE', headers={'Accept': 'text/event-stream'},
+                stream=True)
+        self.response.close.assert_called_once_with()
+        self.assertEqual([], list(stream))
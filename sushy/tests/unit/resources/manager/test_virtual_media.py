@@ -70,7 +70,8 @@ class VirtualMediaTestCase(base.TestCase):
             ("/redfish/v1/Managers/BMC/VirtualMedia/Floppy1/Actions"
              "/VirtualMedia.InsertMedia"),
             data={"Image": "https://www.dmtf.org/freeImages/Sardine.img",
-                  "Inserted": True, "WriteProtected": False}
+                  "Inserted": True, "WriteProtected": False},
+            headers={'Prefer': 'return=representation'}
         )
         self.assertTrue(self.sys_virtual_media._is_stale)
 
@@ -85,7 +86,8 @@ class VirtualMediaTestCase(base.TestCase):
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.post.assert_called_once_with(
             ("/redfish/v1/Managers/BMC/VirtualMedia/Floppy1/Actions"
-             "/VirtualMedia.EjectMedia"))
+             "/VirtualMedia.EjectMedia"),
+            headers={'Prefer': 'return=representation'})
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_eject_media_pass_empty_dict_415(self):
@@ -95,9 +97,10 @@ class VirtualMediaTestCase(base.TestCase):
             method='POST', url=target_uri, response=mock.MagicMock(
                 status_code=http_client.UNSUPPORTED_MEDIA_TYPE)), '200']
         self.sys_virtual_media.eject_media()
+        headers = {'Prefer': 'return=representation'}
         post_calls = [
-            mock.call(target_uri),
-            mock.call(target_uri, data={})]
+            mock.call(target_uri, headers=headers),
+            mock.call(target_uri, data={}, headers=headers)]
         self.sys_virtual_media._conn.post.assert_has_calls(post_calls)
         self.assertTrue(self.sys_virtual_media._is_stale)
 
@@ -108,8 +111,9 @@ class VirtualMediaTestCase(base.TestCase):
             method='POST', url=target_uri, response=mock.MagicMock(
                 status_code=http_client.BAD_REQUEST)), '200']
         self.sys_virtual_media.eject_media()
+        headers = {'Prefer': 'return=representation'}
         post_calls = [
-            mock.call(target_uri),
-            mock.call(target_uri, data={})]
+            mock.call(target_uri, headers=headers),
+            mock.call(target_uri, data={}, headers=headers)]
         self.sys_virtual_media._conn.post.assert_has_calls(post_calls)
         self.assertTrue(self.sys_virtual_media._is_stale)
@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import datetime
 import json
 import mock
 
@@ -46,6 +47,14 @@ class SessionTestCase(base.TestCase):
         exp_path = '/redfish/v1/SessionService/Sessions/1234567890ABCDEF'
         self.assertEqual(exp_path, self.sess_inst.path)
 
+    def test__parse_attributes_created_time(self):
+        self.assertIsNone(self.sess_inst.created_time)
+        self.json_doc['CreatedTime'] = '2020-01-01T00:00:00+00:00'
+        self.sess_inst._parse_attributes(self.json_doc)
+        self.assertEqual(
+            datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+            self.sess_inst.created_time)
+
     def test__parse_attributes_missing_identity(self):
         self.sess_inst.json.pop('Id')
         self.assertRaisesRegex(
@@ -59,13 +59,15 @@ class DriveTestCase(base.TestCase):
         self.assertEqual(sushy.HEALTH_OK, self.stor_drive.status.health)
 
     def test_set_indicator_led(self):
+        self.conn.write_through = False
         with mock.patch.object(
                 self.stor_drive, 'invalidate',
                 autospec=True) as invalidate_mock:
             self.stor_drive.set_indicator_led(sushy.INDICATOR_LED_BLINKING)
             self.stor_drive._conn.patch.assert_called_once_with(
                 '/redfish/v1/Systems/437XR1138/Storage/1/Drives/'
-                '32ADF365C6C1B7BD', data={'IndicatorLED': 'Blinking'})
+                '32ADF365C6C1B7BD', data={'IndicatorLED': 'Blinking'},
+                headers={'Prefer': 'return=representation'})
 
             invalidate_mock.assert_called_once_with()
 
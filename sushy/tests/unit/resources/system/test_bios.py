@@ -103,6 +103,46 @@ class BiosTestCase(base.TestCase):
             data={'Attributes': {'ProcTurboMode': 'Disabled',
                                  'UsbControl': 'UsbDisabled'}})
 
+    def test_get_attribute_changes(self):
+        changes = self.sys_bios.get_attribute_changes({
+            # unchanged
+            'BootMode': 'Uefi',
+            # pending already
+            'ProcTurboMode': 'Disabled',
+            'EmbeddedSata': 'Ahci',
+            # changed
+            'PowerProfile': 'Balanced',
+            'ProcCoreDisable': 2,
+            # overriding a pending change
+            'NicBoot2': 'Disabled',
+            # unknown
+            'Foo': 'Bar'})
+        self.assertEqual({'PowerProfile': 'Balanced', 'ProcCoreDisable': 2,
+                          'NicBoot2': 'Disabled', 'Foo': 'Bar'}, changes)
+
+    def test_get_attribute_changes_no_pending(self):
+        self.conn.get.return_value.json.side_effect = (
+            exceptions.ResourceNotFoundError(
+                method='GET', url='/redfish/v1/Systems/437XR1138R2/BIOS/'
+                'Settings', response=mock.MagicMock(status_code=404)))
+        changes = self.sys_bios.get_attribute_changes({
+            'ProcTurboMode': 'Disabled', 'BootMode': 'Uefi'})
+        self.assertEqual({'ProcTurboMode': 'Disabled'}, changes)
+
+    def test_update_attributes(self):
+        changes = self.sys_bios.update_attributes({
+            'BootMode': 'Uefi', 'UsbControl': 'UsbDisabled'})
+        self.assertEqual({'UsbControl': 'UsbDisabled'}, changes)
+        self.sys_bios._conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2/BIOS/Settings',
+            data={'Attributes': {'UsbControl': 'UsbDisabled'}})
+
+    def test_update_attributes_noop(self):
+        changes = self.sys_bios.update_attributes({
+            'BootMode': 'Uefi', 'ProcTurboMode': 'Disabled'})
+        self.assertEqual({}, changes)
+        self.sys_bios._conn.patch.assert_not_called()
+
     def test_set_attributes_on_refresh(self):
         self.conn.get.reset_mock()
         # make it to instantiate pending attributes
@@ -235,7 +235,8 @@ class SystemTestCase(base.TestCase):
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideEnabled': 'Continuous',
                            'BootSourceOverrideTarget': 'Pxe',
-                           'BootSourceOverrideMode': 'UEFI'}})
+                           'BootSourceOverrideMode': 'UEFI'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_options_no_mode_specified(self):
         self.sys_inst.set_system_boot_options(
@@ -244,7 +245,8 @@ class SystemTestCase(base.TestCase):
         self.sys_inst._conn.patch.assert_called_once_with(
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideEnabled': 'Once',
-                           'BootSourceOverrideTarget': 'Hdd'}})
+                           'BootSourceOverrideTarget': 'Hdd'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_options_no_target_specified(self):
         self.sys_inst.set_system_boot_options(
@@ -253,7 +255,8 @@ class SystemTestCase(base.TestCase):
         self.sys_inst._conn.patch.assert_called_once_with(
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideEnabled': 'Continuous',
-                           'BootSourceOverrideMode': 'UEFI'}})
+                           'BootSourceOverrideMode': 'UEFI'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_options_no_freq_specified(self):
         self.sys_inst.set_system_boot_options(
@@ -262,12 +265,14 @@ class SystemTestCase(base.TestCase):
         self.sys_inst._conn.patch.assert_called_once_with(
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideTarget': 'Pxe',
-                           'BootSourceOverrideMode': 'UEFI'}})
+                           'BootSourceOverrideMode': 'UEFI'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_options_nothing_specified(self):
         self.sys_inst.set_system_boot_options()
         self.sys_inst._conn.patch.assert_called_once_with(
-            '/redfish/v1/Systems/437XR1138R2', data={})
+            '/redfish/v1/Systems/437XR1138R2', data={},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_options_invalid_target(self):
         self.assertRaises(exceptions.InvalidParameterValueError,
@@ -293,7 +298,8 @@ class SystemTestCase(base.TestCase):
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideEnabled': 'Continuous',
                            'BootSourceOverrideTarget': 'Pxe',
-                           'BootSourceOverrideMode': 'UEFI'}})
+                           'BootSourceOverrideMode': 'UEFI'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_source_no_mode_specified(self):
         self.sys_inst.set_system_boot_source(
@@ -302,7 +308,8 @@ class SystemTestCase(base.TestCase):
         self.sys_inst._conn.patch.assert_called_once_with(
             '/redfish/v1/Systems/437XR1138R2',
             data={'Boot': {'BootSourceOverrideEnabled': 'Once',
-                           'BootSourceOverrideTarget': 'Hdd'}})
+                           'BootSourceOverrideTarget': 'Hdd'}},
+            headers={'Prefer': 'return=representation'})
 
     def test_set_system_boot_source_invalid_target(self):
         self.assertRaises(exceptions.InvalidParameterValueError,
@@ -320,15 +327,59 @@ class SystemTestCase(base.TestCase):
                 enabled='invalid-enabled')
 
     def test_set_indicator_led(self):
+        self.conn.write_through = False
         with mock.patch.object(
                 self.sys_inst, 'invalidate', autospec=True) as invalidate_mock:
             self.sys_inst.set_indicator_led(sushy.INDICATOR_LED_BLINKING)
             self.sys_inst._conn.patch.assert_called_once_with(
                 '/redfish/v1/Systems/437XR1138R2',
-                data={'IndicatorLED': 'Blinking'})
+                data={'IndicatorLED': 'Blinking'},
+                headers={'Prefer': 'return=representation'})
 
             invalidate_mock.assert_called_once_with()
 
+    def test_set_indicator_led_representation(self):
+        self.conn.write_through = False
+        doc = dict(self.json_doc, IndicatorLED='Blinking')
+        self.conn.patch.return_value.json.return_value = doc
+
+        self.sys_inst.set_indicator_led(sushy.INDICATOR_LED_BLINKING)
+
+        self.assertFalse(self.sys_inst._is_stale)
+        self.assertEqual(sushy.INDICATOR_LED_BLINKING,
+                         self.sys_inst.indicator_led)
+        self.assertEqual(doc, self.sys_inst.json)
+
+    def test_set_indicator_led_write_through(self):
+        self.conn.write_through = True
+        self.conn.patch.return_value.content = b''
+
+        self.sys_inst.set_indicator_led(sushy.INDICATOR_LED_BLINKING)
+
+        self.assertFalse(self.sys_inst._is_stale)
+        self.assertEqual(sushy.INDICATOR_LED_BLINKING,
+                         self.sys_inst.indicator_led)
+        self.assertEqual('Blinking', self.sys_inst.json['IndicatorLED'])
+        self.assertEqual('Off', self.json_doc['IndicatorLED'])
+
+    def test_batch(self):
+        self.conn.write_through = False
+        self.json_doc['@odata.etag'] = 'W/"1"'
+
+        with self.sys_inst.batch():
+            self.sys_inst.set_system_boot_options(
+                sushy.BOOT_SOURCE_TARGET_PXE,
+                enabled=sushy.BOOT_SOURCE_ENABLED_ONCE)
+            self.sys_inst.set_indicator_led(sushy.INDICATOR_LED_LIT)
+
+        self.conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2',
+            data={'Boot': {'BootSourceOverrideEnabled': 'Once',
+                           'BootSourceOverrideTarget': 'Pxe'},
+                  'IndicatorLED': 'Lit'},
+            headers={'Prefer': 'return=representation',
+                     'If-Match': 'W/"1"'})
+
     def test_set_indicator_led_invalid_state(self):
         self.assertRaises(exceptions.InvalidParameterValueError,
                           self.sys_inst.set_indicator_led,
@@ -597,6 +648,21 @@ class SystemTestCase(base.TestCase):
         self.assertEqual(
             '/redfish/v1/Managers/BMC', actual_managers[0].path)
 
+    def test_managers_shared(self):
+        # | GIVEN |
+        other_sys_inst = system.System(
+            self.conn, '/redfish/v1/Systems/437XR1138R2',
+            redfish_version='1.0.2')
+        with open('sushy/tests/unit/json_samples/'
+                  'manager.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        # | WHEN & THEN |
+        self.assertIs(self.sys_inst.managers[0], other_sys_inst.managers[0])
+        self.assertEqual(
+            1, self.conn.get.call_args_list.count(
+                mock.call(path='/redfish/v1/Managers/BMC')))
+
     def test_chassis(self):
         # | GIVEN |
         with open('sushy/tests/unit/json_samples/'
@@ -655,3 +721,93 @@ class SystemCollectionTestCase(base.TestCase):
             self.sys_col.redfish_version, None)
         self.assertIsInstance(members, list)
         self.assertEqual(1, len(members))
+
+    def test_probe_power_states(self):
+        self.sys_col.members_identities
+        self.conn.get.reset_mock()
+        self.conn.get.return_value.json.return_value = {
+            'Id': '437XR1138R2', 'PowerState': 'On'}
+        protocol_features = mock.Mock(select_query=True)
+
+        states = self.sys_col.probe_power_states(protocol_features)
+
+        self.assertEqual(
+            {'/redfish/v1/Systems/437XR1138R2': sushy.SYSTEM_POWER_STATE_ON},
+            states)
+        self.conn.get.assert_called_once_with(
+            path='/redfish/v1/Systems/437XR1138R2?$select=PowerState')
+
+    def test_probe_power_states_no_select(self):
+        self.sys_col.members_identities
+        self.conn.get.reset_mock()
+        self.conn.get.return_value.json.return_value = {'PowerState': 'Off'}
+
+        states = self.sys_col.probe_power_states()
+
+        self.assertEqual(
+            {'/redfish/v1/Systems/437XR1138R2': sushy.SYSTEM_POWER_STATE_OFF},
+            states)
+        self.conn.get.assert_called_once_with(
+            path='/redfish/v1/Systems/437XR1138R2')
+
+
+class ProbePowerStateTestCase(base.TestCase):
+
+    def setUp(self):
+        super(ProbePowerStateTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.conn.get.return_value.json.return_value = {
+            'PowerState': 'PoweringOn'}
+
+    def test_probe_power_state(self):
+        self.assertEqual(
+            sushy.SYSTEM_POWER_STATE_POWERING_ON,
+            system.probe_power_state(self.conn, '/redfish/v1/Systems/1',
+                                     select=True))
+        self.conn.get.assert_called_once_with(
+            path='/redfish/v1/Systems/1?$select=PowerState')
+
+    def test_probe_power_state_select_rejected(self):
+        response = mock.Mock(status_code=400)
+        response.json.side_effect = ValueError
+        self.conn.get.side_effect = [
+            exceptions.BadRequestError('GET', '/redfish/v1/Systems/1',
+                                       response),
+            mock.Mock(**{'json.return_value': {'PowerState': 'Off'}})]
+
+        self.assertEqual(
+            sushy.SYSTEM_POWER_STATE_OFF,
+            system.probe_power_state(self.conn, '/redfish/v1/Systems/1',
+                                     select=True))
+        self.conn.get.assert_called_with(path='/redfish/v1/Systems/1')
+
+    def test_probe_power_state_missing(self):
+        self.conn.get.return_value.json.return_value = {'Id': '1'}
+        self.assertIsNone(
+            system.probe_power_state(self.conn, '/redfish/v1/Systems/1'))
+
+    def test_probe_power_states(self):
+        failing = mock.Mock()
+        error = exceptions.ConnectionError(url='/redfish/v1/Systems/2',
+                                           error='unreachable')
+        failing.get.side_effect = error
+
+        states = system.probe_power_states(
+            [(self.conn, '/redfish/v1/Systems/1'),
+             (failing, '/redfish/v1/Systems/2'),
+             (self.conn, '/redfish/v1/Systems/3')])
+
+        self.assertEqual([sushy.SYSTEM_POWER_STATE_POWERING_ON, error,
+                          sushy.SYSTEM_POWER_STATE_POWERING_ON], states)
+
+    def test_probe_power_states_invalid_json(self):
+        invalid = mock.Mock()
+        error = ValueError('Expecting value')
+        invalid.get.return_value.json.side_effect = error
+
+        states = system.probe_power_states(
+            [(invalid, '/redfish/v1/Systems/1'),
+             (self.conn, '/redfish/v1/Systems/2')])
+
+        self.assertEqual([error, sushy.SYSTEM_POWER_STATE_POWERING_ON],
+                         states)
@@ -0,0 +1,61 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import datetime
+import json
+
+from dateutil import tz
+import mock
+
+from sushy.resources.telemetryservice import metric_report
+from sushy.tests.unit import base
+
+
+class MetricReportTestCase(base.TestCase):
+
+    def setUp(self):
+        super(MetricReportTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/metricreport.json') as f:
+            self.json_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+
+        self.report = metric_report.MetricReport(
+            self.conn, '/redfish/v1/TelemetryService/MetricReports/'
+            'PlatformPowerUsage', redfish_version='1.8.0')
+
+    def test__parse_attributes(self):
+        self.report._parse_attributes(self.json_doc)
+        self.assertEqual('PlatformPowerUsage', self.report.identity)
+        self.assertEqual('127', self.report.report_sequence)
+        self.assertEqual(
+            datetime.datetime(2019, 11, 8, 12, 25,
+                              tzinfo=tz.tzoffset(None, -18000)),
+            self.report.timestamp)
+        self.assertEqual(3, len(self.report.metric_values))
+        value = self.report.metric_values[0]
+        self.assertEqual('AverageConsumedWatts', value.metric_id)
+        self.assertEqual('100', value.metric_value)
+        self.assertEqual('/redfish/v1/Chassis/1U/Power#/PowerControl/0/'
+                         'PowerConsumedWatts', value.metric_property)
+        self.assertEqual('/redfish/v1/TelemetryService/'
+                         'MetricReportDefinitions/PlatformPowerUsage',
+                         self.report._metric_report_definition_path)
+
+    def test_get_readings(self):
+        self.assertEqual(
+            {'/redfish/v1/Chassis/1U/Power#/PowerControl/0/'
+             'PowerConsumedWatts': 100.0,
+             '/redfish/v1/Chassis/1U/Thermal#/Temperatures/0/'
+             'ReadingCelsius': 62.5,
+             'PowerState': 'On'}, self.report.get_readings())
@@ -0,0 +1,102 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+
+from sushy import exceptions
+from sushy.resources.telemetryservice import constants as tel_cons
+from sushy.resources.telemetryservice import metric_report
+from sushy.resources.telemetryservice import metric_report_definition
+from sushy.tests.unit import base
+
+
+class MetricReportDefinitionTestCase(base.TestCase):
+
+    def setUp(self):
+        super(MetricReportDefinitionTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'metricreportdefinition.json') as f:
+            self.json_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+
+        self.definition = metric_report_definition.MetricReportDefinition(
+            self.conn, '/redfish/v1/TelemetryService/MetricReportDefinitions/'
+            'PlatformPowerUsage', redfish_version='1.8.0')
+
+    def test__parse_attributes(self):
+        self.definition._parse_attributes(self.json_doc)
+        self.assertEqual('PlatformPowerUsage', self.definition.identity)
+        self.assertEqual(tel_cons.METRIC_REPORT_TYPE_PERIODIC,
+                         self.definition.metric_report_definition_type)
+        self.assertTrue(self.definition.metric_report_definition_enabled)
+        self.assertEqual('PT60S',
+                         self.definition.schedule.recurrence_interval)
+        self.assertEqual([tel_cons.METRIC_REPORT_ACTION_EVENT,
+                          tel_cons.METRIC_REPORT_ACTION_LOG],
+                         self.definition.report_actions)
+        self.assertEqual(tel_cons.METRIC_REPORT_UPDATES_OVERWRITE,
+                         self.definition.report_updates)
+        self.assertEqual(2, len(self.definition.metric_properties))
+        self.assertEqual('AverageConsumedWatts',
+                         self.definition.metrics[0].metric_id)
+        self.assertEqual('Average',
+                         self.definition.metrics[0].collection_function)
+
+    def test_metric_report(self):
+        with open('sushy/tests/unit/json_samples/metricreport.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        report = self.definition.metric_report
+
+        self.assertIsInstance(report, metric_report.MetricReport)
+        self.assertEqual('/redfish/v1/TelemetryService/MetricReports/'
+                         'PlatformPowerUsage', report.path)
+        self.assertIs(report, self.definition.metric_report)
+
+    def test_metric_report_missing(self):
+        self.definition._metric_report_path = None
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError, 'MetricReport/@odata.id',
+            getattr, self.definition, 'metric_report')
+
+    def test_delete(self):
+        self.definition.delete()
+        self.conn.delete.assert_called_once_with(self.definition.path)
+
+
+class MetricReportDefinitionCollectionTestCase(base.TestCase):
+
+    def setUp(self):
+        super(MetricReportDefinitionCollectionTestCase, self).setUp()
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'metricreportdefinition_collection.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+
+        self.collection = (
+            metric_report_definition.MetricReportDefinitionCollection(
+                conn, '/redfish/v1/TelemetryService/MetricReportDefinitions',
+                redfish_version='1.8.0'))
+
+    @mock.patch.object(metric_report_definition, 'MetricReportDefinition',
+                       autospec=True)
+    def test_get_members(self, mock_definition):
+        members = self.collection.get_members()
+        mock_definition.assert_called_once_with(
+            self.collection._conn,
+            '/redfish/v1/TelemetryService/MetricReportDefinitions/'
+            'PlatformPowerUsage', self.collection.redfish_version, None)
+        self.assertEqual([mock_definition.return_value], members)
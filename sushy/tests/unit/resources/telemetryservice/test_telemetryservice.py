@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License"); you may
+# not use this file except in compliance with the License. You may obtain
+# a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+# WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+# License for the specific language governing permissions and limitations
+# under the License.
+
+import json
+
+import mock
+
+from sushy import exceptions
+from sushy.resources import constants as res_cons
+from sushy.resources.telemetryservice import constants as tel_cons
+from sushy.resources.telemetryservice import metric_report
+from sushy.resources.telemetryservice import metric_report_definition
+from sushy.resources.telemetryservice import telemetryservice
+from sushy.tests.unit import base
+
+
+class TelemetryServiceTestCase(base.TestCase):
+
+    def setUp(self):
+        super(TelemetryServiceTestCase, self).setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'telemetryservice.json') as f:
+            self.json_doc = json.load(f)
+
+        self.conn.get.return_value.json.return_value = self.json_doc
+
+        self.tel_serv = telemetryservice.TelemetryService(
+            self.conn, '/redfish/v1/TelemetryService',
+            redfish_version='1.8.0')
+
+    def test__parse_attributes(self):
+        self.tel_serv._parse_attributes(self.json_doc)
+        self.assertEqual('1.8.0', self.tel_serv.redfish_version)
+        self.assertEqual('TelemetryService', self.tel_serv.identity)
+        self.assertEqual('Telemetry Service', self.tel_serv.name)
+        self.assertTrue(self.tel_serv.service_enabled)
+        self.assertEqual(10, self.tel_serv.max_reports)
+        self.assertEqual('PT5S', self.tel_serv.min_collection_interval)
+        self.assertEqual(['Average', 'Minimum', 'Maximum'],
+                         self.tel_serv.supported_collection_functions)
+        self.assertEqual(res_cons.STATE_ENABLED, self.tel_serv.status.state)
+
+    def _set_collection(self, sample):
+        with open('sushy/tests/unit/json_samples/%s' % sample) as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+    def test_metric_report_definitions(self):
+        self._set_collection('metricreportdefinition_collection.json')
+        definitions = self.tel_serv.metric_report_definitions
+        self.assertIsInstance(
+            definitions,
+            metric_report_definition.MetricReportDefinitionCollection)
+        self.assertEqual(
+            ('/redfish/v1/TelemetryService/MetricReportDefinitions/'
+             'PlatformPowerUsage',), definitions.members_identities)
+        self.assertIs(definitions, self.tel_serv.metric_report_definitions)
+
+    def test_metric_reports(self):
+        self._set_collection('metricreport_collection.json')
+        reports = self.tel_serv.metric_reports
+        self.assertIsInstance(reports, metric_report.MetricReportCollection)
+        self.assertEqual(
+            ('/redfish/v1/TelemetryService/MetricReports/'
+             'PlatformPowerUsage',), reports.members_identities)
+
+    def test_metric_reports_missing(self):
+        self.tel_serv._json.pop('MetricReports')
+        self.assertRaisesRegex(exceptions.MissingAttributeError,
+                               'MetricReports',
+                               getattr, self.tel_serv, 'metric_reports')
+
+    @mock.patch.object(metric_report, 'MetricReport', autospec=True)
+    def test_get_metric_report(self, mock_report):
+        self.tel_serv.get_metric_report('/redfish/v1/TelemetryService/'
+                                        'MetricReports/1')
+        mock_report.assert_called_once_with(
+            self.conn, '/redfish/v1/TelemetryService/MetricReports/1',
+            redfish_version='1.8.0', registries=None)
+
+    @mock.patch.object(metric_report_definition, 'MetricReportDefinition',
+                       autospec=True)
+    def test_create_metric_report_definition(self, mock_definition):
+        self.conn.post.return_value.headers = {
+            'Location': '/redfish/v1/TelemetryService/'
+                        'MetricReportDefinitions/Node'}
+
+        result = self.tel_serv.create_metric_report_definition(
+            'Node', ['/redfish/v1/Chassis/1/Power#/Voltages/0/ReadingVolts'],
+            report_type=tel_cons.METRIC_REPORT_TYPE_PERIODIC,
+            recurrence_interval='PT10S')
+
+        self.conn.post.assert_called_once_with(
+            '/redfish/v1/TelemetryService/MetricReportDefinitions',
+            data={'Id': 'Node', 'Name': 'Node',
+                  'MetricReportDefinitionType': 'Periodic',
+                  'MetricReportDefinitionEnabled': True,
+                  'MetricProperties': [
+                      '/redfish/v1/Chassis/1/Power#/Voltages/0/'
+                      'ReadingVolts'],
+                  'ReportActions': ['LogToMetricReportsCollection'],
+                  'ReportUpdates': 'Overwrite',
+                  'Schedule': {'RecurrenceInterval': 'PT10S'}})
+        mock_definition.assert_called_once_with(
+            self.conn,
+            '/redfish/v1/TelemetryService/MetricReportDefinitions/Node',
+            redfish_version='1.8.0', registries=None)
+        self.assertEqual(mock_definition.return_value, result)
+
+    @mock.patch.object(metric_report_definition, 'MetricReportDefinition',
+                       autospec=True)
+    def test_create_metric_report_definition_no_location(
+            self, mock_definition):
+        self.conn.post.return_value.headers = {}
+
+        self.tel_serv.create_metric_report_definition(
+            'Node', ['/redfish/v1/Chassis/1/Power#/Voltages/0/ReadingVolts'],
+            report_actions=[tel_cons.METRIC_REPORT_ACTION_EVENT],
+            name='Node readings')
+
+        data = self.conn.post.call_args[1]['data']
+        self.assertEqual('OnRequest', data['MetricReportDefinitionType'])
+        self.assertEqual(['RedfishEvent'], data['ReportActions'])
+        self.assertEqual('Node readings', data['Name'])
+        self.assertNotIn('Schedule', data)
+        mock_definition.assert_called_once_with(
+            self.conn,
+            '/redfish/v1/TelemetryService/MetricReportDefinitions/Node',
+            redfish_version='1.8.0', registries=None)
+
+    def test_create_metric_report_definition_invalid(self):
+        self.assertRaises(
+            exceptions.InvalidParameterValueError,
+            self.tel_serv.create_metric_report_definition, 'Node', [],
+            report_type='sometimes')
+        self.assertRaisesRegex(
+            exceptions.InvalidParameterValueError, 'recurrence_interval',
+            self.tel_serv.create_metric_report_definition, 'Node', [],
+            report_type=tel_cons.METRIC_REPORT_TYPE_PERIODIC)
+        self.assertRaises(
+            exceptions.InvalidParameterValueError,
+            self.tel_serv.create_metric_report_definition, 'Node', [],
+            report_actions=['print'])
+        self.assertRaises(
+            exceptions.InvalidParameterValueError,
+            self.tel_serv.create_metric_report_definition, 'Node', [],
+            report_updates='never')
+        self.assertFalse(self.conn.post.called)
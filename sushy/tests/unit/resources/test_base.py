@@ -17,6 +17,7 @@ import copy
 from http import client as http_client
 import io
 import json
+import threading
 import mock
 
 from sushy import exceptions
@@ -162,6 +163,194 @@ class ResourceBaseTestCase(base.TestCase):
         self.assertIsNotNone(resource._json)
         self.assertEqual('Test.1.1.1', resource._json['Id'])
 
+    def test__patch_representation(self):
+        doc = dict(BASE_RESOURCE_JSON, **{'@odata.id': '/Foo/',
+                                          'Name': 'Renamed'})
+        self.conn.patch.return_value.json.return_value = doc
+        self.conn.write_through = False
+
+        self.base_resource._patch({'Name': 'Renamed'})
+
+        self.conn.patch.assert_called_once_with(
+            '/Foo', data={'Name': 'Renamed'},
+            headers={'Prefer': 'return=representation'})
+        self.assertEqual(doc, self.base_resource.json)
+        self.assertFalse(self.base_resource._is_stale)
+
+    def test__patch_other_representation(self):
+        # NOTE: e.g. an error or task payload, not the resource itself
+        self.conn.patch.return_value.json.return_value = BASE_RESOURCE_JSON
+        self.conn.write_through = False
+
+        self.base_resource._patch({'Name': 'Renamed'})
+
+        self.assertEqual('Faux Resource', self.base_resource.json['Name'])
+        self.assertTrue(self.base_resource._is_stale)
+
+    def test__patch_write_through(self):
+        self.conn.patch.return_value.content = b''
+        self.conn.write_through = True
+
+        self.base_resource._patch({'Oem': {'Contoso': {'slogan': 'New'}}})
+
+        contoso = self.base_resource.json['Oem']['Contoso']
+        self.assertEqual('New', contoso['slogan'])
+        self.assertEqual('* Most of the time', contoso['disclaimer'])
+        self.assertEqual('Contoso never fail',
+                         BASE_RESOURCE_JSON['Oem']['Contoso']['slogan'])
+        self.assertFalse(self.base_resource._is_stale)
+
+    def test__patch_write_through_stale(self):
+        self.conn.patch.return_value.content = b''
+        self.conn.write_through = True
+        self.base_resource.invalidate()
+
+        self.base_resource._patch({'Name': 'Renamed'})
+
+        self.assertEqual('Faux Resource', self.base_resource.json['Name'])
+        self.assertTrue(self.base_resource._is_stale)
+
+    def test_etag(self):
+        self.conn.get.return_value.headers = {}
+        self.base_resource.refresh()
+        self.assertIsNone(self.base_resource.etag)
+        self.conn.get.return_value.headers = {'ETag': 'W/"1"'}
+        self.base_resource.refresh()
+        self.assertEqual('W/"1"', self.base_resource.etag)
+        # NOTE: the one in the body is preferred
+        self.base_resource._json['@odata.etag'] = 'W/"2"'
+        self.assertEqual('W/"2"', self.base_resource.etag)
+
+    def test__patch_write_through_etag(self):
+        self.conn.get.return_value.headers = {'ETag': 'W/"1"'}
+        self.base_resource.refresh()
+        self.conn.patch.return_value.content = b''
+        self.conn.write_through = True
+
+        self.base_resource._patch({'Name': 'Renamed'})
+
+        self.assertIsNone(self.base_resource.etag)
+
+    def test_batch(self):
+        self.conn.get.return_value.headers = {'ETag': 'W/"1"'}
+        self.base_resource.refresh()
+        self.conn.write_through = False
+
+        with self.base_resource.batch() as resource:
+            resource._patch({'Name': 'Renamed'})
+            resource._patch({'Oem': {'Contoso': {'slogan': 'New'}}})
+            with resource.batch():
+                resource._patch({'Oem': {'Contoso': {'disclaimer': ''}}})
+            self.conn.patch.assert_not_called()
+
+        self.conn.patch.assert_called_once_with(
+            '/Foo', data={'Name': 'Renamed',
+                          'Oem': {'Contoso': {'slogan': 'New',
+                                              'disclaimer': ''}}},
+            headers={'Prefer': 'return=representation',
+                     'If-Match': 'W/"1"'})
+        self.assertTrue(self.base_resource._is_stale)
+
+    def test_batch_no_if_match(self):
+        self.conn.get.return_value.headers = {'ETag': 'W/"1"'}
+        self.base_resource.refresh()
+
+        with self.base_resource.batch(if_match=False):
+            self.base_resource._patch({'Name': 'Renamed'})
+
+        self.conn.patch.assert_called_once_with(
+            '/Foo', data={'Name': 'Renamed'},
+            headers={'Prefer': 'return=representation'})
+
+    def test_batch_empty(self):
+        with self.base_resource.batch():
+            pass
+        self.conn.patch.assert_not_called()
+
+    def test_batch_error(self):
+        def update():
+            with self.base_resource.batch():
+                self.base_resource._patch({'Name': 'Renamed'})
+                raise RuntimeError('boom')
+
+        self.assertRaises(RuntimeError, update)
+        self.conn.patch.assert_not_called()
+        self.assertIsNone(self.base_resource._batch_state.data)
+
+    def test_batch_other_thread(self):
+        self.conn.write_through = False
+        with self.base_resource.batch(if_match=False):
+            self.base_resource._patch({'Name': 'Renamed'})
+            thread = threading.Thread(
+                target=self.base_resource._patch,
+                args=({'Description': 'Other'},))
+            thread.start()
+            thread.join()
+            # NOTE: the other thread is not part of the batch
+            self.conn.patch.assert_called_once_with(
+                '/Foo', data={'Description': 'Other'},
+                headers={'Prefer': 'return=representation'})
+
+        self.conn.patch.assert_called_with(
+            '/Foo', data={'Name': 'Renamed'},
+            headers={'Prefer': 'return=representation'})
+        self.assertEqual(2, self.conn.patch.call_count)
+
+
+class SharedResourceTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SharedResourceTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.conn.get.return_value.json.return_value = (
+            copy.deepcopy(BASE_RESOURCE_JSON))
+
+    def test_get_shared_resource(self):
+        res = resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo', redfish_version='1.0.2')
+        self.assertIsInstance(res, BaseResource)
+        self.assertEqual('1.0.2', res.redfish_version)
+
+        self.assertIs(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo/'))
+        self.conn.get.assert_called_once_with(path='/Foo')
+
+    def test_get_shared_resource_fragment(self):
+        res = resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo/#/Bar/0')
+        self.assertIs(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo#/Bar/0'))
+        self.assertIsNot(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo'))
+        self.assertIsNot(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo#/Bar/1'))
+
+    def test_get_shared_resource_distinct_keys(self):
+        res = resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo')
+        self.assertIsNot(res, resource_base.get_shared_resource(
+            BaseResource2, self.conn, '/Foo'))
+        self.assertIsNot(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Bar'))
+        self.assertIsNot(res, resource_base.get_shared_resource(
+            BaseResource, mock.Mock(), '/Foo'))
+
+    def test_get_shared_resource_refreshes_stale(self):
+        res = resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo')
+        res.invalidate()
+        self.assertIs(res, resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo'))
+        self.assertFalse(res._is_stale)
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test_get_shared_resource_weakly_referenced(self):
+        res = resource_base.get_shared_resource(
+            BaseResource, self.conn, '/Foo')
+        del res
+        resource_base.get_shared_resource(BaseResource, self.conn, '/Foo')
+        self.assertEqual(2, self.conn.get.call_count)
+
 
 class TestResource(resource_base.ResourceBase):
     """A concrete Test Resource to test against"""
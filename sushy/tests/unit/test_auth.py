@@ -13,12 +13,15 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import threading
+
 import mock
 
 from sushy import auth
 from sushy import connector
 from sushy import exceptions
 from sushy import main
+from sushy import session_store
 from sushy.tests.unit import base
 
 
@@ -70,6 +73,42 @@ class BasicAuthTestCase(base.TestCase):
             self.assertEqual(self.password, base_auth._password)
         auth_close.assert_called_once_with(base_auth)
 
+    def test_defer_authentication_no_context(self):
+        self.assertRaises(RuntimeError,
+                          self.base_auth.defer_authentication)
+
+    def test_defer_authentication(self):
+        self.base_auth.set_context(self.root, self.conn)
+        self.base_auth.defer_authentication()
+        self.conn.set_http_basic_auth.assert_not_called()
+
+        self.base_auth.check_session()
+        self.base_auth.check_session()
+        self.conn.set_http_basic_auth.assert_called_once_with(self.username,
+                                                              self.password)
+
+    def test_defer_authentication_retried(self):
+        self.base_auth.set_context(self.root, self.conn)
+        self.base_auth.defer_authentication()
+        self.conn.set_http_basic_auth.side_effect = [
+            exceptions.ConnectionError(url='any_url', error='boom'), None]
+
+        self.assertRaises(exceptions.ConnectionError,
+                          self.base_auth.check_session)
+        self.base_auth.check_session()
+        self.base_auth.check_session()
+        self.assertEqual(2, self.conn.set_http_basic_auth.call_count)
+
+    def test_defer_authentication_reentered(self):
+        self.base_auth.set_context(self.root, self.conn)
+        self.base_auth.defer_authentication()
+        # NOTE: as the connector does for the requests of authentication
+        self.conn.set_http_basic_auth.side_effect = (
+            lambda *args: self.base_auth.check_session())
+        self.base_auth.check_session()
+        self.conn.set_http_basic_auth.assert_called_once_with(self.username,
+                                                              self.password)
+
 
 class SessionAuthTestCase(base.TestCase):
 
@@ -170,6 +209,148 @@ class SessionAuthTestCase(base.TestCase):
                          self.sess_auth.get_session_key())
         self.conn.set_http_session_auth.assert_called_once_with(self.sess_key)
 
+    def test_refresh_generation(self):
+        mock_sess_serv = mock.Mock()
+        mock_sess_serv.create_session.return_value = (self.sess_key,
+                                                      self.sess_uri)
+        self.root.get_session_service.return_value = mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+        self.assertEqual(0, self.sess_auth.session_generation)
+
+        self.sess_auth.refresh_session(0)
+        self.assertEqual(1, self.sess_auth.session_generation)
+        # NOTE: another caller failed with the session just replaced
+        self.sess_auth.refresh_session(0)
+        self.assertEqual(1, self.sess_auth.session_generation)
+        mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+
+    def test_refresh_single_flight(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def create_session(username, password):
+            started.set()
+            release.wait(5)
+            return self.sess_key, self.sess_uri
+
+        mock_sess_serv = mock.Mock()
+        mock_sess_serv.create_session.side_effect = create_session
+        self.root.get_session_service.return_value = mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+
+        first = threading.Thread(target=self.sess_auth.refresh_session,
+                                 args=(0,))
+        first.start()
+        started.wait(5)
+        others = [threading.Thread(target=self.sess_auth.refresh_session,
+                                   args=(0,)) for _ in range(5)]
+        for thread in others:
+            thread.start()
+        release.set()
+        for thread in [first] + others:
+            thread.join(5)
+
+        mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+        self.assertEqual(1, self.sess_auth.session_generation)
+
+    def test_refresh_keeps_session_until_replaced(self):
+        self.sess_auth._session_key = 'OldKey'
+        self.sess_auth._session_resource_id = self.sess_uri
+        mock_sess_serv = mock.Mock()
+
+        def create_session(username, password):
+            self.assertTrue(self.sess_auth.can_refresh_session())
+            raise exceptions.AccessError(
+                'POST', 'any_url', mock.MagicMock())
+
+        mock_sess_serv.create_session.side_effect = create_session
+        self.root.get_session_service.return_value = mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+        self.assertRaises(exceptions.AccessError,
+                          self.sess_auth.refresh_session)
+        self.assertIsNone(self.sess_auth.get_session_key())
+        self.assertEqual(0, self.sess_auth.session_generation)
+
+    def test_refresh_reentered(self):
+        mock_sess_serv = mock.Mock()
+
+        def create_session(username, password):
+            # NOTE: as done by the connector on an AccessError
+            self.sess_auth.refresh_session(0)
+            return self.sess_key, self.sess_uri
+
+        mock_sess_serv.create_session.side_effect = create_session
+        self.root.get_session_service.return_value = mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+        self.sess_auth.refresh_session(0)
+        mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+        self.assertEqual(1, self.sess_auth.session_generation)
+
+    def _authenticate_with_timeout(self, timeout=30):
+        self.mock_sess_serv = mock.Mock(session_timeout=timeout)
+        self.mock_sess_serv.create_session.return_value = (self.sess_key,
+                                                           self.sess_uri)
+        self.root.get_session_service.return_value = self.mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+        self.sess_auth.authenticate()
+
+    def test_check_session_idle(self):
+        self._authenticate_with_timeout()
+        self.sess_auth._last_used -= 28
+        self.sess_auth.check_session()
+        self.assertEqual(2, self.mock_sess_serv.create_session.call_count)
+        self.assertEqual(1, self.sess_auth.session_generation)
+
+    def test_check_session_recently_used(self):
+        self._authenticate_with_timeout()
+        self.sess_auth._last_used -= 20
+        self.sess_auth.check_session()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+
+    def test_check_session_unknown_timeout(self):
+        self._authenticate_with_timeout(timeout=None)
+        self.sess_auth._last_used -= 3600
+        self.sess_auth.check_session()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+
+    def test__send_keepalive(self):
+        self._authenticate_with_timeout()
+        self.assertEqual(7.5, self.sess_auth._send_keepalive())
+        self.conn.get.assert_not_called()
+        self.sess_auth._last_used -= 15
+        self.sess_auth._send_keepalive()
+        self.conn.get.assert_called_once_with(self.sess_uri)
+
+    def test__send_keepalive_unknown_timeout(self):
+        self._authenticate_with_timeout(timeout=None)
+        self.assertEqual(auth.DEFAULT_KEEPALIVE_INTERVAL,
+                         self.sess_auth._send_keepalive())
+        self.conn.get.assert_not_called()
+
+    @mock.patch.object(auth, '_keepalive_loop', autospec=True)
+    def test_keepalive_thread(self, mock_loop):
+        self.sess_auth = auth.SessionAuth(self.username, self.password,
+                                          keepalive=True)
+        self._authenticate_with_timeout()
+        stop = self.sess_auth._keepalive_stop
+        self.assertFalse(stop.is_set())
+        self.sess_auth.close()
+        self.assertTrue(stop.is_set())
+        self.assertIsNone(self.sess_auth._keepalive_stop)
+
+    def test__keepalive_loop_stops_with_auth(self):
+        sess_auth = auth.SessionAuth(self.username, self.password)
+        auth_ref = mock.Mock(side_effect=[sess_auth, None])
+        with mock.patch.object(sess_auth, '_send_keepalive', autospec=True,
+                               return_value=0):
+            auth._keepalive_loop(auth_ref, threading.Event())
+        self.assertEqual(2, auth_ref.call_count)
+
     def test_close_do_nothing(self):
         self.sess_auth._session_key = None
         self.sess_auth.set_context(self.root, self.conn)
@@ -200,6 +381,83 @@ class SessionAuthTestCase(base.TestCase):
         self.assertIsNone(self.sess_auth.get_session_resource_id())
         self.assertIsNone(self.sess_auth.get_session_key())
 
+    def _set_store_context(self, keepalive=False):
+        self.store = session_store.MemorySessionStore()
+        self.key = session_store.make_key('https://testing:8000',
+                                          self.username)
+        self.sess_auth = auth.SessionAuth(self.username, self.password,
+                                          session_store=self.store,
+                                          keepalive=keepalive)
+        self.conn._url = 'https://testing:8000'
+        self.mock_sess_serv = mock.Mock(session_timeout=30)
+        self.mock_sess_serv.create_session.return_value = (self.sess_key,
+                                                           self.sess_uri)
+        self.root.get_session_service.return_value = self.mock_sess_serv
+        self.sess_auth.set_context(self.root, self.conn)
+
+    def test__do_authenticate_stores_session(self):
+        self._set_store_context()
+        self.sess_auth.authenticate()
+        entry = self.store.get(self.key)
+        self.assertEqual(self.sess_key, entry['token'])
+        self.assertEqual(self.sess_uri, entry['uri'])
+        self.assertEqual(30, entry['timeout'])
+
+    def test__do_authenticate_reuses_stored_session(self):
+        self._set_store_context()
+        self.store.set(self.key, 'StoredKey', self.sess_uri)
+        self.sess_auth.authenticate()
+        self.root.get_session_service.assert_not_called()
+        self.assertEqual('StoredKey', self.sess_auth.get_session_key())
+        self.assertEqual(self.sess_uri,
+                         self.sess_auth.get_session_resource_id())
+        self.conn.set_http_session_auth.assert_called_once_with('StoredKey')
+
+    @mock.patch.object(auth, '_keepalive_loop', autospec=True)
+    def test__do_authenticate_reuses_stored_session_timeout(self,
+                                                            mock_loop):
+        self._set_store_context(keepalive=True)
+        self.addCleanup(self.sess_auth.close)
+        self.store.set(self.key, 'StoredKey', self.sess_uri, timeout=30)
+        self.sess_auth.authenticate()
+        self.root.get_session_service.assert_not_called()
+        self.assertEqual(30, self.sess_auth._session_timeout)
+        self.assertIsNotNone(self.sess_auth._last_used)
+        self.assertIsNotNone(self.sess_auth._keepalive_stop)
+
+        # NOTE: the reused session gets refreshed ahead of expiry too
+        self.sess_auth._last_used -= 28
+        self.sess_auth.check_session()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+
+    def test_refresh_replaces_stored_session(self):
+        self._set_store_context()
+        self.store.set(self.key, 'StoredKey', self.sess_uri)
+        self.sess_auth.authenticate()
+        self.sess_auth.refresh_session()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+        self.assertEqual(self.sess_key, self.store.get(self.key)['token'])
+        self.assertEqual(self.sess_key, self.sess_auth.get_session_key())
+
+    def test_refresh_reuses_session_refreshed_elsewhere(self):
+        self._set_store_context()
+        self.store.set(self.key, 'StoredKey', self.sess_uri)
+        self.sess_auth.authenticate()
+        self.store.set(self.key, 'OtherKey', self.sess_uri)
+        self.sess_auth.refresh_session()
+        self.mock_sess_serv.create_session.assert_not_called()
+        self.assertEqual('OtherKey', self.sess_auth.get_session_key())
+
+    def test_close_keeps_stored_session(self):
+        self._set_store_context()
+        self.sess_auth.authenticate()
+        self.sess_auth.close()
+        self.conn.delete.assert_not_called()
+        self.assertIsNone(self.sess_auth.get_session_key())
+        self.assertEqual(self.sess_key, self.store.get(self.key)['token'])
+
     @mock.patch.object(auth.SessionAuth, 'close', autospec=True)
     def test_context_manager(self, auth_close):
         with auth.SessionAuth(self.username, self.password) as session_auth:
@@ -296,6 +554,80 @@ class SessionOrBasicAuthTestCase(base.TestCase):
         self.conn.set_http_basic_auth.assert_called_once_with(
             self.username, self.password)
 
+    def _set_memo_context(self, create_session_error=None):
+        self.memo = session_store.AuthMethodMemo()
+        self.sess_basic_auth = auth.SessionOrBasicAuth(
+            self.username, self.password, auth_method_memo=self.memo)
+        self.conn._url = 'https://testing:8000'
+        self.mock_sess_serv = mock.Mock()
+        self.mock_sess_serv.create_session.return_value = (self.sess_key,
+                                                           self.sess_uri)
+        self.mock_sess_serv.create_session.side_effect = create_session_error
+        self.root.get_session_service.return_value = self.mock_sess_serv
+        self.sess_basic_auth.set_context(self.root, self.conn)
+
+    def test__do_authenticate_memo_session(self):
+        self._set_memo_context()
+        self.sess_basic_auth.authenticate()
+        self.assertEqual(session_store.AUTH_METHOD_SESSION,
+                         self.memo.get('https://testing:8000'))
+        self.assertEqual(self.sess_key,
+                         self.sess_basic_auth.get_session_key())
+
+    def test__do_authenticate_memo_basic(self):
+        self._set_memo_context(create_session_error=exceptions.HTTPError(
+            'POST', 'any_url', mock.MagicMock(status_code=405)))
+        self.sess_basic_auth.authenticate()
+        self.assertEqual(session_store.AUTH_METHOD_BASIC,
+                         self.memo.get('https://testing:8000'))
+
+        # NOTE: the next authentication goes straight to basic auth
+        self.sess_basic_auth.authenticate()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+        self.assertEqual(2, self.conn.set_http_basic_auth.call_count)
+        self.assertIsNone(self.sess_basic_auth.get_session_key())
+
+    def test__do_authenticate_memo_no_session_service(self):
+        self._set_memo_context()
+        self.root.get_session_service.side_effect = (
+            exceptions.MissingAttributeError(
+                attribute='SessionService/@odata.id', resource='/redfish/v1'))
+        self.sess_basic_auth.authenticate()
+        self.assertEqual(session_store.AUTH_METHOD_BASIC,
+                         self.memo.get('https://testing:8000'))
+
+    def _test__do_authenticate_memo_not_remembered(self, error):
+        self._set_memo_context(create_session_error=error)
+        self.sess_basic_auth.authenticate()
+        self.assertIsNone(self.memo.get('https://testing:8000'))
+        self.conn.set_http_basic_auth.assert_called_once_with(
+            self.username, self.password)
+
+        # NOTE: sessions are attempted again on the next authentication
+        self.sess_basic_auth.authenticate()
+        self.assertEqual(2, self.mock_sess_serv.create_session.call_count)
+
+    def test__do_authenticate_memo_access_error(self):
+        self._test__do_authenticate_memo_not_remembered(
+            exceptions.AccessError('POST', 'any_url',
+                                   mock.MagicMock(status_code=401)))
+
+    def test__do_authenticate_memo_server_side_error(self):
+        self._test__do_authenticate_memo_not_remembered(
+            exceptions.ServerSideError('POST', 'any_url',
+                                       mock.MagicMock(status_code=503)))
+
+    def test__do_authenticate_memo_expired(self):
+        self._set_memo_context()
+        self.memo._ttl = -1
+        self.memo.set('https://testing:8000', session_store.AUTH_METHOD_BASIC)
+        self.sess_basic_auth.authenticate()
+        self.mock_sess_serv.create_session.assert_called_once_with(
+            self.username, self.password)
+        self.assertEqual(self.sess_key,
+                         self.sess_basic_auth.get_session_key())
+
     def test_can_refresh_session(self):
         mock_sess_serv = mock.Mock()
         mock_sess_serv.create_session.return_value = (self.sess_key,
@@ -0,0 +1,96 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import io
+import json
+
+import mock
+
+from sushy.tests.benchmarks import __main__ as bench_main
+from sushy.tests.benchmarks import runner
+from sushy.tests.unit import base
+
+
+class RunnerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RunnerTestCase, self).setUp()
+        benchmarks = collections.OrderedDict()
+        patcher = mock.patch.object(runner, 'BENCHMARKS', benchmarks)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.calls = []
+        self.teardown = mock.Mock()
+
+        @runner.benchmark('foo.one', 'micro', iterations=3,
+                          setup=lambda options: options['value'],
+                          teardown=self.teardown)
+        def one(context):
+            self.calls.append(context)
+
+        @runner.benchmark('bar.two', 'macro')
+        def two(context):
+            self.calls.append(context)
+
+    def test_run(self):
+        results = runner.run(rounds=2, options={'value': 42})
+
+        self.assertEqual([42] * 6 + [None] * 2, self.calls)
+        self.teardown.assert_called_once_with(42)
+        self.assertIn('sushy_version', results)
+        self.assertIn('timestamp', results)
+        self.assertEqual(['foo.one', 'bar.two'],
+                         [r['name'] for r in results['results']])
+        result = results['results'][0]
+        self.assertEqual('micro', result['group'])
+        self.assertEqual(3, result['iterations'])
+        self.assertEqual(2, result['rounds'])
+        self.assertLessEqual(result['min'], result['median'])
+        self.assertLessEqual(result['median'], result['max'])
+        json.dumps(results)
+
+    def test_run_patterns(self):
+        results = runner.run(['bar.*'], rounds=1)
+        self.assertEqual(['bar.two'],
+                         [r['name'] for r in results['results']])
+        self.assertFalse(self.teardown.called)
+
+
+class BenchmarksTestCase(base.TestCase):
+
+    def test_micro(self):
+        output = io.StringIO()
+        with mock.patch('sys.stdout', output):
+            self.assertEqual(0, bench_main.main(
+                ['--rounds', '1', 'parse.system', 'parse_message']))
+
+        results = json.loads(output.getvalue())
+        self.assertEqual(['parse.system', 'parse_message'],
+                         [r['name'] for r in results['results']])
+
+    def test_fleet(self):
+        output = io.StringIO()
+        with mock.patch('sys.stdout', output):
+            bench_main.main(['--rounds', '1', '--nodes', '3',
+                             'fleet.power_state_sweep'])
+
+        results = json.loads(output.getvalue())
+        self.assertEqual(1, len(results['results']))
+
+    def test_list(self):
+        output = io.StringIO()
+        with mock.patch('sys.stdout', output):
+            bench_main.main(['--list'])
+        self.assertIn('get_members.cold (micro)', output.getvalue())
+        self.assertIn('sushy.cold_start (macro)', output.getvalue())
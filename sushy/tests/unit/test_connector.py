@@ -168,6 +168,46 @@ class ConnectorOpTestCase(base.TestCase):
         self.request.assert_called_once_with(
             'GET', 'http://foo.bar:1234/fake/path',
             headers=self.headers, json=None)
+        self.auth.check_session.assert_called_once_with()
+
+    def test_write_through(self):
+        self.assertFalse(self.conn.write_through)
+        self.conn.set_write_through(True)
+        self.assertTrue(self.conn.write_through)
+
+    def test_ok_get_recorded(self):
+        recorder = mock.Mock()
+        self.conn.set_recorder(recorder)
+        self.conn._op('GET', path='fake/path', headers=self.headers)
+        recorder.record.assert_called_once_with(
+            'GET', 'http://foo.bar:1234/fake/path', self.headers, None,
+            self.request.return_value, mock.ANY, stream=False)
+
+    def test_ok_get_stream_recorded(self):
+        recorder = mock.Mock()
+        self.conn.set_recorder(recorder)
+        self.conn._op('GET', path='fake/path', headers=self.headers,
+                      stream=True)
+        recorder.record.assert_called_once_with(
+            'GET', 'http://foo.bar:1234/fake/path', self.headers, None,
+            self.request.return_value, mock.ANY, stream=True)
+
+    def test_ok_get_metrics(self):
+        metrics = mock.Mock()
+        self.conn.set_metrics(metrics)
+        self.request.return_value.headers = {'Content-Length': '42'}
+        self.conn._op('GET', path='fake/path', headers=self.headers)
+        metrics.request.assert_called_once_with(
+            'GET', 'http://foo.bar:1234/fake/path', http_client.OK,
+            mock.ANY, 42)
+
+    def test_connection_error_metrics(self):
+        metrics = mock.Mock()
+        self.conn.set_metrics(metrics)
+        self.request.side_effect = requests.exceptions.ConnectionError
+        self.assertRaises(exceptions.ConnectionError, self.conn._op, 'GET')
+        metrics.request.assert_called_once_with(
+            'GET', 'http://foo.bar:1234', None, mock.ANY, None)
 
     def test_ok_get_url_redirect_false(self):
         self.conn._op('GET', path='fake/path', headers=self.headers,
@@ -255,6 +295,7 @@ class ConnectorOpTestCase(base.TestCase):
     def test_timed_out_session_re_established(self):
         self.auth._session_key = 'asdf1234'
         self.auth.get_session_key.return_value = 'asdf1234'
+        self.auth.session_generation = 3
         self.conn._auth = self.auth
         self.session = mock.Mock(spec=requests.Session)
         self.conn._session = self.session
@@ -267,9 +308,22 @@ class ConnectorOpTestCase(base.TestCase):
         self.request.side_effect = [first_response, second_response]
         response = self.conn._op('POST', path='fake/path', data=self.data,
                                  headers=self.headers)
-        self.auth.refresh_session.assert_called_with()
+        self.auth.refresh_session.assert_called_with(3)
         self.assertEqual(response.json, second_response.json)
 
+    def test_timed_out_session_re_established_metrics(self):
+        metrics = mock.Mock()
+        self.conn.set_metrics(metrics)
+        first_response = mock.MagicMock()
+        first_response.status_code = http_client.FORBIDDEN
+        second_response = mock.MagicMock()
+        second_response.status_code = http_client.OK
+        self.request.side_effect = [first_response, second_response]
+        self.conn._op('GET', path='fake/path')
+        metrics.retry.assert_called_once_with(
+            'GET', 'http://foo.bar:1234/fake/path', 'auth_refresh')
+        self.assertEqual(2, metrics.request.call_count)
+
     def test_connection_error(self):
         self.request.side_effect = requests.exceptions.ConnectionError
         self.assertRaises(exceptions.ConnectionError, self.conn._op, 'GET')
@@ -299,6 +353,17 @@ class ConnectorOpTestCase(base.TestCase):
         self.assertIsNotNone(exc.body)
         self.assertIn('body submitted was malformed JSON', exc.detail)
 
+    def test_precondition_failed_error(self):
+        self.request.return_value.status_code = (
+            http_client.PRECONDITION_FAILED)
+        self.request.return_value.json.side_effect = ValueError('no json')
+
+        with self.assertRaisesRegex(exceptions.PreconditionFailedError,
+                                    'changed since read, PATCH') as cm:
+            self.conn._op('PATCH', 'http://foo.bar')
+        self.assertEqual(http_client.PRECONDITION_FAILED,
+                         cm.exception.status_code)
+
     def test_not_found_error(self):
         self.request.return_value.status_code = http_client.NOT_FOUND
         self.request.return_value.json.side_effect = ValueError('no json')
@@ -0,0 +1,162 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import mock
+
+from sushy import crawler
+from sushy import exceptions
+from sushy import main
+from sushy.tests.unit import base
+
+TREE = {
+    '/redfish/v1/': {
+        '@odata.id': '/redfish/v1/',
+        '@odata.type': '#ServiceRoot.v1_5_0.ServiceRoot',
+        'Systems': {'@odata.id': '/redfish/v1/Systems'},
+        'Chassis': {'@odata.id': '/redfish/v1/Chassis'},
+        'JsonSchemas': {'@odata.id': '/redfish/v1/JsonSchemas'},
+    },
+    '/redfish/v1/Systems': {
+        '@odata.id': '/redfish/v1/Systems',
+        '@odata.type': '#ComputerSystemCollection.ComputerSystemCollection',
+        'Members': [{'@odata.id': '/redfish/v1/Systems/1'}],
+    },
+    '/redfish/v1/Systems/1': {
+        '@odata.id': '/redfish/v1/Systems/1',
+        '@odata.type': '#ComputerSystem.v1_10_0.ComputerSystem',
+        'Processors': {'@odata.id': '/redfish/v1/Systems/1/Processors'},
+        'Links': {'Chassis': [{'@odata.id': '/redfish/v1/Chassis/1/'}]},
+    },
+    '/redfish/v1/Systems/1/Processors': {
+        '@odata.id': '/redfish/v1/Systems/1/Processors',
+        '@odata.type': '#ProcessorCollection.ProcessorCollection',
+        'Members': [{'@odata.id': '/redfish/v1/Systems/1/Processors/CPU1'}],
+    },
+    '/redfish/v1/Systems/1/Processors/CPU1': {
+        '@odata.id': '/redfish/v1/Systems/1/Processors/CPU1',
+        '@odata.type': '#Processor.v1_0_0.Processor',
+    },
+    '/redfish/v1/Chassis': {
+        '@odata.id': '/redfish/v1/Chassis',
+        '@odata.type': '#ChassisCollection.ChassisCollection',
+        'Members': [{'@odata.id': '/redfish/v1/Chassis/1'}],
+    },
+    '/redfish/v1/Chassis/1': {
+        '@odata.id': '/redfish/v1/Chassis/1',
+        '@odata.type': '#Chassis.v1_8_0.Chassis',
+        'Links': {
+            'ComputerSystems': [{'@odata.id': '/redfish/v1/Systems/1'}],
+            'CooledBy': [
+                {'@odata.id': '/redfish/v1/Chassis/1/Thermal#/Fans/0'}],
+        },
+    },
+}
+
+
+class CrawlerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(CrawlerTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.conn.get.side_effect = self._get
+        self.root = mock.Mock(_conn=self.conn, path='/redfish/v1/')
+        self.tree = dict(TREE)
+
+    def _get(self, path):
+        path = path.split('?', 1)[0]
+        if path not in self.tree:
+            raise exceptions.ConnectionError(url=path, error='unreachable')
+        return mock.Mock(json=mock.Mock(return_value=self.tree[path]))
+
+    def _fetched(self):
+        return sorted(c[1]['path'] for c in self.conn.get.call_args_list)
+
+    def test_crawl(self):
+        records = list(crawler.Crawler(self.root))
+
+        self.assertEqual(
+            ['/redfish/v1', '/redfish/v1/Chassis', '/redfish/v1/Chassis/1',
+             '/redfish/v1/Systems', '/redfish/v1/Systems/1',
+             '/redfish/v1/Systems/1/Processors',
+             '/redfish/v1/Systems/1/Processors/CPU1'],
+            sorted(r.path for r in records))
+        self.assertEqual(
+            ['/redfish/v1/', '/redfish/v1/Chassis', '/redfish/v1/Chassis/1',
+             '/redfish/v1/Systems', '/redfish/v1/Systems/1',
+             '/redfish/v1/Systems/1/Processors',
+             '/redfish/v1/Systems/1/Processors/CPU1'],
+            self._fetched())
+        depths = {r.path: r.depth for r in records}
+        self.assertEqual(0, depths['/redfish/v1'])
+        self.assertEqual(2, depths['/redfish/v1/Chassis/1'])
+        self.assertEqual(4, depths['/redfish/v1/Systems/1/Processors/CPU1'])
+        self.assertEqual('ServiceRoot', records[0].resource_type)
+
+    def test_crawl_types(self):
+        records = list(crawler.Crawler(
+            self.root, types=['Processor', 'Chassis']))
+        self.assertEqual(
+            ['/redfish/v1/Chassis/1',
+             '/redfish/v1/Systems/1/Processors/CPU1'],
+            sorted(r.path for r in records))
+
+    def test_crawl_max_depth(self):
+        records = list(crawler.Crawler(self.root, max_depth=1))
+        self.assertEqual(
+            ['/redfish/v1', '/redfish/v1/Chassis', '/redfish/v1/Systems'],
+            sorted(r.path for r in records))
+        self.assertEqual(3, self.conn.get.call_count)
+
+    def test_crawl_exclude_paths(self):
+        records = list(crawler.Crawler(
+            self.root, exclude_paths=['/redfish/v1/Systems/1/Processors']))
+        self.assertNotIn('/redfish/v1/Systems/1/Processors/CPU1',
+                         [r.path for r in records])
+
+    def test_crawl_errors(self):
+        del self.tree['/redfish/v1/Chassis']
+        self.tree['/redfish/v1/Systems/1'] = dict(
+            self.tree['/redfish/v1/Systems/1'], Links={})
+        crawl = crawler.Crawler(self.root)
+        records = list(crawl)
+        self.assertEqual(5, len(records))
+        self.assertEqual(['/redfish/v1/Chassis'], list(crawl.errors))
+        self.assertIsInstance(crawl.errors['/redfish/v1/Chassis'],
+                              exceptions.ConnectionError)
+
+    def test_crawl_expand(self):
+        self.tree['/redfish/v1/Systems'] = {
+            '@odata.id': '/redfish/v1/Systems',
+            '@odata.type': '#ComputerSystemCollection.'
+                           'ComputerSystemCollection',
+            'Members': [TREE['/redfish/v1/Systems/1']],
+        }
+        records = list(crawler.Crawler(self.root, expand=True))
+
+        self.assertEqual(7, len(records))
+        fetched = self._fetched()
+        self.assertNotIn('/redfish/v1/Systems/1?$expand=.($levels=1)',
+                         fetched)
+        self.assertIn('/redfish/v1/Systems?$expand=.($levels=1)', fetched)
+        self.assertEqual(6, len(fetched))
+
+    def test_crawl_sushy(self):
+        root = mock.Mock(_conn=self.conn, path='/redfish/v1/')
+        with mock.patch.object(crawler, 'Crawler',
+                               autospec=True) as mock_crawler:
+            main.Sushy.crawl(root, max_depth=2)
+        mock_crawler.assert_called_once_with(root, max_depth=2)
+        mock_crawler.return_value.crawl.assert_called_once_with()
+
+    def test_init_invalid_max_workers(self):
+        self.assertRaises(ValueError, crawler.Crawler, self.root,
+                          max_workers=0)
@@ -0,0 +1,173 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import tempfile
+import time
+import zipfile
+
+import requests
+
+from sushy.tests import emulator
+from sushy.tests.unit import base
+
+SYSTEM_PATH = '/redfish/v1/Systems/437XR1138R2'
+
+
+class EmulatorTestCase(base.TestCase):
+
+    def _start(self, count=2, profile=None, **kwargs):
+        emu = emulator.Emulator(**kwargs)
+        emu.add_bmcs(count, profile=profile)
+        emu.start()
+        self.addCleanup(emu.stop)
+        return emu
+
+    def _get(self, emu, name, path, **kwargs):
+        kwargs.setdefault('auth', ('admin', 'password'))
+        return requests.get(emu.url(name) + path, **kwargs)
+
+    def test_load_samples(self):
+        tree = emulator.load_samples()
+        self.assertEqual('RootService', tree['/redfish/v1']['Id'])
+        self.assertIn(SYSTEM_PATH, tree)
+        self.assertIn('/redfish/v1/Registries/Test/Test.1.0.json', tree)
+
+    def test_load_recording(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        filename = os.path.join(tmpdir.name, 'recording.zip')
+        entries = [
+            {'method': 'GET', 'url': '/redfish/v1/', 'status': 200,
+             'body': 'bodies/0'},
+            {'method': 'GET', 'url': '/redfish/v1/Foo?$select=Id',
+             'status': 200, 'body': 'bodies/1'},
+            {'method': 'GET', 'url': '/redfish/v1/Bar', 'status': 404,
+             'body': 'bodies/2'},
+        ]
+        with zipfile.ZipFile(filename, 'w') as archive:
+            archive.writestr('recording.json',
+                             json.dumps({'version': 1, 'entries': entries}))
+            archive.writestr('bodies/0', '{"Id": "Root"}')
+            archive.writestr('bodies/1', '{"Id": "Foo"}')
+            archive.writestr('bodies/2', '{}')
+
+        self.assertEqual({'/redfish/v1': {'Id': 'Root'},
+                          '/redfish/v1/Foo': {'Id': 'Foo'}},
+                         emulator.load_recording(filename))
+
+    def test_get(self):
+        emu = self._start()
+        self.assertEqual(['bmc-0', 'bmc-1'], list(emu.bmcs))
+        self.assertNotEqual(emu.url('bmc-0'), emu.url('bmc-1'))
+
+        rsp = self._get(emu, 'bmc-1', SYSTEM_PATH)
+        self.assertEqual(200, rsp.status_code)
+        self.assertEqual('On', rsp.json()['PowerState'])
+        self.assertEqual(1, emu.bmcs['bmc-1'].requests['GET'])
+        self.assertEqual(0, emu.bmcs['bmc-0'].requests['GET'])
+
+        self.assertEqual(404, self._get(emu, 'bmc-0', '/redfish/v1/Foo')
+                         .status_code)
+        self.assertEqual(401, self._get(emu, 'bmc-0', SYSTEM_PATH,
+                                        auth=('admin', 'wrong'))
+                         .status_code)
+        # the service root needs no authentication
+        self.assertEqual(200, self._get(emu, 'bmc-0', '/redfish/v1/',
+                                        auth=None).status_code)
+
+    def test_get_select(self):
+        emu = self._start(count=1)
+        rsp = self._get(emu, 'bmc-0', SYSTEM_PATH + '?$select=PowerState')
+        self.assertEqual({'@odata.id', '@odata.type', '@odata.context',
+                          'PowerState'}, set(rsp.json()))
+
+    def test_virtual_hosts(self):
+        emu = self._start(virtual_hosts=True)
+        self.assertEqual(emu.url('bmc-0'), emu.url('bmc-1'))
+
+        conn = emu.connector('bmc-1')
+        conn.set_http_basic_auth('admin', 'password')
+        self.assertEqual(200, conn.get(SYSTEM_PATH).status_code)
+        self.assertEqual(1, emu.bmcs['bmc-1'].requests['GET'])
+        self.assertEqual(0, emu.bmcs['bmc-0'].requests['GET'])
+
+        self.assertEqual(404, self._get(emu, 'bmc-0', SYSTEM_PATH,
+                                        headers={'Host': 'unknown'})
+                         .status_code)
+
+    def test_patch_and_reset(self):
+        emu = self._start()
+        url = emu.url('bmc-0') + SYSTEM_PATH
+        auth = ('admin', 'password')
+
+        rsp = requests.patch(url, json={'AssetTag': 'Rack1'}, auth=auth)
+        self.assertEqual('Rack1', rsp.json()['AssetTag'])
+        rsp = requests.post(url + '/Actions/ComputerSystem.Reset',
+                            json={'ResetType': 'ForceOff'}, auth=auth)
+        self.assertEqual(204, rsp.status_code)
+
+        doc = self._get(emu, 'bmc-0', SYSTEM_PATH).json()
+        self.assertEqual('Off', doc['PowerState'])
+        self.assertEqual('Rack1', doc['AssetTag'])
+        # the other BMCs are left alone
+        doc = self._get(emu, 'bmc-1', SYSTEM_PATH).json()
+        self.assertEqual('On', doc['PowerState'])
+        self.assertNotEqual('Rack1', doc['AssetTag'])
+
+    def test_sessions(self):
+        emu = self._start(count=1,
+                          profile=emulator.BmcProfile(max_sessions=1))
+        url = emu.url('bmc-0') + emulator.SESSIONS_PATH
+        creds = {'UserName': 'admin', 'Password': 'password'}
+
+        self.assertEqual(401, requests.post(
+            url, json=dict(creds, Password='wrong')).status_code)
+        rsp = requests.post(url, json=creds)
+        self.assertEqual(201, rsp.status_code)
+        token = rsp.headers['X-Auth-Token']
+        location = rsp.headers['Location']
+
+        rsp = self._get(emu, 'bmc-0', SYSTEM_PATH, auth=None,
+                        headers={'X-Auth-Token': token})
+        self.assertEqual(200, rsp.status_code)
+        self.assertEqual(503, requests.post(url, json=creds).status_code)
+
+        rsp = requests.delete(emu.url('bmc-0') + location,
+                              headers={'X-Auth-Token': token})
+        self.assertEqual(204, rsp.status_code)
+        self.assertEqual([], emu.bmcs['bmc-0'].sessions)
+        self.assertEqual(401, self._get(emu, 'bmc-0', SYSTEM_PATH,
+                                        auth=None,
+                                        headers={'X-Auth-Token': token})
+                         .status_code)
+
+    def test_error_bursts(self):
+        emu = self._start(count=1, profile=emulator.BmcProfile(
+            burst_every=3, burst_length=1, retry_after=5))
+        statuses = [self._get(emu, 'bmc-0', SYSTEM_PATH) for _ in range(6)]
+        self.assertEqual([200, 200, 503, 200, 200, 503],
+                         [r.status_code for r in statuses])
+        self.assertEqual('5', statuses[2].headers['Retry-After'])
+
+    def test_close_connection(self):
+        emu = self._start(count=1, profile=emulator.BmcProfile(
+            close_connection=True))
+        rsp = self._get(emu, 'bmc-0', SYSTEM_PATH)
+        self.assertEqual('close', rsp.headers['Connection'])
+
+    def test_latency(self):
+        emu = self._start(count=1, profile=emulator.BmcProfile(latency=0.1))
+        started = time.monotonic()
+        self._get(emu, 'bmc-0', SYSTEM_PATH)
+        self.assertGreaterEqual(time.monotonic() - started, 0.1)
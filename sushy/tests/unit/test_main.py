@@ -22,12 +22,14 @@ from sushy import exceptions
 from sushy import main
 from sushy.resources.chassis import chassis
 from sushy.resources.compositionservice import compositionservice
+from sushy.resources.eventservice import eventservice
 from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
 from sushy.resources.registry import message_registry_file
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
+from sushy.resources.telemetryservice import telemetryservice
 from sushy.resources.updateservice import updateservice
 from sushy.tests.unit import base
 
@@ -287,6 +289,20 @@ class MainTestCase(base.TestCase):
             self.root._conn, '/redfish/v1/UpdateService',
             self.root.redfish_version, self.root.registries)
 
+    @mock.patch.object(eventservice, 'EventService', autospec=True)
+    def test_get_event_service(self, mock_event_serv):
+        self.root.get_event_service()
+        mock_event_serv.assert_called_once_with(
+            self.root._conn, '/redfish/v1/EventService',
+            self.root.redfish_version, self.root.registries)
+
+    @mock.patch.object(telemetryservice, 'TelemetryService', autospec=True)
+    def test_get_telemetry_service(self, mock_telemetry_serv):
+        self.root.get_telemetry_service()
+        mock_telemetry_serv.assert_called_once_with(
+            self.root._conn, '/redfish/v1/TelemetryService',
+            self.root.redfish_version, self.root.registries)
+
     @mock.patch.object(message_registry_file,
                        'MessageRegistryFileCollection',
                        autospec=True)
@@ -384,6 +400,55 @@ class MainTestCase(base.TestCase):
         self.assertEqual({'RegistryA.2.0': mock_msg_reg1}, registries)
 
 
+class FastStartMainTestCase(base.TestCase):
+
+    def setUp(self):
+        super(FastStartMainTestCase, self).setUp()
+        self.addCleanup(main._ROOT_CACHE.clear)
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/root.json') as f:
+            self.json_doc = json.load(f)
+        self.conn.get.return_value.json.return_value = self.json_doc
+        self.auth = mock.Mock()
+
+    def _sushy(self, **kwargs):
+        return main.Sushy('http://foo.bar:1234', auth=self.auth,
+                          connector=self.conn, **kwargs)
+
+    def test_root_json(self):
+        root = self._sushy(root_json=self.json_doc)
+        self.conn.get.assert_not_called()
+        self.assertEqual('1.0.2', root.redfish_version)
+        self.auth.authenticate.assert_called_once_with()
+        # NOTE: refreshing gets the document
+        root.refresh()
+        self.conn.get.assert_called_once_with(path='/redfish/v1/')
+
+    def test_fast_start(self):
+        root = self._sushy(fast_start=True)
+        self.conn.get.assert_called_once_with(path='/redfish/v1/')
+        self.auth.authenticate.assert_not_called()
+        self.auth.defer_authentication.assert_called_once_with()
+        self.assertEqual('1.0.2', root.redfish_version)
+
+        self.conn.get.reset_mock()
+        root = self._sushy(fast_start=True)
+        self.conn.get.assert_not_called()
+        self.assertEqual('/redfish/v1/Systems', root._systems_path)
+
+    def test_write_through(self):
+        self._sushy()
+        self.conn.set_write_through.assert_not_called()
+        self._sushy(write_through=True)
+        self.conn.set_write_through.assert_called_once_with(True)
+
+    def test_fast_start_other_url(self):
+        self._sushy(fast_start=True)
+        main.Sushy('http://other:1234', auth=self.auth, connector=self.conn,
+                   fast_start=True)
+        self.assertEqual(2, self.conn.get.call_count)
+
+
 class BareMinimumMainTestCase(base.TestCase):
 
     def setUp(self):
@@ -425,6 +490,16 @@ class BareMinimumMainTestCase(base.TestCase):
             exceptions.MissingAttributeError,
             'UpdateService/@odata.id', self.root.get_update_service)
 
+    def test_get_event_service_when_eventservice_attr_absent(self):
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError,
+            'EventService/@odata.id', self.root.get_event_service)
+
+    def test_get_telemetry_service_when_telemetryservice_attr_absent(self):
+        self.assertRaisesRegex(
+            exceptions.MissingAttributeError,
+            'TelemetryService/@odata.id', self.root.get_telemetry_service)
+
     def test_get_composition_service_when_compositionservice_attr_absent(
         self):
         self.assertRaisesRegex(
@@ -0,0 +1,88 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from sushy import metrics
+from sushy.tests.unit import base
+
+
+class TemplatePathTestCase(base.TestCase):
+
+    def test_collection_members(self):
+        self.assertEqual(
+            '/redfish/v1/Systems/{id}/Processors/{id}',
+            metrics.template_path('/redfish/v1/Systems/437XR1138R2/'
+                                  'Processors/CPU1'))
+
+    def test_named_resources(self):
+        self.assertEqual('/redfish/v1/Chassis/{id}/Thermal',
+                         metrics.template_path('/redfish/v1/Chassis/Blade1/'
+                                               'Thermal'))
+        self.assertEqual('/redfish/v1/SessionService',
+                         metrics.template_path('/redfish/v1/SessionService'))
+
+    def test_url_and_query(self):
+        self.assertEqual(
+            '/redfish/v1/Managers/{id}',
+            metrics.template_path('https://bmc:8000/redfish/v1/Managers/BMC'
+                                  '?$select=Status'))
+
+
+class PrometheusMetricsTestCase(base.TestCase):
+
+    def setUp(self):
+        super(PrometheusMetricsTestCase, self).setUp()
+        self.metrics = metrics.PrometheusMetrics(buckets=(0.1, 1.0))
+
+    def test_render_empty(self):
+        text = self.metrics.render()
+        self.assertIn('# TYPE sushy_requests_total counter\n', text)
+        self.assertIn('# TYPE sushy_request_duration_seconds histogram\n',
+                      text)
+        self.assertNotIn('{', text)
+
+    def test_render(self):
+        url = 'http://bmc:8000/redfish/v1/Systems/1'
+        self.metrics.request('GET', url, 200, 0.05, 100)
+        self.metrics.request('GET', 'http://bmc:8000/redfish/v1/Systems/2',
+                             200, 0.5, 50)
+        self.metrics.request('GET', url, None, 2.0, None)
+        self.metrics.retry('GET', url, 'auth_refresh')
+        text = self.metrics.render()
+
+        labels = 'bmc="bmc:8000",method="GET",path="/redfish/v1/Systems/{id}"'
+        self.assertIn('sushy_requests_total{%s,status="200"} 2\n' % labels,
+                      text)
+        self.assertIn('sushy_requests_total{%s,status="error"} 1\n' % labels,
+                      text)
+        self.assertIn('sushy_request_duration_seconds_bucket{%s,le="0.1"} 1\n'
+                      % labels, text)
+        self.assertIn('sushy_request_duration_seconds_bucket{%s,le="1.0"} 2\n'
+                      % labels, text)
+        self.assertIn('sushy_request_duration_seconds_bucket{%s,le="+Inf"} '
+                      '3\n' % labels, text)
+        self.assertIn('sushy_request_duration_seconds_sum{%s} 2.55\n'
+                      % labels, text)
+        self.assertIn('sushy_request_duration_seconds_count{%s} 3\n'
+                      % labels, text)
+        self.assertIn('sushy_response_bytes_total{%s} 150\n' % labels, text)
+        self.assertIn('sushy_retries_total{%s,reason="auth_refresh"} 1\n'
+                      % labels, text)
+
+    def test_namespace(self):
+        collector = metrics.PrometheusMetrics(namespace='fleet')
+        collector.request('GET', 'http://bmc/redfish/v1', 200, 0.01, 10)
+        self.assertIn('fleet_requests_total{', collector.render())
+
+    def test_base_is_noop(self):
+        collector = metrics.MetricsBase()
+        self.assertIsNone(collector.request('GET', 'http://bmc', 200, 0.1, 1))
+        self.assertIsNone(collector.retry('GET', 'http://bmc', 'x'))
@@ -0,0 +1,150 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gc
+import logging
+
+import mock
+
+import sushy
+from sushy import auth as sushy_auth
+from sushy import connector as sushy_connector
+from sushy import main
+from sushy import pool
+from sushy.tests import emulator
+from sushy.tests.unit import base
+
+
+class SessionPoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SessionPoolTestCase, self).setUp()
+        self.auth_type = mock.Mock()
+        self.pool = pool.SessionPool(auth_type=self.auth_type, foo='bar')
+
+    @mock.patch.object(sushy_connector, 'Connector', autospec=True)
+    def test_acquire_shared(self, mock_connector):
+        conn1, lease1 = self.pool.acquire('http://bmc/', 'foo', 'bar')
+        conn2, lease2 = self.pool.acquire('http://bmc', 'foo', 'bar')
+        self.assertIs(conn1, conn2)
+        self.assertIsNot(lease1, lease2)
+        self.assertEqual(1, len(self.pool))
+        mock_connector.assert_called_once_with('http://bmc/', verify=True)
+        self.auth_type.assert_called_once_with('foo', 'bar', foo='bar')
+
+    @mock.patch.object(sushy_connector, 'Connector', autospec=True)
+    def test_acquire_distinct(self, mock_connector):
+        self.pool.acquire('http://bmc', 'foo', 'bar')
+        self.pool.acquire('http://bmc', 'foo', 'baz')
+        self.pool.acquire('http://bmc', 'other', 'bar')
+        self.pool.acquire('http://bmc', 'foo', 'bar', verify=False)
+        self.pool.acquire('http://other-bmc', 'foo', 'bar')
+        self.assertEqual(5, len(self.pool))
+
+    @mock.patch.object(main, 'Sushy', autospec=True)
+    @mock.patch.object(sushy_connector, 'Connector', autospec=True)
+    def test_authenticate_once(self, mock_connector, mock_sushy):
+        root1, root2 = mock.Mock(), mock.Mock()
+        conn, lease1 = self.pool.acquire('http://bmc', 'foo', 'bar')
+        _conn, lease2 = self.pool.acquire('http://bmc', 'foo', 'bar')
+        auth = self.auth_type.return_value
+
+        for root, lease in ((root1, lease1), (root2, lease2)):
+            lease.set_context(root, conn)
+            lease.authenticate()
+
+        mock_sushy.assert_called_once_with(
+            root1._base_url, root_prefix=root1._root_prefix,
+            auth=mock.ANY, connector=conn,
+            public_connector=root1._public_connector,
+            language=root1._language, root_json=root1.json)
+        auth.set_context.assert_called_once_with(mock_sushy.return_value,
+                                                 conn)
+        auth.authenticate.assert_called_once_with()
+        auth.can_refresh_session.return_value = True
+        self.assertTrue(lease2.can_refresh_session())
+
+    @mock.patch.object(sushy_connector, 'Connector', autospec=True)
+    def test_release(self, mock_connector):
+        conn, lease1 = self.pool.acquire('http://bmc', 'foo', 'bar')
+        _conn, lease2 = self.pool.acquire('http://bmc', 'foo', 'bar')
+        auth = self.auth_type.return_value
+
+        lease1.close()
+        # NOTE: closing twice only releases once
+        lease1.close()
+        auth.close.assert_not_called()
+        self.assertEqual(1, len(self.pool))
+
+        lease2.close()
+        auth.close.assert_called_once_with()
+        conn.close.assert_called_once_with()
+        self.assertEqual(0, len(self.pool))
+
+        self.pool.acquire('http://bmc', 'foo', 'bar')
+        self.assertEqual(2, self.auth_type.call_count)
+
+    @mock.patch.object(main, 'Sushy', autospec=True)
+    @mock.patch.object(sushy_connector, 'Connector', autospec=True)
+    def test_connect_failure_releases(self, mock_connector, mock_sushy):
+        mock_sushy.side_effect = RuntimeError('boom')
+        self.assertRaises(RuntimeError, self.pool.connect, 'http://bmc',
+                          'foo', 'bar')
+        self.assertEqual(0, len(self.pool))
+
+    def test_default_pool(self):
+        self.assertIs(pool.get_default_pool(), pool.get_default_pool())
+
+
+class SessionPoolEmulatorTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SessionPoolEmulatorTestCase, self).setUp()
+        self.emu = emulator.Emulator()
+        self.emu.add_bmc('bmc', profile=emulator.BmcProfile(max_sessions=1))
+        self.emu.start()
+        self.addCleanup(self.emu.stop)
+        self.bmc = self.emu.bmcs['bmc']
+        self.pool = pool.SessionPool(auth_type=sushy_auth.SessionAuth)
+
+    def test_shared_session(self):
+        url = self.emu.url('bmc')
+        roots = [self.pool.connect(url, 'admin', 'password')
+                 for _ in range(3)]
+        self.assertEqual(1, len(self.bmc.sessions))
+        for root in roots:
+            self.assertEqual(sushy.SYSTEM_POWER_STATE_ON,
+                             root.get_system().power_state)
+
+        for root in roots[:-1]:
+            root._auth.close()
+        self.assertEqual(1, len(self.bmc.sessions))
+        roots[-1]._auth.close()
+        self.assertEqual([], self.bmc.sessions)
+
+    def test_garbage_collected(self):
+        # NOTE: captured log records of errors would keep the frames of
+        # the failed requests, hence the Sushy instances, alive
+        logger = logging.getLogger('sushy')
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel(logging.ERROR)
+        url = self.emu.url('bmc')
+        roots = [self.pool.connect(url, 'admin', 'password')
+                 for _ in range(2)]
+        for root in roots:
+            root.get_system().power_state
+        self.assertEqual(1, len(self.bmc.sessions))
+
+        del root, roots
+        gc.collect()
+        self.assertEqual(0, len(self.pool))
+        self.assertEqual([], self.bmc.sessions)
@@ -0,0 +1,283 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+import mock
+import requests
+
+from sushy import connector
+from sushy import exceptions
+from sushy import recorder
+from sushy.tests.unit import base
+from sushy import tracing
+
+
+def _response(status_code, doc=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.reason = 'Reason'
+    response.headers.update(headers or {})
+    response._content = json.dumps(doc).encode() if doc is not None else b''
+    return response
+
+
+def _streamed_response():
+    response = requests.Response()
+    response.status_code = 200
+    response.reason = 'OK'
+    response.headers['Content-Type'] = 'text/event-stream'
+    response.raw = io.BytesIO(b'data: {}\n\n')
+    return response
+
+
+class RecorderTestCase(base.TestCase):
+
+    def setUp(self):
+        super(RecorderTestCase, self).setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'recording.zip')
+
+        self.conn = connector.Connector('http://foo.bar:1234')
+        self.conn._auth = mock.Mock()
+        self.recorder = recorder.ArchiveRecorder(self.filename)
+        self.conn.set_recorder(self.recorder)
+        self.session = mock.Mock()
+        self.conn._session = self.session
+
+    def _record(self):
+        self.session.request.side_effect = [
+            _response(201, {'Id': '1'},
+                      {'X-Auth-Token': 'secret', 'Location': '/s/1'}),
+            _response(200, {'PowerState': 'On'}),
+            _response(200, {'PowerState': 'Off'}),
+            _response(404, {}),
+        ]
+        self.conn.post('/redfish/v1/SessionService/Sessions',
+                       data={'UserName': 'foo', 'Password': 'bar'})
+        self.conn.get('/redfish/v1/Systems/1',
+                      headers={'X-Auth-Token': 'secret'})
+        self.conn.get('/redfish/v1/Systems/1')
+        self.assertRaises(exceptions.ResourceNotFoundError,
+                          self.conn.get, '/redfish/v1/Systems/2?$select=Id')
+        self.recorder.save()
+
+    def test_record(self):
+        self._record()
+        self.assertEqual(4, len(self.recorder))
+
+        with zipfile.ZipFile(self.filename) as archive:
+            index = json.loads(archive.read(recorder.INDEX_NAME))
+            self.assertEqual(b'{"PowerState": "On"}',
+                             archive.read(index['entries'][1]['body']))
+
+        self.assertEqual(recorder.ARCHIVE_VERSION, index['version'])
+        self.assertEqual('http://foo.bar:1234', index['base_url'])
+        entries = index['entries']
+        self.assertEqual(
+            [('POST', '/redfish/v1/SessionService/Sessions', 201),
+             ('GET', '/redfish/v1/Systems/1', 200),
+             ('GET', '/redfish/v1/Systems/1', 200),
+             ('GET', '/redfish/v1/Systems/2?$select=Id', 404)],
+            [(e['method'], e['url'], e['status']) for e in entries])
+        self.assertEqual({'UserName': 'foo', 'Password': recorder.REDACTED},
+                         entries[0]['request_data'])
+        self.assertEqual(recorder.REDACTED,
+                         entries[0]['headers']['X-Auth-Token'])
+        self.assertEqual('/s/1', entries[0]['headers']['Location'])
+        self.assertEqual(recorder.REDACTED,
+                         entries[1]['request_headers']['X-Auth-Token'])
+        self.assertGreaterEqual(entries[1]['elapsed'], 0)
+
+    def test_record_stream(self):
+        response = _streamed_response()
+        self.session.request.return_value = response
+        self.conn.get('/redfish/v1/EventService/SSE', stream=True)
+        self.recorder.save()
+
+        self.assertFalse(response._content_consumed)
+        with zipfile.ZipFile(self.filename) as archive:
+            index = json.loads(archive.read(recorder.INDEX_NAME))
+            entry, = index['entries']
+            self.assertTrue(entry['stream'])
+            self.assertEqual(b'', archive.read(entry['body']))
+
+    def test_replay(self):
+        self._record()
+        conn = recorder.ReplayConnector(self.filename)
+        conn._auth = mock.Mock()
+
+        response = conn.post('/redfish/v1/SessionService/Sessions',
+                             data={'UserName': 'foo', 'Password': 'bar'})
+        self.assertEqual(201, response.status_code)
+        self.assertEqual('/s/1', response.headers['location'])
+        self.assertEqual(
+            'On', conn.get('/redfish/v1/Systems/1').json()['PowerState'])
+        self.assertEqual(
+            'Off', conn.get('/redfish/v1/Systems/1').json()['PowerState'])
+        # the last recording is repeated
+        self.assertEqual(
+            'Off', conn.get('/redfish/v1/Systems/1').json()['PowerState'])
+        self.assertRaises(exceptions.ResourceNotFoundError,
+                          conn.get, '/redfish/v1/Systems/2?$select=Id')
+
+    def test_replay_instrumented(self):
+        self._record()
+        conn = recorder.ReplayConnector(self.filename)
+        metrics = mock.Mock()
+        conn.set_metrics(metrics)
+        tracer = tracing.RecordingTracer()
+        tracing.set_tracer(tracer)
+        self.addCleanup(tracing.set_tracer, None)
+
+        conn.get('/redfish/v1/Systems/1')
+        self.assertRaises(exceptions.ConnectionError,
+                          conn.get, '/redfish/v1/Managers')
+
+        url = conn._url + '/redfish/v1/Systems/1'
+        metrics.request.assert_has_calls([
+            mock.call('GET', url, 200, mock.ANY, mock.ANY),
+            mock.call('GET', conn._url + '/redfish/v1/Managers', None,
+                      mock.ANY, None)])
+        span, = [span for span in tracer.roots
+                 if span.attributes.get('http.url') == url]
+        self.assertEqual('HTTP GET', span.name)
+        self.assertEqual(200, span.attributes['http.status_code'])
+
+    def test_replay_missing_recording(self):
+        self._record()
+        conn = recorder.ReplayConnector(self.filename)
+        self.assertRaisesRegex(exceptions.ConnectionError,
+                               'No recording for GET /redfish/v1/Managers',
+                               conn.get, '/redfish/v1/Managers')
+
+    @mock.patch('time.sleep', autospec=True)
+    def test_replay_latency(self, mock_sleep):
+        self._record()
+        conn = recorder.ReplayConnector(self.filename, latency_scale=2.0)
+        conn.get('/redfish/v1/Systems/1')
+        elapsed = conn._recordings['GET', '/redfish/v1/Systems/1'][0][
+            'elapsed']
+        mock_sleep.assert_called_once_with(elapsed * 2.0)
+
+    def test_replay_invalid_version(self):
+        with zipfile.ZipFile(self.filename, 'w') as archive:
+            archive.writestr(recorder.INDEX_NAME, json.dumps({'version': 9}))
+        self.assertRaises(exceptions.ArchiveParsingError,
+                          recorder.ReplayConnector, self.filename)
+
+
+class HarRecorderTestCase(base.TestCase):
+
+    def setUp(self):
+        super(HarRecorderTestCase, self).setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.directory = os.path.join(tmpdir.name, 'har')
+        self.recorder = recorder.HarRecorder(self.directory)
+        self.session = mock.Mock()
+
+        self.conns = []
+        for url in ('http://foo.bar:1234', 'http://bar.baz'):
+            conn = connector.Connector(url)
+            conn._auth = mock.Mock()
+            conn._session = self.session
+            conn.set_recorder(self.recorder)
+            self.conns.append(conn)
+
+    def test_save(self):
+        self.session.request.side_effect = [
+            _response(201, {'Id': '1'},
+                      {'X-Auth-Token': 'secret', 'Location': '/s/1',
+                       'Content-Type': 'application/json'}),
+            _response(200, {'PowerState': 'On', 'Password': 'hidden'}),
+            _response(200, {'PowerState': 'Off'}),
+        ]
+        self.conns[0].post('/redfish/v1/SessionService/Sessions',
+                           data={'UserName': 'foo', 'Password': 'bar'})
+        self.conns[0].get('/redfish/v1/Systems/1?$select=PowerState',
+                          headers={'X-Auth-Token': 'secret'})
+        self.conns[1].get('/redfish/v1/Systems/1')
+
+        self.assertEqual(['bar.baz', 'foo.bar:1234'], self.recorder.bmcs)
+        filenames = self.recorder.save()
+        self.assertEqual([os.path.join(self.directory, 'bar.baz.har'),
+                          os.path.join(self.directory, 'foo.bar_1234.har')],
+                         filenames)
+
+        with open(filenames[1]) as f:
+            har = json.load(f)
+        self.assertEqual(recorder.HAR_VERSION, har['log']['version'])
+        self.assertEqual('sushy', har['log']['creator']['name'])
+        post, get = har['log']['entries']
+
+        self.assertEqual('POST', post['request']['method'])
+        self.assertEqual(
+            'http://foo.bar:1234/redfish/v1/SessionService/Sessions',
+            post['request']['url'])
+        self.assertEqual({'mimeType': 'application/json',
+                          'text': '{"UserName": "foo", "Password": '
+                                  '"<redacted>"}'},
+                         post['request']['postData'])
+        response_headers = {h['name']: h['value']
+                            for h in post['response']['headers']}
+        self.assertEqual(recorder.REDACTED, response_headers['X-Auth-Token'])
+        self.assertEqual('/s/1', post['response']['redirectURL'])
+        self.assertEqual(201, post['response']['status'])
+        self.assertEqual('application/json',
+                         post['response']['content']['mimeType'])
+
+        request_headers = {h['name']: h['value']
+                           for h in get['request']['headers']}
+        self.assertEqual(recorder.REDACTED, request_headers['X-Auth-Token'])
+        self.assertEqual([{'name': '$select', 'value': 'PowerState'}],
+                         get['request']['queryString'])
+        content = get['response']['content']
+        self.assertEqual({'PowerState': 'On', 'Password': recorder.REDACTED},
+                         json.loads(content['text']))
+        self.assertEqual(len(b'{"PowerState": "On", "Password": "hidden"}'),
+                         content['size'])
+        timings = get['timings']
+        self.assertEqual(-1, timings['connect'])
+        self.assertAlmostEqual(get['time'],
+                               timings['send'] + timings['wait'] +
+                               timings['receive'])
+
+    def test_without_bodies(self):
+        rec = recorder.HarRecorder(self.directory, include_bodies=False)
+        self.conns[0].set_recorder(rec)
+        self.session.request.return_value = _response(200, {'Id': '1'})
+        self.conns[0].get('/redfish/v1')
+
+        content = rec.to_har('foo.bar:1234')['log']['entries'][0][
+            'response']['content']
+        self.assertNotIn('text', content)
+        self.assertEqual(11, content['size'])
+
+    def test_stream(self):
+        response = _streamed_response()
+        self.session.request.return_value = response
+        self.conns[0].get('/redfish/v1/EventService/SSE', stream=True)
+
+        self.assertFalse(response._content_consumed)
+        har_response = self.recorder.to_har('foo.bar:1234')['log'][
+            'entries'][0]['response']
+        self.assertNotIn('text', har_response['content'])
+        self.assertEqual(0, har_response['content']['size'])
+        self.assertEqual('text/event-stream',
+                         har_response['content']['mimeType'])
+        self.assertEqual(-1, har_response['bodySize'])
@@ -0,0 +1,148 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import datetime
+
+import mock
+import requests
+
+from sushy import auth as sushy_auth
+from sushy import main
+from sushy import session_gc
+from sushy import session_store
+from sushy.tests import emulator
+from sushy.tests.unit import base
+
+_OLD = '2020-01-01T00:00:00+00:00'
+
+
+class SessionGcTestCase(base.TestCase):
+
+    def setUp(self):
+        super(SessionGcTestCase, self).setUp()
+        self.emu = emulator.Emulator()
+        self.emu.add_bmcs(2)
+        self.emu.start()
+        self.addCleanup(self.emu.stop)
+
+    def _leak_sessions(self, name, count, created_time=_OLD):
+        bmc = self.emu.bmcs[name]
+        paths = []
+        for _ in range(count):
+            rsp = requests.post(
+                self.emu.url(name) + emulator.SESSIONS_PATH,
+                json={'UserName': 'admin', 'Password': 'password'})
+            path = rsp.headers['Location']
+            if created_time is None:
+                del bmc._session_docs[path]['CreatedTime']
+            else:
+                bmc._session_docs[path]['CreatedTime'] = created_time
+            paths.append(path)
+        return paths
+
+    def _connect(self, name):
+        return main.Sushy(self.emu.url(name),
+                          auth=sushy_auth.SessionAuth('admin', 'password'))
+
+    def test_collect(self):
+        leaked = self._leak_sessions('bmc-0', 5)
+        recent = self._leak_sessions('bmc-0', 1, created_time=None)
+        root = self._connect('bmc-0')
+        bmc = self.emu.bmcs['bmc-0']
+        self.assertEqual(7, len(bmc.sessions))
+
+        result = session_gc.collect(root, username='admin', min_age=3600,
+                                    batch_size=2)
+        self.assertEqual(sorted(leaked), sorted(result.deleted))
+        self.assertEqual([], result.failed)
+        # NOTE: the own session and the one of unknown age are kept
+        self.assertEqual(sorted(recent + [root._auth._session_resource_id]),
+                         sorted(bmc.sessions))
+
+    def test_collect_keep_and_username(self):
+        leaked = self._leak_sessions('bmc-0', 3)
+        root = self._connect('bmc-0')
+
+        result = session_gc.collect(root, username='other', min_age=60)
+        self.assertEqual([], result.deleted)
+        result = session_gc.collect(root, min_age=60, keep=leaked[:1])
+        self.assertEqual(sorted(leaked[1:]), sorted(result.deleted))
+
+    def test_collect_own_user_by_default(self):
+        leaked = self._leak_sessions('bmc-0', 2)
+        root = self._connect('bmc-0')
+        with mock.patch.object(root._auth, '_username', 'other'):
+            result = session_gc.collect(root, min_age=60)
+        self.assertEqual([], result.deleted)
+        result = session_gc.collect(root, min_age=60)
+        self.assertEqual(sorted(leaked), sorted(result.deleted))
+
+    def test_collect_without_min_age(self):
+        self._leak_sessions('bmc-0', 2)
+        root = self._connect('bmc-0')
+        self.assertRaises(ValueError, session_gc.collect, root)
+        self.assertRaises(ValueError, session_gc.collect, root,
+                          username='admin')
+        self.assertEqual(3, len(self.emu.bmcs['bmc-0'].sessions))
+
+    def test_collect_keeps_fresh_sessions_of_same_user(self):
+        leaked = self._leak_sessions('bmc-0', 2)
+        # NOTE: e.g. a live session of another worker sharing the user
+        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        fresh = self._leak_sessions('bmc-0', 1, created_time=now)
+        root = self._connect('bmc-0')
+
+        result = session_gc.collect(root, min_age=3600)
+        self.assertEqual(sorted(leaked), sorted(result.deleted))
+        self.assertIn(fresh[0], self.emu.bmcs['bmc-0'].sessions)
+
+    def test_collect_keep_stored(self):
+        leaked = self._leak_sessions('bmc-0', 3)
+        store = session_store.MemorySessionStore()
+        store.set(session_store.make_key(self.emu.url('bmc-0'), 'admin'),
+                  'token', self.emu.url('bmc-0') + leaked[0])
+        root = self._connect('bmc-0')
+
+        result = session_gc.collect(root, min_age=60,
+                                    session_store=store)
+        self.assertEqual(sorted(leaked[1:]), sorted(result.deleted))
+
+    def test_collect_keep_stored_by_auth(self):
+        leaked = self._leak_sessions('bmc-0', 2)
+        store = session_store.MemorySessionStore()
+        root = main.Sushy(self.emu.url('bmc-0'),
+                          auth=sushy_auth.SessionAuth(
+                              'admin', 'password', session_store=store))
+        # NOTE: e.g. the session of another process sharing the store
+        store.set(session_store.make_key(self.emu.url('bmc-0'), 'admin'),
+                  'token', leaked[0])
+
+        result = session_gc.collect(root, min_age=60)
+        self.assertEqual(leaked[1:], result.deleted)
+        self.assertEqual(2, len(self.emu.bmcs['bmc-0'].sessions))
+
+    def test_collect_dry_run(self):
+        leaked = self._leak_sessions('bmc-0', 2)
+        root = self._connect('bmc-0')
+        result = session_gc.collect(root, min_age=60, dry_run=True)
+        self.assertEqual(sorted(leaked), sorted(result.deleted))
+        self.assertEqual(3, len(self.emu.bmcs['bmc-0'].sessions))
+
+    def test_collect_fleet(self):
+        leaked = {name: self._leak_sessions(name, 2) for name in self.emu.bmcs}
+        roots = [self._connect(name) for name in self.emu.bmcs]
+        results = session_gc.collect_fleet(roots, username='admin',
+                                           min_age=60)
+        for name in self.emu.bmcs:
+            result = results[self.emu.url(name)]
+            self.assertEqual(sorted(leaked[name]), sorted(result.deleted))
+            self.assertEqual(1, len(self.emu.bmcs[name].sessions))
@@ -0,0 +1,130 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import json
+import os
+import stat
+import tempfile
+
+from sushy import session_store
+from sushy.tests.unit import base
+
+
+class _StoreTests(object):
+
+    def test_make_key(self):
+        self.assertEqual('https://bmc:8000|admin',
+                         session_store.make_key('https://bmc:8000/',
+                                                'admin'))
+
+    def test_get_missing(self):
+        self.assertIsNone(self.store.get('key'))
+
+    def test_set_get(self):
+        self.store.set('key', 'token', '/Sessions/1')
+        entry = self.store.get('key')
+        self.assertEqual('token', entry['token'])
+        self.assertEqual('/Sessions/1', entry['uri'])
+        self.assertIsNone(entry['timeout'])
+        self.assertIn('created', entry)
+
+    def test_set_timeout(self):
+        self.store.set('key', 'token', '/Sessions/1', timeout=30)
+        self.assertEqual(30, self.store.get('key')['timeout'])
+
+    def test_delete(self):
+        self.store.set('key', 'token', '/Sessions/1')
+        self.store.delete('key')
+        self.assertIsNone(self.store.get('key'))
+        # NOTE: deleting a missing key is not an error
+        self.store.delete('key')
+
+    def test_delete_other_token(self):
+        self.store.set('key', 'token', '/Sessions/1')
+        self.store.delete('key', token='old-token')
+        self.assertEqual('token', self.store.get('key')['token'])
+        self.store.delete('key', token='token')
+        self.assertIsNone(self.store.get('key'))
+
+
+class MemorySessionStoreTestCase(_StoreTests, base.TestCase):
+
+    def setUp(self):
+        super(MemorySessionStoreTestCase, self).setUp()
+        self.store = session_store.MemorySessionStore()
+
+
+class FileSessionStoreTestCase(_StoreTests, base.TestCase):
+
+    def setUp(self):
+        super(FileSessionStoreTestCase, self).setUp()
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.filename = os.path.join(tmpdir.name, 'sessions.json')
+        self.store = session_store.FileSessionStore(self.filename)
+
+    def test_shared(self):
+        self.store.set('key', 'token', '/Sessions/1')
+        other = session_store.FileSessionStore(self.filename)
+        self.assertEqual('token', other.get('key')['token'])
+
+    def test_file_mode(self):
+        self.store.set('key', 'token', '/Sessions/1')
+        mode = stat.S_IMODE(os.stat(self.filename).st_mode)
+        self.assertEqual(0o600, mode)
+
+    def test_corrupted(self):
+        with open(self.filename, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(self.store.get('key'))
+        self.store.set('key', 'token', '/Sessions/1')
+        self.assertEqual('token', self.store.get('key')['token'])
+
+    def test_unsupported_version(self):
+        with open(self.filename, 'w') as f:
+            json.dump({'version': 42, 'sessions': {'key': {}}}, f)
+        self.assertIsNone(self.store.get('key'))
+
+
+class AuthMethodMemoTestCase(base.TestCase):
+
+    def test_memory(self):
+        memo = session_store.AuthMethodMemo()
+        self.assertIsNone(memo.get('https://bmc'))
+        memo.set('https://bmc/', session_store.AUTH_METHOD_BASIC)
+        self.assertEqual(session_store.AUTH_METHOD_BASIC,
+                         memo.get('https://bmc'))
+        self.assertIsNone(memo.get('https://other-bmc'))
+
+    def test_expired(self):
+        memo = session_store.AuthMethodMemo(ttl=-1)
+        memo.set('https://bmc', session_store.AUTH_METHOD_BASIC)
+        self.assertIsNone(memo.get('https://bmc'))
+
+    def test_file(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        filename = os.path.join(tmpdir.name, 'methods.json')
+
+        memo = session_store.AuthMethodMemo(filename)
+        memo.set('https://bmc', session_store.AUTH_METHOD_BASIC)
+        other = session_store.AuthMethodMemo(filename)
+        self.assertEqual(session_store.AUTH_METHOD_BASIC,
+                         other.get('https://bmc'))
+
+        # NOTE: expired entries are dropped on updates
+        expired = session_store.AuthMethodMemo(filename, ttl=-1)
+        expired.set('https://other-bmc', session_store.AUTH_METHOD_SESSION)
+        memo.set('https://bmc2', session_store.AUTH_METHOD_SESSION)
+        with open(filename) as f:
+            methods = json.load(f)['methods']
+        self.assertEqual(['https://bmc', 'https://bmc2'], sorted(methods))
@@ -0,0 +1,130 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import gc
+import json
+import threading
+
+import mock
+import requests
+
+from sushy import connector
+from sushy.resources.system import system
+from sushy.tests.unit import base
+from sushy import tracing
+
+
+class TracingTestCase(base.TestCase):
+
+    def setUp(self):
+        super(TracingTestCase, self).setUp()
+        # NOTE: resources of other tests closing their sessions when
+        # garbage collected would otherwise show up in the traces
+        gc.collect()
+        self.tracer = tracing.RecordingTracer()
+        tracing.set_tracer(self.tracer)
+        self.addCleanup(tracing.set_tracer, None)
+
+    def test_no_tracer(self):
+        tracing.set_tracer(None)
+        self.assertIsNone(tracing.get_tracer())
+        with tracing.start_span('noop') as span:
+            self.assertIsNone(span)
+
+    def test_nesting(self):
+        with tracing.start_span('outer', {'a': 1}) as outer:
+            with tracing.start_span('inner') as inner:
+                inner.set_attribute('b', 2)
+        with tracing.start_span('second'):
+            pass
+
+        self.assertEqual(['outer', 'second'],
+                         [span.name for span in self.tracer.roots])
+        self.assertEqual([inner], outer.children)
+        self.assertIs(outer, inner.parent)
+        self.assertEqual({'a': 1}, outer.attributes)
+        self.assertEqual({'b': 2}, inner.attributes)
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+    def test_error(self):
+        def fail():
+            with tracing.start_span('failing'):
+                raise ValueError('boom')
+
+        self.assertRaises(ValueError, fail)
+        self.assertEqual({'error': 'ValueError'},
+                         self.tracer.roots[0].attributes)
+
+    def test_threads(self):
+        def worker():
+            with tracing.start_span('thread'):
+                pass
+
+        with tracing.start_span('main'):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+
+        self.assertEqual(['main', 'thread'],
+                         sorted(span.name for span in self.tracer.roots))
+
+    def test_to_list(self):
+        with tracing.start_span('outer'):
+            with tracing.start_span('inner'):
+                pass
+
+        spans = self.tracer.to_list()
+        self.assertEqual(1, len(spans))
+        self.assertIsNone(spans[0]['parent_id'])
+        inner = spans[0]['children'][0]
+        self.assertEqual('inner', inner['name'])
+        self.assertEqual(spans[0]['span_id'], inner['parent_id'])
+        json.dumps(spans)
+
+    def test_resource_refresh(self):
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/system.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        sys_inst = system.System(conn, '/redfish/v1/Systems/437XR1138R2',
+                                 redfish_version='1.0.2')
+        with open('sushy/tests/unit/json_samples/'
+                  'processor_collection.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        sys_inst.processors
+
+        refresh, fill = self.tracer.roots
+        self.assertEqual('sushy.refresh', refresh.name)
+        self.assertEqual({'sushy.resource': 'System',
+                          'sushy.path': '/redfish/v1/Systems/437XR1138R2'},
+                         refresh.attributes)
+        self.assertEqual(['sushy.parse'],
+                         [span.name for span in refresh.children])
+        self.assertEqual('sushy.cache_fill', fill.name)
+        self.assertEqual('processors', fill.attributes['sushy.attribute'])
+        self.assertEqual(['sushy.refresh'],
+                         [span.name for span in fill.children])
+        self.assertEqual('ProcessorCollection',
+                         fill.children[0].attributes['sushy.resource'])
+
+    def test_http_request(self):
+        conn = connector.Connector('http://foo.bar:1234')
+        conn._session = mock.Mock(spec=requests.Session)
+        conn._session.request.return_value.status_code = 200
+        conn._session.request.return_value.headers = {}
+        conn._session.request.return_value.content = b''
+        conn.get(path='/redfish/v1')
+
+        span = self.tracer.roots[0]
+        self.assertEqual('HTTP GET', span.name)
+        self.assertEqual({'http.method': 'GET',
+                          'http.url': 'http://foo.bar:1234/redfish/v1',
+                          'http.status_code': 200}, span.attributes)
@@ -0,0 +1,238 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import threading
+
+import mock
+
+import sushy
+from sushy import exceptions
+from sushy import main
+from sushy.resources.system import system
+from sushy.tests import emulator
+from sushy.tests.unit import base
+from sushy import waiter
+
+PATH = '/redfish/v1/Systems/437XR1138R2'
+
+
+@mock.patch.object(system, 'probe_power_state', autospec=True)
+class WaitSchedulerTestCase(base.TestCase):
+
+    def setUp(self):
+        super(WaitSchedulerTestCase, self).setUp()
+        self.conn = mock.Mock()
+        self.scheduler = waiter.WaitScheduler(
+            initial_interval=0.01, max_interval=0.05, jitter=0)
+        self.addCleanup(self.scheduler.shutdown)
+
+    def test_submit(self, mock_probe):
+        mock_probe.side_effect = [sushy.SYSTEM_POWER_STATE_OFF,
+                                  sushy.SYSTEM_POWER_STATE_POWERING_ON,
+                                  sushy.SYSTEM_POWER_STATE_ON]
+        future = self.scheduler.submit(self.conn, PATH + '/',
+                                       sushy.SYSTEM_POWER_STATE_ON)
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON, future.result(5))
+        mock_probe.assert_called_with(self.conn, PATH, select=False)
+        self.assertEqual(3, mock_probe.call_count)
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_submit_several_states(self, mock_probe):
+        mock_probe.return_value = sushy.SYSTEM_POWER_STATE_POWERING_OFF
+        future = self.scheduler.submit(
+            self.conn, PATH, [sushy.SYSTEM_POWER_STATE_OFF,
+                              sushy.SYSTEM_POWER_STATE_POWERING_OFF])
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_POWERING_OFF,
+                         future.result(5))
+
+    def test_submit_timeout(self, mock_probe):
+        mock_probe.return_value = sushy.SYSTEM_POWER_STATE_OFF
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON,
+                                       timeout=0.1)
+        self.assertRaisesRegex(exceptions.PowerStateTimeoutError,
+                               'last seen off', future.result, 5)
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_submit_errors_retried(self, mock_probe):
+        mock_probe.side_effect = [
+            exceptions.ConnectionError(url=PATH, error='resetting'),
+            sushy.SYSTEM_POWER_STATE_ON]
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON)
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON, future.result(5))
+
+    def test_submit_unexpected_errors_retried(self, mock_probe):
+        mock_probe.side_effect = [ValueError('invalid JSON'),
+                                  sushy.SYSTEM_POWER_STATE_ON]
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON)
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON, future.result(5))
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_submit_unexpected_errors_timeout(self, mock_probe):
+        mock_probe.side_effect = ValueError('invalid JSON')
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON,
+                                       timeout=0.1)
+        self.assertRaisesRegex(exceptions.PowerStateTimeoutError,
+                               'invalid JSON', future.result, 5)
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_submit_probe_hangs(self, mock_probe):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        mock_probe.side_effect = lambda *args, **kwargs: release.wait(5)
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON,
+                                       timeout=0.1)
+        self.assertRaises(exceptions.PowerStateTimeoutError,
+                          future.result, 2)
+        self.assertEqual(0, len(self.scheduler))
+
+    def test_notify(self, mock_probe):
+        scheduler = waiter.WaitScheduler(initial_interval=60, jitter=0)
+        self.addCleanup(scheduler.shutdown)
+        probed = threading.Event()
+
+        def probe(*args, **kwargs):
+            if probed.is_set():
+                return sushy.SYSTEM_POWER_STATE_ON
+            probed.set()
+            return sushy.SYSTEM_POWER_STATE_OFF
+
+        mock_probe.side_effect = probe
+        future = scheduler.submit(self.conn, PATH,
+                                  sushy.SYSTEM_POWER_STATE_ON)
+        self.assertTrue(probed.wait(5))
+        # NOTE: other BMCs' events do not wake the wait up
+        scheduler.notify(PATH, connector=mock.Mock())
+        self.assertRaises(futures.TimeoutError, future.result, 0.1)
+
+        scheduler.notify(PATH + '/', connector=self.conn)
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON, future.result(5))
+
+    def test_follow_events(self, mock_probe):
+        scheduler = waiter.WaitScheduler(initial_interval=60, jitter=0)
+        self.addCleanup(scheduler.shutdown)
+        probed = threading.Event()
+
+        def probe(*args, **kwargs):
+            if probed.is_set():
+                return sushy.SYSTEM_POWER_STATE_ON
+            probed.set()
+            return sushy.SYSTEM_POWER_STATE_OFF
+
+        mock_probe.side_effect = probe
+        future = scheduler.submit(self.conn, PATH,
+                                  sushy.SYSTEM_POWER_STATE_ON)
+
+        def records():
+            # NOTE: let the first probe through before the event
+            probed.wait(5)
+            yield mock.Mock(origin_of_condition=PATH)
+
+        stream = mock.MagicMock(_conn=self.conn)
+        stream.__iter__.side_effect = records
+        scheduler.follow_events(stream)
+
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON, future.result(5))
+
+    def test_shutdown(self, mock_probe):
+        mock_probe.return_value = sushy.SYSTEM_POWER_STATE_OFF
+        stream = mock.MagicMock()
+        stream.__iter__.return_value = iter(())
+        self.scheduler.follow_events(stream)
+        future = self.scheduler.submit(self.conn, PATH,
+                                       sushy.SYSTEM_POWER_STATE_ON)
+
+        self.scheduler.shutdown()
+
+        self.assertTrue(future.cancelled())
+        stream.close.assert_called_once_with()
+        self.assertRaises(RuntimeError, self.scheduler.submit, self.conn,
+                          PATH, sushy.SYSTEM_POWER_STATE_ON)
+
+    def test_backoff(self, mock_probe):
+        scheduler = waiter.WaitScheduler(initial_interval=1, max_interval=4,
+                                         backoff_factor=2, jitter=0)
+        wait = mock.Mock(interval=1, state=sushy.SYSTEM_POWER_STATE_OFF)
+        intervals = [scheduler._next_interval(wait,
+                                              sushy.SYSTEM_POWER_STATE_OFF)
+                     for _ in range(4)]
+        self.assertEqual([2, 4, 4, 4], intervals)
+
+        self.assertEqual(1, scheduler._next_interval(
+            wait, sushy.SYSTEM_POWER_STATE_ON))
+        wait.state = sushy.SYSTEM_POWER_STATE_POWERING_ON
+        self.assertEqual(1, scheduler._next_interval(
+            wait, sushy.SYSTEM_POWER_STATE_POWERING_ON))
+
+
+class WaitForPowerStateTestCase(base.TestCase):
+
+    def test_wait_for_power_state(self):
+        resource = mock.Mock(path=PATH)
+        scheduler = mock.Mock()
+        scheduler.submit.return_value.result.return_value = (
+            sushy.SYSTEM_POWER_STATE_ON)
+
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_ON,
+                         waiter.wait_for_power_state(
+                             resource, sushy.SYSTEM_POWER_STATE_ON,
+                             timeout=10, scheduler=scheduler))
+
+        scheduler.submit.assert_called_once_with(
+            resource._conn, PATH, sushy.SYSTEM_POWER_STATE_ON, timeout=10)
+        resource.invalidate.assert_called_once_with()
+
+    def test_wait_for_power_state_no_result(self):
+        resource = mock.Mock(path=PATH)
+        scheduler = mock.Mock()
+        future = scheduler.submit.return_value
+        future.result.side_effect = futures.TimeoutError()
+
+        self.assertRaises(exceptions.PowerStateTimeoutError,
+                          waiter.wait_for_power_state, resource,
+                          sushy.SYSTEM_POWER_STATE_ON, timeout=10,
+                          scheduler=scheduler)
+
+        future.result.assert_called_once_with(10 + waiter._RESULT_GRACE)
+        future.cancel.assert_called_once_with()
+        resource.invalidate.assert_called_once_with()
+
+    def test_default_scheduler(self):
+        self.assertIs(waiter.get_default_scheduler(),
+                      waiter.get_default_scheduler())
+
+    def test_emulator(self):
+        emu = emulator.Emulator()
+        emu.add_bmc('bmc')
+        emu.start()
+        self.addCleanup(emu.stop)
+        scheduler = waiter.WaitScheduler(initial_interval=0.01, select=True)
+        self.addCleanup(scheduler.shutdown)
+
+        root = main.Sushy(emu.url('bmc'), username='admin',
+                          password='password')
+        self.addCleanup(root._auth.close)
+        sys_inst = root.get_system(PATH)
+        sys_inst.reset_system(sushy.RESET_FORCE_OFF)
+
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_OFF,
+                         waiter.wait_for_power_state(
+                             sys_inst, sushy.SYSTEM_POWER_STATE_OFF,
+                             timeout=5, scheduler=scheduler))
+        sys_inst.refresh(force=False)
+        self.assertEqual(sushy.SYSTEM_POWER_STATE_OFF,
+                         sys_inst.power_state)
@@ -0,0 +1,169 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Optional tracing of the resource refreshes and HTTP requests
+
+Sushy opens spans around ``ResourceBase.refresh``, the parsing of the
+resource attributes, the ``cache_it`` fills and every HTTP request once a
+tracer is set with :py:func:`set_tracer`. A tracer is any object with an
+OpenTelemetry-like ``start_as_current_span(name, attributes=None)``
+method returning a context manager, which yields a span with a
+``set_attribute(key, value)`` method. An OpenTelemetry tracer can be used
+as is:
+
+.. code-block:: python
+
+  from opentelemetry import trace
+
+  tracing.set_tracer(trace.get_tracer('sushy'))
+
+:py:class:`RecordingTracer` keeps the spans in memory instead. No tracing
+is done by default.
+"""
+
+import itertools
+import threading
+import time
+
+_tracer = None
+
+
+class _NullSpan(object):
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *_args):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def set_tracer(tracer):
+    """Set the process-wide tracer
+
+    :param tracer: An OpenTelemetry-like tracer, or None to stop tracing.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def get_tracer():
+    """Get the process-wide tracer, None if not tracing"""
+    return _tracer
+
+
+def start_span(name, attributes=None):
+    """Open a span as a child of the current one
+
+    :param name: The name of the span.
+    :param attributes: Optional dict of attributes of the span.
+    :returns: A context manager yielding the span, or None when not
+        tracing.
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NULL_SPAN
+    return tracer.start_as_current_span(name, attributes=attributes)
+
+
+class Span(object):
+    """A span recorded by :py:class:`RecordingTracer`"""
+
+    def __init__(self, tracer, span_id, name, attributes, parent):
+        self._tracer = tracer
+        self.span_id = span_id
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.parent = parent
+        self.children = []
+        self.start_time = None
+        self.end_time = None
+
+    @property
+    def duration(self):
+        """Duration of the span in seconds, None until it ends"""
+        if self.end_time is None:
+            return None
+        return self.end_time - self.start_time
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def to_dict(self):
+        """Return the span and its children as a JSON serializable dict"""
+        return {
+            'name': self.name,
+            'span_id': self.span_id,
+            'parent_id': self.parent.span_id if self.parent else None,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'attributes': self.attributes,
+            'children': [child.to_dict() for child in self.children],
+        }
+
+    def __enter__(self):
+        self._tracer._push(self)
+        self.start_time = time.time()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.end_time = time.time()
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self._tracer._pop(self)
+        return False
+
+
+class RecordingTracer(object):
+    """Tracer keeping the spans in memory
+
+    Spans opened in a thread are nested under the span open in that same
+    thread, the spans opened without parent being the roots.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self.roots = []
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _push(self, span):
+        self._stack().append(span)
+
+    def _pop(self, span):
+        stack = self._stack()
+        if stack and stack[-1] is span:
+            stack.pop()
+
+    def start_as_current_span(self, name, attributes=None):
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        with self._lock:
+            span = Span(self, next(self._ids), name, attributes, parent)
+            if parent is None:
+                self.roots.append(span)
+            else:
+                parent.children.append(span)
+        return span
+
+    def to_list(self):
+        """Return the recorded span trees as a JSON serializable list"""
+        with self._lock:
+            return [root.to_dict() for root in self.roots]
@@ -20,6 +20,7 @@ import logging
 import threading
 
 from sushy import exceptions
+from sushy import tracing
 
 LOG = logging.getLogger(__name__)
 
@@ -218,7 +219,11 @@ def cache_it(res_accessor_method):
         cache_attr_val = getattr(res_selfie, cache_attr_name, None)
         if cache_attr_val is None:
 
-            cache_attr_val = res_accessor_method(res_selfie)
+            with tracing.start_span(
+                    'sushy.cache_fill',
+                    {'sushy.resource': res_selfie.__class__.__name__,
+                     'sushy.attribute': res_accessor_method.__name__}):
+                cache_attr_val = res_accessor_method(res_selfie)
             setattr(res_selfie, cache_attr_name, cache_attr_val)
 
             # Note(deray): Each resource instance maintains a collection of
@@ -0,0 +1,396 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Waiting for systems and chassis to reach a power state
+
+After a reset, the power state of a system changes within seconds to
+minutes. A `WaitScheduler` polls the power state of any number of
+resources on a few threads, backing off while nothing happens and
+polling again quickly once a transition shows up. Waits can also be
+woken up by the events of the BMC. Usage:
+
+.. code-block:: python
+
+  system.reset_system(sushy.RESET_ON)
+  waiter.wait_for_power_state(system, sushy.SYSTEM_POWER_STATE_ON,
+                              timeout=300)
+
+or, for many nodes at once:
+
+.. code-block:: python
+
+  scheduler = waiter.get_default_scheduler()
+  futures = [scheduler.submit(conn, path, sushy.SYSTEM_POWER_STATE_OFF)
+             for conn, path in targets]
+"""
+
+from concurrent import futures
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from sushy import exceptions
+from sushy.resources import constants as res_cons
+from sushy.resources.system import system as sys_system
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT = 300
+"""Default time in seconds to wait for a power state"""
+
+DEFAULT_MAX_WORKERS = 4
+"""Default number of concurrent power state probes of a scheduler"""
+
+DEFAULT_INITIAL_INTERVAL = 1
+"""Default seconds between the first probes of a wait"""
+
+DEFAULT_MAX_INTERVAL = 30
+"""Default maximum seconds between the probes of a wait"""
+
+DEFAULT_BACKOFF_FACTOR = 1.5
+"""Default growth of the interval between probes not seeing any change"""
+
+DEFAULT_JITTER = 0.1
+"""Default fraction the intervals are randomized by, spreading the probes"""
+
+TRANSITIONAL_POWER_STATES = frozenset([res_cons.POWER_STATE_POWERING_ON,
+                                       res_cons.POWER_STATE_POWERING_OFF])
+"""Power states announcing an imminent change"""
+
+# Extra seconds to wait for the result of a wait past its timeout, the
+# last probe of the scheduler may be sent at the timeout
+_RESULT_GRACE = 2 * DEFAULT_MAX_INTERVAL
+
+
+class _Wait(object):
+
+    def __init__(self, connector, path, states, timeout, interval):
+        self.connector = connector
+        self.path = path
+        self.states = states
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout
+        self.interval = interval
+        self.future = futures.Future()
+        self.state = None
+        self.generation = 0
+        self.in_flight = False
+        self.notified = False
+
+
+class WaitScheduler(object):
+    """Scheduler multiplexing power state waits onto a few threads
+
+    A single thread keeps the waits ordered by due time and hands the
+    probes over to a small pool of workers, so thousands of waits only
+    cost a few threads. The interval between the probes of a wait grows
+    while its power state does not change, and drops back to the initial
+    one when it changes or is transitional. Errors, e.g. the BMC being
+    unreachable while resetting, are retried until the deadline.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS,
+                 initial_interval=DEFAULT_INITIAL_INTERVAL,
+                 max_interval=DEFAULT_MAX_INTERVAL,
+                 backoff_factor=DEFAULT_BACKOFF_FACTOR,
+                 jitter=DEFAULT_JITTER, select=False):
+        """A class representing a power state wait scheduler
+
+        :param max_workers: The maximum number of concurrent probes.
+        :param initial_interval: Seconds between the first probes.
+        :param max_interval: Maximum seconds between probes.
+        :param backoff_factor: Growth of the interval between probes not
+            seeing any change.
+        :param jitter: Fraction the intervals are randomized by.
+        :param select: Whether to probe with the `$select` query, see
+            `sushy.resources.system.system.probe_power_state`.
+        """
+        self._max_workers = max_workers
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._backoff_factor = backoff_factor
+        self._jitter = jitter
+        self._select = select
+        self._queue = []
+        self._counter = itertools.count()
+        self._waits = {}
+        self._cond = threading.Condition()
+        self._thread = None
+        self._executor = None
+        self._streams = []
+        self._stopped = False
+
+    def submit(self, connector, path, states, timeout=DEFAULT_TIMEOUT):
+        """Start waiting for a resource to reach a power state
+
+        :param connector: A Connector instance
+        :param path: The path to the System or Chassis resource
+        :param states: The power state to wait for, one of
+            `POWER_STATE_*` constants, or a collection of them.
+        :param timeout: Seconds to wait for at most.
+        :returns: A `concurrent.futures.Future` resolving to the power
+            state reached, or failing with `PowerStateTimeoutError`
+        """
+        if isinstance(states, str):
+            states = [states]
+        wait = _Wait(connector, path.rstrip('/'), frozenset(states),
+                     timeout, self._initial_interval)
+        with self._cond:
+            if self._stopped:
+                raise RuntimeError('The wait scheduler is shut down')
+            self._start()
+            self._waits.setdefault(wait.path, set()).add(wait)
+            self._schedule(wait, time.monotonic())
+        return wait.future
+
+    def notify(self, path, connector=None):
+        """Probe the waits on a resource right away
+
+        Meant to be called upon the events of the BMC, e.g. a
+        ``ResourcePowerStateChanged`` event.
+
+        :param path: The path to the resource.
+        :param connector: Only wake the waits through this connector up,
+            None for the waits of any BMC.
+        """
+        if not path:
+            return
+        now = time.monotonic()
+        with self._cond:
+            for wait in list(self._waits.get(path.rstrip('/'), ())):
+                if connector is not None and wait.connector is not connector:
+                    continue
+                wait.interval = self._initial_interval
+                if wait.in_flight:
+                    # NOTE: the ongoing probe may predate the event
+                    wait.notified = True
+                else:
+                    self._schedule(wait, now)
+
+    def follow_events(self, stream):
+        """Wake the waits up upon the events of a BMC
+
+        The events are read in a background thread, until the stream is
+        closed or the scheduler shut down. Polling goes on meanwhile, in
+        case events are missed.
+
+        :param stream: An `EventStream` of the BMC of the waits, e.g.
+            filtered on ``ResourceEvent`` messages.
+        """
+        def follow():
+            try:
+                for record in stream:
+                    self.notify(record.origin_of_condition,
+                                connector=stream._conn)
+            except exceptions.SushyError as exc:
+                LOG.warning('Stopped following the event stream '
+                            '%(path)s: %(error)s',
+                            {'path': stream.path, 'error': exc})
+
+        with self._cond:
+            self._streams.append(stream)
+        thread = threading.Thread(target=follow,
+                                  name='sushy-wait-scheduler-events')
+        thread.daemon = True
+        thread.start()
+
+    def shutdown(self, wait=True):
+        """Stop the scheduler, cancelling the pending waits
+
+        :param wait: Whether to wait for the ongoing probes to finish.
+        """
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+            thread, self._thread = self._thread, None
+            executor, self._executor = self._executor, None
+            streams, self._streams = self._streams, []
+            waits = [w for ws in self._waits.values() for w in ws]
+            self._waits = {}
+            self._queue = []
+
+        for stream in streams:
+            stream.close()
+        if thread is not None and wait:
+            thread.join()
+        if executor is not None:
+            executor.shutdown(wait=wait)
+        for pending in waits:
+            pending.future.cancel()
+
+    def __len__(self):
+        with self._cond:
+            return sum(len(ws) for ws in self._waits.values())
+
+    def _start(self):
+        if self._thread is None:
+            self._executor = futures.ThreadPoolExecutor(
+                max_workers=self._max_workers)
+            self._thread = threading.Thread(target=self._run,
+                                            name='sushy-wait-scheduler')
+            self._thread.daemon = True
+            self._thread.start()
+
+    def _schedule(self, wait, due):
+        wait.generation += 1
+        heapq.heappush(self._queue, (min(due, wait.deadline),
+                                     next(self._counter), wait,
+                                     wait.generation))
+        self._cond.notify()
+
+    def _run(self):
+        with self._cond:
+            while not self._stopped:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+                due, _seq, wait, generation = self._queue[0]
+                now = time.monotonic()
+                if due > now:
+                    self._cond.wait(due - now)
+                    continue
+                heapq.heappop(self._queue)
+                if generation != wait.generation:
+                    continue
+                if wait.future.done():
+                    self._forget(wait)
+                    continue
+                if wait.in_flight:
+                    # NOTE: the probe outlived the deadline, e.g. a BMC
+                    # not answering, do not let it hold the wait
+                    self._expire(wait, wait.state)
+                    continue
+                wait.in_flight = True
+                # NOTE: enforce the deadline even if the probe hangs,
+                # leaving a probe sent at the deadline time to finish
+                heapq.heappush(self._queue,
+                               (max(wait.deadline, now + self._max_interval),
+                                next(self._counter), wait, wait.generation))
+                self._executor.submit(self._probe, wait)
+
+    def _forget(self, wait):
+        waits = self._waits.get(wait.path)
+        if waits is not None:
+            waits.discard(wait)
+            if not waits:
+                del self._waits[wait.path]
+
+    def _next_interval(self, wait, state):
+        if state != wait.state or state in TRANSITIONAL_POWER_STATES:
+            interval = self._initial_interval
+        else:
+            interval = min(wait.interval * self._backoff_factor,
+                           self._max_interval)
+        wait.interval = interval
+        return interval * random.uniform(1 - self._jitter, 1 + self._jitter)
+
+    def _expire(self, wait, state):
+        self._forget(wait)
+        wait.future.set_exception(
+            exceptions.PowerStateTimeoutError(
+                timeout=wait.timeout, path=wait.path,
+                states=', '.join(sorted(wait.states)), state=state))
+
+    def _probe(self, wait):
+        state = error = None
+        try:
+            state = sys_system.probe_power_state(wait.connector, wait.path,
+                                                 select=self._select)
+        except exceptions.SushyError as exc:
+            LOG.debug('Failed to probe the power state of %(path)s, '
+                      'retrying: %(error)s', {'path': wait.path,
+                                              'error': exc})
+            error = exc
+        except Exception as exc:
+            # NOTE: e.g. a BMC returning an invalid JSON body while
+            # resetting, retried like the other errors
+            LOG.warning('Unexpected error probing the power state of '
+                        '%(path)s, retrying: %(error)s',
+                        {'path': wait.path, 'error': exc})
+            error = exc
+        finally:
+            self._probed(wait, state, error)
+
+    def _probed(self, wait, state, error):
+        now = time.monotonic()
+        with self._cond:
+            wait.in_flight = False
+            if self._stopped:
+                return
+            if wait.future.done():
+                self._forget(wait)
+                return
+            if error is None and state in wait.states:
+                self._forget(wait)
+                wait.future.set_result(state)
+                return
+            if now >= wait.deadline:
+                self._expire(wait, state if error is None else error)
+                return
+            if error is not None:
+                state = wait.state
+            interval = self._next_interval(wait, state)
+            wait.state = state
+            if wait.notified:
+                wait.notified = False
+                interval = 0
+            self._schedule(wait, now + interval)
+
+
+_default_scheduler = None
+_default_scheduler_lock = threading.Lock()
+
+
+def get_default_scheduler():
+    """Get the process-wide wait scheduler"""
+    global _default_scheduler
+    with _default_scheduler_lock:
+        if _default_scheduler is None:
+            _default_scheduler = WaitScheduler()
+        return _default_scheduler
+
+
+def wait_for_power_state(resource, states, timeout=DEFAULT_TIMEOUT,
+                         scheduler=None):
+    """Wait for a system or chassis to reach a power state
+
+    The resource is invalidated once the wait is over, so that its next
+    `refresh` fetches it again.
+
+    :param resource: A `System` or `Chassis` instance.
+    :param states: The power state to wait for, one of `POWER_STATE_*`
+        constants, or a collection of them.
+    :param timeout: Seconds to wait for at most.
+    :param scheduler: The `WaitScheduler` to wait with, the process-wide
+        one by default.
+    :returns: The power state reached
+    :raises: PowerStateTimeoutError
+    """
+    if scheduler is None:
+        scheduler = get_default_scheduler()
+    future = scheduler.submit(resource._conn, resource.path, states,
+                              timeout=timeout)
+    try:
+        # NOTE: the scheduler enforces the timeout, this is a safeguard
+        return future.result(timeout + _RESULT_GRACE)
+    except futures.TimeoutError:
+        future.cancel()
+        if isinstance(states, str):
+            states = [states]
+        raise exceptions.PowerStateTimeoutError(
+            timeout=timeout, path=resource.path,
+            states=', '.join(sorted(states)), state=None)
+    finally:
+        resource.invalidate()